@@ -0,0 +1,267 @@
+import logging
+from collections import deque
+from time import perf_counter
+
+from ..Universal_computing.Pattern_Singleton import SingletonPattern
+from .Settings_Keeper import SettingsKeeper
+from ..Render.Texture_Master import TexturesMaster
+"""
+Contains code for FrameProfiler and InputLatencyMeter.
+Measure wall time of main render loop stages and input to display latency.
+"""
+
+
+class StageTimer:
+    """
+    Context manager for measure wall time of one main loop stage.
+    Keep last frames timings in rolling window.
+    """
+    def __init__(self, *, window_size: int):
+        """
+        :param window_size: Number of last timings to keep.
+        :type window_size: int
+        """
+        self._timings: deque[float] = deque(maxlen=window_size)
+        self._start_time: float = 0.0
+
+    def __enter__(self):
+        self._start_time: float = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._timings.append(perf_counter() - self._start_time)
+        return False
+
+    def get_percentiles(self, percentiles: tuple[int, ...]) -> dict[str, float]:
+        """
+        Calculate stage timings percentiles by nearest rank.
+        :param percentiles: Percentiles for calculation.
+        :type percentiles: tuple[int, ...]
+        :return: Dict with "p<percentile>" keys and milliseconds values.
+        """
+        result: dict[str, float] = {}
+        sorted_timings: list[float] = sorted(self._timings)
+        timings_count: int = len(sorted_timings)
+        for percentile in percentiles:
+            if timings_count == 0:
+                result[f"p{percentile}"]: float = 0.0
+                continue
+            rank: int = max(
+                -(-percentile * timings_count // 100) - 1,
+                0
+            )
+            result[f"p{percentile}"]: float = round(sorted_timings[rank] * 1000, 3)
+        return result
+
+    def add_timing(self, timing: float):
+        """
+        Add timing measured without "with" statement.
+        Used in InputLatencyMeter.
+        :param timing: Time in seconds.
+        :type timing: float
+        """
+        self._timings.append(timing)
+
+    def get_count(self) -> int:
+        """
+        :return: Number of timings in rolling window.
+        """
+        return len(self._timings)
+
+
+class InputLatencyMeter(SingletonPattern):
+    """
+    Measure time from input event to display update of scene switched by this event.
+    Event time is taken when input event is dequeued, carried by SceneValidator and StageDirector
+    through scene switch and closed by first frame present after scene build.
+    Used in InputCommandsReactions, SceneValidator, StageDirector, GameMaster and FrameProfiler.
+    """
+    # Upper bounds of histogram bins in milliseconds, last bin is for longer latencies:
+    _histogram_bins: tuple[int, ...] = (1, 2, 4, 8, 16, 33, 50, 100)
+
+    def __init__(self):
+        # Rolling window settings:
+        self._window_size: int = 600
+        self._latency_timer: StageTimer = StageTimer(window_size=self._window_size)
+
+        # Latency settings:
+        # Dequeue time of input event in reaction, None between reactions:
+        self._event_time: float | None = None
+        # Event time of built scene, not presented yet:
+        self._scene_event_time: float | None = None
+        self._histogram: dict[str, int] = self._get_empty_histogram()
+
+    def _get_empty_histogram(self) -> dict[str, int]:
+        """
+        :return: Dict with histogram bins names keys and zero counts.
+        """
+        result: dict[str, int] = {
+            f"<={histogram_bin}ms": 0 for histogram_bin in self._histogram_bins
+        }
+        result[f">{self._histogram_bins[-1]}ms"]: int = 0
+        return result
+
+    def set_event_time(self, event_time: float | None):
+        """
+        Used in InputCommandsReactions.
+        :param event_time: 'time.perf_counter' time of input event dequeue.
+                           None after event reaction.
+        :type event_time: float | None
+        """
+        self._event_time: float | None = event_time
+
+    def get_event_time(self) -> float | None:
+        """
+        Used in SceneValidator.
+        """
+        return self._event_time
+
+    def set_scene_event_time(self, event_time: float | None):
+        """
+        Mark scene built by input event, latency is counted at next present.
+        Used in StageDirector.
+        :param event_time: 'time.perf_counter' time of input event which switched scene.
+                           None for scenes switched without input.
+        :type event_time: float | None
+        """
+        self._scene_event_time: float | None = event_time
+
+    def present(self):
+        """
+        Count latency of presented scene switch.
+        Used in GameMaster after Render present.
+        """
+        if self._scene_event_time is None:
+            return
+        latency: float = perf_counter() - self._scene_event_time
+        self._scene_event_time: float | None = None
+        self._latency_timer.add_timing(latency)
+
+        latency_ms: float = latency * 1000
+        for histogram_bin in self._histogram_bins:
+            if latency_ms <= histogram_bin:
+                self._histogram[f"<={histogram_bin}ms"] += 1
+                return
+        self._histogram[f">{self._histogram_bins[-1]}ms"] += 1
+
+    def get_histogram(self) -> dict[str, int]:
+        """
+        Get counts of input to display latencies by bins.
+        :return: Dict with "<=<bound>ms" and ">{last bound}ms" keys and counts values.
+        """
+        return self._histogram.copy()
+
+    def get_percentiles(self, percentiles: tuple[int, ...]) -> dict[str, float]:
+        """
+        Get percentiles of last latencies.
+        :param percentiles: Percentiles for calculation.
+        :type percentiles: tuple[int, ...]
+        :return: Dict with "p<percentile>" keys and milliseconds values.
+        """
+        return self._latency_timer.get_percentiles(percentiles)
+
+    def get_count(self) -> int:
+        """
+        :return: Number of latencies in rolling window.
+        """
+        return self._latency_timer.get_count()
+
+    def reset(self):
+        """
+        Clear all latencies.
+        """
+        self._latency_timer: StageTimer = StageTimer(window_size=self._window_size)
+        self._scene_event_time: float | None = None
+        self._histogram: dict[str, int] = self._get_empty_histogram()
+
+
+class FrameProfiler(SingletonPattern):
+    """
+    Collect wall time of GameMaster render loop stages.
+    Log dump also contains InputLatencyMeter histogram and TexturesMaster memory report.
+    Used in GameMaster and benchmark utilities.
+    """
+    _percentiles: tuple[int, ...] = (50, 95, 99)
+
+    def __init__(self):
+        self._settings_keeper: SettingsKeeper = SettingsKeeper()
+
+        # Rolling window settings:
+        self._window_size: int = 600
+        self._stages_collection: dict[str, StageTimer] = {}
+
+        # Log dump settings:
+        self._log_dump_status: bool = self._settings_keeper.get_frame_profiler_log_dump()
+        # Report has own logger level, so it is written with game log level above INFO:
+        self._logger: logging.Logger = logging.getLogger("frame_profiler")
+        self._logger.setLevel(logging.INFO)
+        self._log_dump_period: int = self._window_size
+        self._frames_counter: int = 0
+
+    def stage(self, stage_name: str) -> StageTimer:
+        """
+        Get stage timer for "with" statement.
+        :param stage_name: Name of main loop stage.
+        :type stage_name: str
+        :return: StageTimer
+        """
+        stage_timer: StageTimer | None = self._stages_collection.get(stage_name)
+        if stage_timer is None:
+            stage_timer: StageTimer = StageTimer(window_size=self._window_size)
+            self._stages_collection[stage_name]: StageTimer = stage_timer
+        return stage_timer
+
+    def end_frame(self):
+        """
+        Count frames and dump statistics to log file, if it is enabled.
+        """
+        self._frames_counter += 1
+        if self._log_dump_status is True and self._frames_counter >= self._log_dump_period:
+            self._frames_counter: int = 0
+            self.log_dump()
+
+    def get_percentiles(self) -> dict[str, dict[str, float]]:
+        """
+        Get p50/p95/p99 timings of all stages.
+        :return: Dict with stages names keys and dicts with percentiles in milliseconds.
+        """
+        return {
+            stage_name: stage_timer.get_percentiles(self._percentiles)
+            for stage_name, stage_timer in self._stages_collection.items()
+        }
+
+    def reset(self):
+        """
+        Clear all stages timings.
+        """
+        self._stages_collection.clear()
+        self._frames_counter: int = 0
+
+    def log_dump(self):
+        """
+        Write stages percentiles, input latency and textures memory to log file with INFO level.
+        Enabled by "frame_profiler_log_dump" setting in "user_settings" file.
+        """
+        report: list[str] = [f"Frame profiler, last {self._window_size} frames (ms):"]
+        for stage_name, stage_percentiles in self.get_percentiles().items():
+            report.append(
+                f"{stage_name}: " + ", ".join(
+                    f"{percentile_name}={value}" for percentile_name, value in stage_percentiles.items()
+                )
+            )
+        input_latency_meter: InputLatencyMeter = InputLatencyMeter()
+        if input_latency_meter.get_count() > 0:
+            report.append(
+                "input_to_display: " + ", ".join(
+                    f"{percentile_name}={value}"
+                    for percentile_name, value in input_latency_meter.get_percentiles(self._percentiles).items()
+                )
+            )
+            report.append(
+                "input_to_display histogram: " + ", ".join(
+                    f"{histogram_bin}: {count}"
+                    for histogram_bin, count in input_latency_meter.get_histogram().items()
+                )
+            )
+        report.append(TexturesMaster().get_memory_report_text())
+        self._logger.info("\n".join(report))
@@ -0,0 +1,321 @@
+import logging
+from asyncio import sleep, Task, create_task
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor, Future
+from time import perf_counter
+
+from pygame import time, NOEVENT
+from pygame import event as pygame_events
+from pygame.event import Event
+
+from ..Universal_computing.Pattern_Singleton import SingletonPattern
+from .Settings_Keeper import SettingsKeeper
+from .Frame_Profiler import FrameProfiler
+from .Sound_Director import SoundDirector
+from .Stage_Director import StageDirector
+from ..Render.Render import Render
+from ..Logging_Config import text_for_logging
+"""
+Contains code for FrameScheduler.
+Run main loop frames by phases.
+"""
+
+
+class FrameScheduler(SingletonPattern):
+    """
+    Run main loop by frame phases: input, update, render and present.
+    Input phase sleeps in event wait until next frame time and reacts to events as soon as they come.
+    Update phase runs once per frame with variable timestep or by fixed timestep steps.
+    Frames are capped by frames per second, by low frames per second without animations in adaptive policy
+    or not capped for benchmarks.
+    Frame times are kept in float milliseconds of "time.perf_counter", so frames per second cap is exact.
+    Background tasks run between frames: coroutines in main loop and blocking functions in worker thread.
+    Used in GameMaster and SaveKeeper.
+    """
+    # Most update steps in one frame with fixed timestep, longer lag is dropped:
+    _max_update_steps: int = 4
+    # Frames per second of adaptive frame rate policy without animations and scene changes:
+    _adaptive_frames_per_second: int = 20
+
+    def __init__(self):
+        # Program layers settings:
+        self._settings_keeper: SettingsKeeper = SettingsKeeper()
+        self._frame_profiler: FrameProfiler = FrameProfiler()
+        self._render: Render = Render()
+        self._sound_director: SoundDirector = SoundDirector()
+        self._stage_director: StageDirector = StageDirector()
+
+        # Phases settings, set by GameMaster:
+        self._input_phase: Callable[[Event], Coroutine] | None = None
+        self._update_phase: Callable[[], None] | None = None
+        self._render_phase: Callable[[], None] | None = None
+        self._present_phase: Callable[[], None] | None = None
+
+        # Frame rate settings:
+        # Game initializes pygame display and mixer without "pygame.init", so SDL timer is started
+        # by first "pygame.time" wait. Animations deadlines in "pygame.time.get_ticks" are 0 before:
+        time.wait(0)
+        # "capped", "adaptive" or "uncapped":
+        self._frame_rate_policy: str = self._settings_keeper.get_frame_rate_policy()
+        # Shortest time between frames starts and fixed timestep duration, in milliseconds:
+        self._frame_duration: float = 1000 / self._settings_keeper.get_frames_per_second()
+        self._adaptive_frame_duration: float = max(
+            1000 / self._adaptive_frames_per_second,
+            self._frame_duration
+        )
+        # "wait" or "busy_loop":
+        self._frame_pacing: str = self._settings_keeper.get_frame_pacing()
+        # Time before next frame polled without event wait in busy loop pacing, in milliseconds.
+        # Event wait wakes up later than asked by OS scheduler:
+        self._busy_loop_time: int = 2
+        # "variable" or "fixed":
+        self._timestep: str = self._settings_keeper.get_frame_timestep()
+        # Fixed timestep time not covered by update steps, in milliseconds:
+        self._update_lag: float = 0.0
+        self._last_update_time: float | None = None
+
+        # Idle mode settings:
+        self._idle_mode: bool = self._settings_keeper.get_idle_mode()
+        # Longest wait without events and animations, in milliseconds:
+        self._idle_max_wait_time: int = 100
+
+        # Background tasks settings:
+        self._background_tasks: set[Task] = set()
+        self._background_jobs: set[Future] = set()
+        self._background_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="background_job"
+        )
+        # Longest blocking event wait while background coroutines are not done, in milliseconds.
+        # Coroutines are continued only between waits:
+        self._background_wait_time: int = 4
+
+    def set_phases(self, *, input_phase: Callable[[Event], Coroutine], update_phase: Callable[[], None],
+                   render_phase: Callable[[], None], present_phase: Callable[[], None]):
+        """
+        Used in GameMaster.
+        :param input_phase: Coroutine function for one input event reaction.
+        :type input_phase: Callable[[Event], Coroutine]
+        :param update_phase: Function for scene and interface update.
+        :type update_phase: Callable[[], None]
+        :param render_phase: Function for display image render.
+        :type render_phase: Callable[[], None]
+        :param present_phase: Function for display image show.
+        :type present_phase: Callable[[], None]
+        """
+        self._input_phase: Callable[[Event], Coroutine] = input_phase
+        self._update_phase: Callable[[], None] = update_phase
+        self._render_phase: Callable[[], None] = render_phase
+        self._present_phase: Callable[[], None] = present_phase
+
+    def add_background_task(self, coroutine: Coroutine) -> Task:
+        """
+        Run coroutine in main loop between frames.
+        Used for asset input/output and saves.
+        :param coroutine: Coroutine object.
+        :type coroutine: Coroutine
+        :return: asyncio Task.
+        """
+        task: Task = create_task(coroutine)
+        self._background_tasks.add(task)
+        return task
+
+    def run_in_background(self, function: Callable, *args) -> Future:
+        """
+        Run blocking function in worker thread.
+        Jobs are run one by one in order of adding.
+        Used in SaveKeeper.
+        :param function: Function without pygame display calls.
+        :type function: Callable
+        :return: concurrent.futures.Future with function result.
+        """
+        job: Future = self._background_executor.submit(function, *args)
+        self._background_jobs.add(job)
+        return job
+
+    def _background_phase(self):
+        """
+        Drop done background tasks and log their errors.
+        """
+        for done_task in [task for task in self._background_tasks if task.done()]:
+            self._background_tasks.discard(done_task)
+            if done_task.cancelled() is False and done_task.exception() is not None:
+                logging.error(
+                    text_for_logging(
+                        log_text="FrameScheduler background task Exception.",
+                        log_error=done_task.exception()
+                    )
+                )
+        for done_job in [job for job in self._background_jobs if job.done()]:
+            self._background_jobs.discard(done_job)
+            if done_job.cancelled() is False and done_job.exception() is not None:
+                logging.error(
+                    text_for_logging(
+                        log_text="FrameScheduler background job Exception.",
+                        log_error=done_job.exception()
+                    )
+                )
+
+    @staticmethod
+    def _get_time() -> float:
+        """
+        Get main loop time.
+        :return: "time.perf_counter" time in milliseconds.
+        """
+        return perf_counter() * 1000
+
+    def _get_loop_time(self, ticks_time: int) -> float:
+        """
+        Convert time of animations and speech text deadlines to main loop time.
+        :param ticks_time: Time in "pygame.time.get_ticks" milliseconds.
+        :type ticks_time: int
+        :return: "time.perf_counter" time in milliseconds.
+        """
+        return self._get_time() + ticks_time - time.get_ticks()
+
+    def _get_update_steps_count(self) -> int:
+        """
+        Get number of update steps in current frame.
+        :return: 1 with variable timestep, number of passed timestep durations with fixed timestep.
+        """
+        if self._timestep != "fixed":
+            return 1
+
+        current_time: float = self._get_time()
+        if self._last_update_time is None:
+            self._last_update_time: float = current_time - self._frame_duration
+        self._update_lag += current_time - self._last_update_time
+        self._last_update_time: float = current_time
+
+        result: int = min(
+            int(self._update_lag // self._frame_duration),
+            self._max_update_steps
+        )
+        self._update_lag -= result * self._frame_duration
+        if result == self._max_update_steps:
+            self._update_lag %= self._frame_duration
+        return result
+
+    def frame(self):
+        """
+        Run update, render and present phases of one frame.
+        Used in self.run and Render benchmark utility through GameMaster.
+        """
+        frame_profiler: FrameProfiler = self._frame_profiler
+        with frame_profiler.stage("frame"):
+            for _ in range(self._get_update_steps_count()):
+                self._update_phase()
+            self._render_phase()
+            self._present_phase()
+        frame_profiler.end_frame()
+
+    def _frame_idle_status(self) -> bool:
+        """
+        Check that last frame had no input, scene, image and sound changes.
+        :return: True if next frames can be skipped until event or animation.
+        """
+        return all(
+            (
+                self._idle_mode is True,
+                self._render.get_frame_changed_status() is False,
+                self._sound_director.get_idle_status() is True
+            )
+        )
+
+    def _get_next_frame_time(self, frame_start_time: float) -> float:
+        """
+        Get time of next frame start.
+        After idle frame it is next animation frame, next speech text glyph or longest idle wait time.
+        In adaptive frame rate policy, frame without image changes is followed by low frames per second frame
+        or by next animation frame.
+        :param frame_start_time: Last frame planned start time in main loop milliseconds.
+        :type frame_start_time: float
+        :return: Time in main loop milliseconds.
+        """
+        if self._frame_rate_policy == "uncapped":
+            return frame_start_time
+        result: float = frame_start_time + self._frame_duration
+
+        if self._frame_idle_status() is True:
+            longest_wait_time: float = self._idle_max_wait_time
+        elif self._frame_rate_policy == "adaptive" and self._render.get_frame_changed_status() is False:
+            longest_wait_time: float = self._adaptive_frame_duration
+        else:
+            return result
+
+        next_frame_time: float = frame_start_time + longest_wait_time
+        for next_frame_deadline in (
+                self._render.get_next_frame_deadline(),
+                self._stage_director.get_speech_reveal_deadline()
+        ):
+            if next_frame_deadline is not None:
+                next_frame_time: float = min(
+                    next_frame_time,
+                    self._get_loop_time(next_frame_deadline)
+                )
+        return max(next_frame_time, result)
+
+    async def _wait_input(self, *, frame_start_time: float, next_frame_time: float) -> float:
+        """
+        Input phase: block main loop until next frame time and react to input events as soon as they come.
+        Idle wait is cut to frame duration by first input event.
+        Event wait is counted in whole milliseconds, so frame can start earlier by less than one millisecond.
+        With busy loop pacing last milliseconds before next frame are polled without wait.
+        :param frame_start_time: Last frame planned start time in main loop milliseconds.
+        :type frame_start_time: float
+        :param next_frame_time: Next frame start time in main loop milliseconds.
+        :type next_frame_time: float
+        :return: Planned start time of next frame in main loop milliseconds.
+        """
+        while True:
+            wait_time: float = next_frame_time - self._get_time()
+            # Frame time has come, events are not waited:
+            if wait_time <= 0 or (self._frame_pacing != "busy_loop" and wait_time < 1):
+                for event in pygame_events.get():
+                    await self._input_phase(event)
+                return next_frame_time
+
+            if self._frame_pacing == "busy_loop" and wait_time <= self._busy_loop_time:
+                events: list[Event] = pygame_events.get()
+            else:
+                if self._frame_pacing == "busy_loop":
+                    wait_time -= self._busy_loop_time
+                # Background coroutines are continued between short waits:
+                if len(self._background_tasks) > 0:
+                    wait_time: float = min(wait_time, self._background_wait_time)
+                event: Event = pygame_events.wait(max(int(wait_time), 1))
+                events: list[Event] = [event] if event.type != NOEVENT else []
+
+            for event in events:
+                await self._input_phase(event)
+            # Input changes scene, so idle wait is over:
+            if len(events) > 0:
+                next_frame_time: float = min(
+                    next_frame_time,
+                    frame_start_time + self._frame_duration
+                )
+            await sleep(0)
+
+    async def run(self):
+        """
+        Main game loop.
+        Used in GameMaster.
+        """
+        frame_start_time: float = self._get_time()
+        next_frame_time: float = frame_start_time
+        while True:
+            next_frame_time: float = await self._wait_input(
+                frame_start_time=frame_start_time,
+                next_frame_time=next_frame_time
+            )
+            # Next frames are planned from last frame planned time, so event wait rounding is not accumulated.
+            # Frame late by more than frame duration starts new plan:
+            current_time: float = self._get_time()
+            if current_time - next_frame_time < self._frame_duration:
+                frame_start_time: float = next_frame_time
+            else:
+                frame_start_time: float = current_time
+            self.frame()
+            next_frame_time: float = self._get_next_frame_time(frame_start_time)
+            self._background_phase()
+            await sleep(0)
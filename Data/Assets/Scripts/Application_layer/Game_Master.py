@@ -1,7 +1,4 @@
-from asyncio import run, sleep, gather
-
-from pygame import time
-from pygame.time import Clock
+from asyncio import run
 
 from .Reactions_to_input_commands import InputCommandsReactions
 from .Stage_Director import StageDirector
@@ -13,7 +10,8 @@ from ..Universal_computing.Pattern_Singleton import SingletonPattern
 from .State_Machine import StateMachine
 from .Initialization import initialization
 from ..GamePlay.GamePlay_Administrator import GamePlayAdministrator
-from .Settings_Keeper import SettingsKeeper
+from .Frame_Profiler import FrameProfiler, InputLatencyMeter
+from .Frame_Scheduler import FrameScheduler
 """
 Contains code for GameMaster.
 Control gameplay, menus and display image render.
@@ -39,38 +37,59 @@ class GameMaster(SingletonPattern):
         self._reactions_to_input_commands: InputCommandsReactions = InputCommandsReactions()
         self._gameplay_administrator: GamePlayAdministrator = GamePlayAdministrator()
 
-    async def _render_loop(self):
+        # Main loop stages timings:
+        self._frame_profiler: FrameProfiler = FrameProfiler()
+        self._input_latency_meter: InputLatencyMeter = InputLatencyMeter()
+
+        # Main loop frames phases:
+        self._frame_scheduler: FrameScheduler = FrameScheduler()
+        self._frame_scheduler.set_phases(
+            input_phase=self._reactions_to_input_commands.react,
+            update_phase=self._update,
+            render_phase=self._image_render,
+            present_phase=self._present
+        )
+
+    def _update(self):
         """
-        MVC pattern Model and View parts.
+        Update phase of frame: build scene and interface.
         """
-        main_cycle_fps_clock: Clock = time.Clock()
-        main_cycle_fps: int = SettingsKeeper().get_frames_per_second()
-
-        while True:
-            # Build scene:
+        frame_profiler: FrameProfiler = self._frame_profiler
+        # Build scene:
+        with frame_profiler.stage("state_machine"):
             self._state_machine()
+        with frame_profiler.stage("stage_director"):
             self._stage_director.scale()
-            # Sound control:
+        # Sound control:
+        with frame_profiler.stage("sound_director"):
             self._sound_director.play()
-            # Build interface:
+        # Build interface:
+        with frame_profiler.stage("gameplay_administrator"):
             self._gameplay_administrator.set_gameplay_type()
+        with frame_profiler.stage("interface_controller"):
             self._interface_controller.scale()
-            # Image render:
+
+    def _image_render(self):
+        """
+        Render phase of frame.
+        """
+        with self._frame_profiler.stage("render"):
             self._render.image_render()
 
-            main_cycle_fps_clock.tick(main_cycle_fps)
-            await sleep(0)
+    def _present(self):
+        """
+        Present phase of frame.
+        """
+        with self._frame_profiler.stage("present"):
+            self._render.present()
+        self._input_latency_meter.present()
 
-    async def _mvc_pattern(self):
+    def frame(self):
         """
-        MVC pattern main game loop.
+        Run all phases of one main loop frame, except input.
+        Used in Render benchmark utility.
         """
-        await gather(
-                *[
-                    self._render_loop(),
-                    self._reactions_to_input_commands.input_commands_loop()
-                ]
-            )
+        self._frame_scheduler.frame()
 
     @error_logger
     def __call__(self):
@@ -78,5 +97,5 @@ class GameMaster(SingletonPattern):
         Main game loop call.
         """
         run(
-            self._mvc_pattern()
+            self._frame_scheduler.run()
         )
@@ -1,7 +1,6 @@
-from asyncio import sleep
+from time import perf_counter
 
-from pygame import QUIT, quit
-from pygame import event as pygame_events
+from pygame import QUIT, WINDOWEXPOSED, quit
 from pygame.event import Event
 
 from ..User_Interface.Interface_Controller import InterfaceController
@@ -16,6 +15,8 @@ from ..User_Interface.UI_Menus.UI_Back_to_Start_menu_Status_menu import BackToSt
 from ..User_Interface.UI_Menus.UI_Creators_menu import CreatorsMenu
 from ..GamePlay.GamePlay_Administrator import GamePlayAdministrator
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
+from ..Render.Render import Render
+from .Frame_Profiler import InputLatencyMeter
 """
 Contains code for reactions to input commands.
 """
@@ -24,7 +25,7 @@ Contains code for reactions to input commands.
 class InputCommandsReactions(SingletonPattern):
     """
     Controls reactions to user input commands from mouse or key bord by conveyor
-    in '_reactions_to_input_commands' method from 'input_commands_loop'.
+    in '_reactions_to_input_commands' method from 'react'.
     """
     _menus_collection: dict = {
         'exit_menu': {
@@ -78,6 +79,8 @@ class InputCommandsReactions(SingletonPattern):
         # Program layers:
         self._interface_controller: InterfaceController = InterfaceController()
         self._gameplay_administrator: GamePlayAdministrator = GamePlayAdministrator()
+        self._render: Render = Render()
+        self._input_latency_meter: InputLatencyMeter = InputLatencyMeter()
 
         # Itself data proxy:
         self._interface_controller.menus_collection = self._menus_collection
@@ -85,8 +88,8 @@ class InputCommandsReactions(SingletonPattern):
     async def _reactions_to_input_commands(self, event: Event):
         """
         User commands conveyor.
-        Uses in input_command_loop.
-        :param event: 'pygame.event' from input_commands_loop.
+        Uses in react.
+        :param event: 'pygame.event' from react.
         """
         # Gameplay:
         if self._interface_controller.gameplay_interface_status is True:
@@ -99,20 +102,22 @@ class InputCommandsReactions(SingletonPattern):
                 menu.menu_input(event)
                 return
 
-    async def input_commands_loop(self):
+    async def react(self, event: Event):
         """
-        Controller MVC pattern part: coll from GameMaster.
+        React to one input event.
+        Controller MVC pattern part: call from FrameScheduler input phase.
+        :param event: 'pygame.event' from FrameScheduler.
         """
-        while True:
-            for event in pygame_events.get():
+        # Quit by exit_icon:
+        if event.type == QUIT:
+            quit()
+            exit(0)
 
-                # Quit by exit_icon:
-                if event.type == QUIT:
-                    quit()
-                    exit(0)
+        # Window image was lost:
+        if event.type == WINDOWEXPOSED:
+            self._render.set_full_redraw_status()
 
-                # User commands:
-                await self._reactions_to_input_commands(event)
-
-            pygame_events.clear()
-            await sleep(0)
+        # User commands, scene switched by event gets event dequeue time:
+        self._input_latency_meter.set_event_time(perf_counter())
+        await self._reactions_to_input_commands(event)
+        self._input_latency_meter.set_event_time(None)
@@ -5,6 +5,7 @@ from time import strftime, localtime, strptime, struct_time
 from datetime import datetime, timedelta
 import logging
 from math import ceil
+from concurrent.futures import Future, wait as wait_futures
 
 from pygame import image, transform, Surface
 
@@ -77,6 +78,8 @@ class SaveKeeper(SingletonPattern):
         self._save_file_format: str = 'save'
         self._preview_file_format: str = 'png'
         self._new_save_button_name: str = "New Save"
+        # Background autosave files writing:
+        self._save_writing_job: Future | None = None
 
     def reread(self):
         """
@@ -84,6 +87,16 @@ class SaveKeeper(SingletonPattern):
         """
         self._reread: bool = True
 
+    def set_save_folder_path(self, save_folder_path: str):
+        """
+        Change saves folder.
+        Used in Render benchmark utility, for keep player saves untouched.
+        :param save_folder_path: Absolute path to saves folder.
+        :type save_folder_path: str
+        """
+        self._save_folder_path: str = save_folder_path
+        self._reread: bool = True
+
     def _update_ui_buttons(self, *, menu_data: dict, save_type: str):
         """
         Update menu`s buttons dict in 'InterfaceController.buttons_dict'.
@@ -358,6 +371,8 @@ class SaveKeeper(SingletonPattern):
                 menu_data=ui_collection[save_type],
                 save_type=save_type
             )
+        # New save slots buttons:
+        self._render.set_reset_status()
 
     def save(self, *, auto_save: bool = True):
         """
@@ -378,24 +393,57 @@ class SaveKeeper(SingletonPattern):
             *[save_path, f"{save_name}.{self._save_file_format}"]
         )
 
-        # Saving game progress:
-        if path.exists(save_path) is False:
-            makedirs(save_path)
-        with open(save_file, 'w', encoding='utf-8') as file:
-            file.write(
-               self._get_game_progress_data_for_save()
-            )
-
-        # Saving game scene image preview:
+        # Game scene image preview:
         x_screen_size: int = 720
         y_screen_size: int = int(
             self._settings_keeper.get_window().get_height()
             * (x_screen_size / self._settings_keeper.get_window().get_width())
         )
         screen_preview: Surface = transform.scale(
-            surface=self._render.save_screen,
+            surface=self._render.get_save_screen(),
             size=(x_screen_size, y_screen_size)
         )
+
+        # Autosave files are written in background between frames:
+        if auto_save is True:
+            from .Frame_Scheduler import FrameScheduler
+
+            self._wait_save_writing()
+            self._save_writing_job: Future = FrameScheduler().run_in_background(
+                self._write_save_files,
+                save_path,
+                save_file,
+                self._get_game_progress_data_for_save(),
+                screen_preview
+            )
+        else:
+            self._write_save_files(
+                save_path,
+                save_file,
+                self._get_game_progress_data_for_save(),
+                screen_preview
+            )
+
+    def _write_save_files(self, save_path: str, save_file: str, save_data: str, screen_preview: Surface):
+        """
+        Write save file and save image preview.
+        Can be run in FrameScheduler worker thread.
+        :param save_path: Path to save folder.
+        :type save_path: str
+        :param save_file: Path to save file.
+        :type save_file: str
+        :param save_data: Json string with game progress.
+        :type save_data: str
+        :param screen_preview: Scaled screen image, it is not used anywhere else.
+        :type screen_preview: Surface
+        """
+        # Saving game progress:
+        if path.exists(save_path) is False:
+            makedirs(save_path)
+        with open(save_file, 'w', encoding='utf-8') as file:
+            file.write(save_data)
+
+        # Saving game scene image preview:
         image.save(
             screen_preview,
             path.join(
@@ -403,6 +451,14 @@ class SaveKeeper(SingletonPattern):
             )
         )
 
+    def _wait_save_writing(self):
+        """
+        Wait until background save writing is finished.
+        """
+        if self._save_writing_job is not None:
+            wait_futures([self._save_writing_job])
+            self._save_writing_job: None = None
+
     def _get_game_progress_data_for_save(self) -> str:
         """
         Get progress data for save it like json in file.
@@ -458,6 +514,7 @@ class SaveKeeper(SingletonPattern):
         """
         Read save directory.
         """
+        self._wait_save_writing()
         # Save path dos not exist:
         if path.exists(self._save_folder_path) is False:
             return
@@ -527,6 +584,7 @@ class SaveKeeper(SingletonPattern):
         Call from save menu.
         """
         if file_name is not None:
+            self._wait_save_writing()
             save_path: str = path.join(
                 *[self._save_folder_path, file_name]
             )
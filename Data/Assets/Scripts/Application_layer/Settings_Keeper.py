@@ -32,8 +32,37 @@ class SettingsKeeper(SingletonPattern):
             "sound_volume": 100,
             "text_language": "eng",
             "voice_acting_language": "eng",
-            "frames_per_second": 60
+            # Speech text reveal speed in characters per second, 0 shows whole text at once:
+            "text_reveal_speed": 40,
+            # "capped", "adaptive" (frames per second only while image changes) or "uncapped" for benchmarks:
+            "frame_rate_policy": "capped",
+            "frames_per_second": 60,
+            # "wait" for frame pacing by event wait, "busy_loop" for precise pacing with last milliseconds polled:
+            "frame_pacing": "wait",
+            # "variable" or "fixed" update timestep:
+            "frame_timestep": "variable",
+            "render_mode": "dirty_rectangles",
+            # Frame profiler report in log file every 600 frames:
+            "frame_profiler_log_dump": False,
+            "idle_mode": True,
+            "subsurface_texture_frames": True,
+            "lazy_texture_loading": True,
+            "scene_prefetch_depth": 2,
+            "texture_disk_cache": True,
+            "glyph_atlas_text": True
         }
+        # Settings not stored in "user_settings" file:
+        self._technical_settings_names: tuple[str, ...] = (
+            "system_type",
+            "frame_timestep",
+            "render_mode",
+            "idle_mode",
+            "subsurface_texture_frames",
+            "lazy_texture_loading",
+            "scene_prefetch_depth",
+            "texture_disk_cache",
+            "glyph_atlas_text"
+        )
 
         # Read settings configuration file:
         resave: bool = False
@@ -44,9 +73,10 @@ class SettingsKeeper(SingletonPattern):
                     mode='r',
                     encoding='utf-8'
             ) as game_settings:
-                if game_settings.read().strip() == '':
+                settings_rows: str = game_settings.read()
+                if settings_rows.strip() == '':
                     resave: bool = True
-                for row in game_settings:
+                for row in settings_rows.splitlines():
                     try:
 
                         if "game_settings" in row:
@@ -69,6 +99,30 @@ class SettingsKeeper(SingletonPattern):
                         ):
                             current_landed_file_game_settings[setting_type_name]: int = int(setting_value)
 
+                        # Text settings:
+                        elif setting_type_name == "text_reveal_speed":
+                            current_landed_file_game_settings[setting_type_name]: int = int(setting_value)
+
+                        # Frame rate settings:
+                        elif setting_type_name == "frames_per_second":
+                            if int(setting_value) <= 0:
+                                raise ValueError
+                            current_landed_file_game_settings[setting_type_name]: int = int(setting_value)
+                        elif setting_type_name == "frame_rate_policy":
+                            if setting_value not in ("capped", "adaptive", "uncapped"):
+                                raise ValueError
+                            current_landed_file_game_settings[setting_type_name]: str = setting_value
+                        elif setting_type_name == "frame_pacing":
+                            if setting_value not in ("wait", "busy_loop"):
+                                raise ValueError
+                            current_landed_file_game_settings[setting_type_name]: str = setting_value
+
+                        # Profiler settings:
+                        elif setting_type_name == "frame_profiler_log_dump":
+                            if setting_value not in ("True", "False"):
+                                raise ValueError
+                            current_landed_file_game_settings[setting_type_name]: bool = setting_value == "True"
+
                         # Other settings:
                         else:
                             current_landed_file_game_settings[setting_type_name]: str = setting_value
@@ -78,10 +132,7 @@ class SettingsKeeper(SingletonPattern):
                         continue
 
             for setting_type_name in self._game_settings:
-                if setting_type_name in (
-                        "system_type",
-                        "frames_per_second"
-                ):
+                if setting_type_name in self._technical_settings_names:
                     continue
                 if setting_type_name not in current_landed_file_game_settings:
                     resave: bool = True
@@ -110,6 +161,12 @@ class SettingsKeeper(SingletonPattern):
         """
         return self._game_settings["text_language"]
 
+    def get_text_reveal_speed(self) -> int:
+        """
+        Used in DialoguesWords.
+        """
+        return self._game_settings["text_reveal_speed"]
+
     def get_general_volume(self) -> int:
         """
         Used in SoundDirector.
@@ -128,12 +185,81 @@ class SettingsKeeper(SingletonPattern):
         """
         return self._game_settings["sound_volume"]
 
+    def get_frame_rate_policy(self) -> str:
+        """
+        Used in FrameScheduler.
+        :return: "capped", "adaptive" or "uncapped".
+        """
+        return self._game_settings["frame_rate_policy"]
+
     def get_frames_per_second(self) -> int:
         """
-        Used in GameMaster.
+        Used in FrameScheduler.
         """
         return self._game_settings["frames_per_second"]
 
+    def get_frame_pacing(self) -> str:
+        """
+        Used in FrameScheduler.
+        :return: "wait" or "busy_loop".
+        """
+        return self._game_settings["frame_pacing"]
+
+    def get_frame_timestep(self) -> str:
+        """
+        Used in FrameScheduler.
+        """
+        return self._game_settings["frame_timestep"]
+
+    def get_render_mode(self) -> str:
+        """
+        Used in Render.
+        :return: "full" or "dirty_rectangles".
+        """
+        return self._game_settings["render_mode"]
+
+    def get_frame_profiler_log_dump(self) -> bool:
+        """
+        Used in FrameProfiler.
+        """
+        return self._game_settings["frame_profiler_log_dump"]
+
+    def get_idle_mode(self) -> bool:
+        """
+        Used in FrameScheduler.
+        """
+        return self._game_settings["idle_mode"]
+
+    def get_subsurface_texture_frames(self) -> bool:
+        """
+        Used in TexturesMaster.
+        """
+        return self._game_settings["subsurface_texture_frames"]
+
+    def get_lazy_texture_loading(self) -> bool:
+        """
+        Used in TexturesMaster.
+        """
+        return self._game_settings["lazy_texture_loading"]
+
+    def get_scene_prefetch_depth(self) -> int:
+        """
+        Used in ScenePrefetcher.
+        """
+        return self._game_settings["scene_prefetch_depth"]
+
+    def get_texture_disk_cache(self) -> bool:
+        """
+        Used in TextureDiskCache.
+        """
+        return self._game_settings["texture_disk_cache"]
+
+    def get_glyph_atlas_text(self) -> bool:
+        """
+        Used in DialoguesWords.
+        """
+        return self._game_settings["glyph_atlas_text"]
+
     def get_system_type(self) -> str:
         """
         Used in program entry point.
@@ -174,8 +300,12 @@ class SettingsKeeper(SingletonPattern):
         """
         Update game settings.
         """
+        from ..Universal_computing.Font_Pool import FontPool
+
         self._screen: Surface = self._set_windows_settings()
         self._save_settings()
+        # New window size or language:
+        FontPool().clear_rendered_texts()
 
     def _save_settings(self):
         """
@@ -190,15 +320,13 @@ class SettingsKeeper(SingletonPattern):
                 "# game_settings:"
             )
             for setting_name, setting_value in self._game_settings.items():
-                if setting_name not in (
-                        "screen_size",
-                        "system_type",
-                        "frames_per_second"
-                ):
+                if setting_name in self._technical_settings_names:
+                    continue
+                if setting_name != "screen_size":
                     settings_file.write(
                         f"\n{setting_name}={str(setting_value)}"
                     )
-                elif setting_name == "screen_size":
+                else:
                     settings_file.write(
                         f"\n{setting_name}={str(setting_value[0])}x{str(setting_value[1])}"
                     )
@@ -47,6 +47,7 @@ class SoundDirector(SingletonPattern):
         }
 
         self._status: bool = True
+        self._idle_status: bool = False
         self._single_voiceover_language: bool = True
         # self.default_language: str = 'eng'
         # music.set_endevent(constants.USEREVENT)  # TODO: music use low RAM.
@@ -103,6 +104,7 @@ class SoundDirector(SingletonPattern):
         Play soundtracks if it possibly.
         Call from GameMaster.
         """
+        self._idle_status: bool = not self._status
         if self._status is True:
             self._vanish_channels()
 
@@ -120,6 +122,13 @@ class SoundDirector(SingletonPattern):
 
             self._status: bool = False
 
+    def get_idle_status(self) -> bool:
+        """
+        Used in FrameScheduler idle mode.
+        :return: True if sound channels were not changed in last frame.
+        """
+        return self._idle_status
+
     def sound_chanel_controller(self, *, asset_type: str = '', sound_file_name: str | bool, sound_chanel: str):
         """
         Send soundtrack to sound chanel if necessary.
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from pygame import Surface
 
 from ..Game_objects.Character import characters_generator
@@ -6,6 +8,7 @@ from ..User_Interface.UI_Text_Canvas import TextCanvas
 from ..Game_objects.Dialogues import DialogueKeeper, DialoguesWords
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
 from .Settings_Keeper import SettingsKeeper
+from .Frame_Profiler import InputLatencyMeter
 from ..Game_objects.Character import Character
 from ..Application_layer.Sound_Director import SoundDirector
 """
@@ -24,6 +27,7 @@ class StageDirector(SingletonPattern):
         # Program layers settings:
         self._settings_keeper: SettingsKeeper = SettingsKeeper()
         self._sound_director: SoundDirector = SoundDirector()
+        self._input_latency_meter: InputLatencyMeter = InputLatencyMeter()
 
         # Game scene objects settings:
         self._background: Background = Background()
@@ -57,11 +61,83 @@ class StageDirector(SingletonPattern):
         self._text_canvas.scale()
         for character in self._characters_collection.values():
             character.scale()
+        # Speech text reveal:
+        if self._dialog_controller.status is True:
+            self._dialog_controller.update_text_reveal()
+
+    def complete_speech_reveal(self) -> bool:
+        """
+        Show whole speech text of current scene at once.
+        Used in GamePlayReading.
+        :return: True if speech text was not revealed whole before.
+        """
+        if self._dialog_controller.status is False:
+            return False
+        return self._dialog_controller.complete_text_reveal()
+
+    def get_speech_reveal_deadline(self) -> int | None:
+        """
+        Get time of next speech text glyph reveal.
+        Used in FrameScheduler idle mode.
+        :return: Time in "pygame.time.get_ticks" milliseconds or None if speech text is revealed whole.
+        """
+        if self._dialog_controller.status is False:
+            return None
+        return self._dialog_controller.get_text_reveal_deadline()
+
+    def get_scene_object_texture(self, *, object_type: str, object_name: str) -> tuple[str, str]:
+        """
+        Use in ScenePrefetcher.
+        :param object_type: background|character
+        :type object_type: str
+        :param object_name: Name of background or character from screenplay.
+        :type object_name: str
+        :return: Texture type and texture name of scene object.
+        """
+        if object_type == "background":
+            return "Backgrounds", self._background.get_texture_name(object_name)
+        return "Characters", self._characters_collection[object_name].get_texture_name()
+
+    def prefetch_scene_object(self, *, object_type: str, object_name: str) -> Iterator[None]:
+        """
+        Load and scale scene object textures before scene start.
+        Use in ScenePrefetcher.
+        :param object_type: background|character
+        :type object_type: str
+        :param object_name: Name of background or character from screenplay.
+        :type object_name: str
+        :return: Iterator with prefetch steps, every step is small enough for one frame.
+        """
+        if object_type == "background":
+            return self._background.prefetch(object_name)
+        return self._characters_collection[object_name].prefetch()
+
+    def build_a_menu_scene(self, *, location: str):
+        """
+        Delete gameplay scene and set menu background.
+        Scene is changed only if menu location changed.
+        Call from MenuState.
+        :param location: String with menu background location name.
+        :type location: str
+        """
+        if self._location == location:
+            return
+
+        self.vanishing_scene()
+        self.set_scene(
+            location=location
+        )
+        self._location: str = location
+
+        # Report new scene to Render for scene batches rebuild:
+        from ..Render.Render import Render
+        Render().set_reset_status()
 
     def vanishing_scene(self):
         """
         Delete all characters and background from scene.
         """
+        self._location: None = None
         self._background.devnull()
         for character in self._characters_collection.values():
             character.kill()
@@ -130,9 +206,14 @@ class StageDirector(SingletonPattern):
             )
         return result
 
-    def build_a_scene(self, scene_data: dict):
+    def build_a_scene(self, scene_data: dict, event_time: float | None = None):
         """
         Call from SceneValidator.
+        :param scene_data: Current scene data from SceneValidator.
+        :type scene_data: dict
+        :param event_time: 'time.perf_counter' time of input event which switched scene.
+                           None for scenes switched without input.
+        :type event_time: float | None
         """
         self.vanishing_scene()
 
@@ -165,6 +246,7 @@ class StageDirector(SingletonPattern):
                 )[scene_data["current_scene_name"]]
             self._text_canvas.status = True
             self._dialog_controller.status = True
+            self._dialog_controller.start_text_reveal()
 
         elif scene_data['gameplay_type'] == 'choice':
             self._text_canvas.text_canvas_status = False
@@ -179,3 +261,6 @@ class StageDirector(SingletonPattern):
                 sound_chanel=key,
                 sound_file_name=value
             )
+
+        # Input to display latency is counted when scene is presented:
+        self._input_latency_meter.set_scene_event_time(event_time)
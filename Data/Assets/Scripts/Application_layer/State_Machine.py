@@ -34,8 +34,7 @@ class MenuState(SingletonPattern):
         if menu_name is None:
             menu_name: str = self._game_menu_name
         else:
-            self._stage_director.vanishing_scene()
-            self._stage_director.set_scene(
+            self._stage_director.build_a_menu_scene(
                 location=menu_name
             )
 
@@ -42,7 +42,7 @@ class GamePlayAdministrator(BaseMenu, SingletonPattern):
     def set_gameplay_type(self):
         """
         Set GamePlay type.
-        Call from GameMaster _render_loop method.
+        Call from GameMaster update phase.
         """
         self._devnull()
         for gameplay_type, gameplay_class in self._gameplay_collections.items():
@@ -61,7 +61,7 @@ class GamePlayAdministrator(BaseMenu, SingletonPattern):
         """
         Gameplay interaction.
         Call from InputCommandsReactions.
-        :param event: pygame.event from InputCommandsReactions input_commands_loop method.
+        :param event: pygame.event from InputCommandsReactions react method.
         """
         for gameplay_type, gameplay_class in self._gameplay_collections.items():
             if self._scene_validator.get_gameplay_type() == gameplay_type:
@@ -1,7 +1,4 @@
-from asyncio import sleep
-
 from pygame import KEYDOWN, K_LEFT, K_RIGHT, K_ESCAPE, K_SPACE, mouse, MOUSEBUTTONDOWN, MOUSEBUTTONUP
-from pygame import event as pygame_events
 from pygame.event import Event
 
 from ..Application_layer.Stage_Director import StageDirector
@@ -22,6 +19,10 @@ class GamePlayReading(BaseMenu, SingletonPattern):
         # Program layers settings:
         self.stage_director: StageDirector = StageDirector()
 
+        # Next scene by click out of virtual buttons:
+        # True after left mouse button was pressed out of virtual buttons, until it is released.
+        self._next_scene_push_status: bool = False
+
     def _go_to_game_menu(self):
         """
         Switch to game menu.
@@ -45,6 +46,12 @@ class GamePlayReading(BaseMenu, SingletonPattern):
         if self._interface_controller.gameplay_interface_hidden_status is False:
             if event.type != MOUSEBUTTONDOWN:
                 if event.type == MOUSEBUTTONUP:
+                    # Release of left mouse button pressed out of virtual buttons:
+                    if self._next_scene_push_status is True and event.button == 1:
+                        self._next_scene_push_status: bool = False
+                        self._next_scene_by_click()
+                        return
+
                     gameplay_ui_buttons: tuple[str, bool] = self._interface_controller.button_clicked_status(event)
                     command: str = gameplay_ui_buttons[0]
 
@@ -79,25 +86,30 @@ class GamePlayReading(BaseMenu, SingletonPattern):
                                         self._scene_validator.get_current_scene_data()["next_scene"]
                                     )
 
-            # Next scene without virtual buttons:
+            # Next scene without virtual buttons, scene is switched on button release:
             else:
-                if button_clicked[0] is True:
-                    gameplay_ui_buttons: tuple[str, bool] = self._interface_controller.button_push_status()
+                if event.button == 1:
+                    gameplay_ui_buttons: tuple[str, bool] = self._interface_controller.button_push_status(event)
                     if gameplay_ui_buttons[1] is False:
-                        new_event: Event = pygame_events.poll()
-                        while new_event.type != MOUSEBUTTONUP:
-                            new_event: Event = pygame_events.poll()
-                            await sleep(0)
-                        if self._scene_validator.get_current_scene_data()["next_scene"] != 'FINISH':
-                            self._scene_validator.switch_scene(
-                                self._scene_validator.get_current_scene_data()["next_scene"]
-                            )
+                        self._next_scene_push_status: bool = True
 
         # If user interface is hidden:
         else:
             if button_clicked[0] is True:
                 self._interface_controller.gameplay_interface_hidden_status = False
 
+    def _next_scene_by_click(self):
+        """
+        Show whole speech text or switch to next scene.
+        """
+        # First click shows whole speech text:
+        if self.stage_director.complete_speech_reveal() is True:
+            return
+        if self._scene_validator.get_current_scene_data()["next_scene"] != 'FINISH':
+            self._scene_validator.switch_scene(
+                self._scene_validator.get_current_scene_data()["next_scene"]
+            )
+
     def _key_bord_gameplay_key_down(self, event):
         """
         Checking pressed keys.
@@ -120,6 +132,8 @@ class GamePlayReading(BaseMenu, SingletonPattern):
                         )
 
                 elif event.key == K_SPACE:
+                    if self.stage_director.complete_speech_reveal() is True:
+                        return
                     if self._scene_validator.get_current_scene_data()["next_scene"] != 'FINISH':
                         self._scene_validator.switch_scene(
                             self._scene_validator.get_current_scene_data()["next_scene"]
@@ -1,4 +1,5 @@
 from ..Application_layer.Stage_Director import StageDirector
+from ..Application_layer.Settings_Keeper import SettingsKeeper
 from ..User_Interface.UI_Base_menu import BaseMenu
 from ..User_Interface.UI_Buttons.UI_GamePlay_Choice_Button import GamePlayChoiceButton
 from ..Universal_computing.Assets_load import AssetLoader
@@ -22,9 +23,12 @@ class GamePlayDialoguesChoice(BaseMenu, SingletonPattern):
         self._assets_loader: AssetLoader = AssetLoader()
         self._dialogue_keeper: DialogueKeeper = DialogueKeeper()
         self._scene_validator: SceneValidator = SceneValidator()
+        self._settings_keeper: SettingsKeeper = SettingsKeeper()
 
         # Gameplay choice buttons settings:
         self._dialogues_buttons: dict = {}
+        # (scene builds count, text language, screen size) of current choice buttons:
+        self._choice_key: tuple[int, str, tuple[int, int]] | None = None
         self._default_button_image_data: dict = {
             "type": "gameplay_dialogues_choice",
             "sprite_name": "dialogues_choice_button",
@@ -122,13 +126,25 @@ class GamePlayDialoguesChoice(BaseMenu, SingletonPattern):
     def set_choice(self):
         """
         Set new choice buttons.
+        Buttons are generated again only for new scene build, as example after save load,
+        or if text language or screen size were changed.
         Call from GameplayAdministrator.
         """
+        choice_key: tuple[int, str, tuple[int, int]] = (
+            self._scene_validator.get_scene_builds_count(),
+            self._settings_keeper.get_text_language(),
+            self._settings_keeper.get_window().get_size()
+        )
+        if self._choice_key == choice_key:
+            return
+
         self._dialogues_buttons.clear()
         self._dialogues_choice_buttons_generations()
         self._interface_controller.gameplay_choice_buttons = self._dialogues_buttons[
             self._scene_validator.get_current_scene_name()
         ]
+        self._choice_key: tuple[int, str, tuple[int, int]] = choice_key
+        self._render_reset()
 
     def gameplay_input(self, event):
         """
@@ -0,0 +1,194 @@
+from collections import deque
+from concurrent.futures import Future
+from time import perf_counter
+from typing import Iterator
+
+from pygame import Surface
+
+from ..Application_layer.Stage_Director import StageDirector
+from ..Application_layer.Settings_Keeper import SettingsKeeper
+from ..Render.Texture_Master import TexturesMaster
+from ..Universal_computing.Assets_load import AssetLoader
+from ..Universal_computing.Pattern_Singleton import SingletonPattern
+"""
+Contains ScenePrefetcher code.
+"""
+
+
+class ScenePrefetcher(SingletonPattern):
+    """
+    Warm textures of scenes which can be reached from current scene by screenplay.
+    Texture files are decoded in FrameScheduler worker thread,
+    conversion and scale are split between frames by time budget.
+    Used in SceneValidator.
+    """
+    def __init__(self):
+        # Program layers settings:
+        self._stage_director: StageDirector = StageDirector()
+        self._texture_master: TexturesMaster = TexturesMaster()
+        self._asset_loader: AssetLoader = AssetLoader()
+
+        # Prefetch settings:
+        # Number of screenplay steps from current scene, 0 disables prefetch:
+        self._lookahead_depth: int = SettingsKeeper().get_scene_prefetch_depth()
+        # Longest prefetch work in one frame, in seconds:
+        self._frame_time_budget: float = 0.004
+
+        # Scene objects to prefetch, nearest scenes first: (object type, object name).
+        self._prefetch_queue: deque[tuple[str, str]] = deque()
+        # Texture files decode jobs: {(texture type, texture name): Future with decoded image}
+        self._decode_jobs: dict[tuple[str, str], Future] = {}
+        # Steps of scene object prefetch in progress:
+        self._prefetch_steps: Iterator[None] | None = None
+
+    @staticmethod
+    def _get_scene_links(scene_data: dict) -> list[str]:
+        """
+        Get names of scenes which can be reached from scene.
+        :param scene_data: Scene data from screenplay.
+        :type scene_data: dict
+        :return: List with scenes names, can contain not scene flags as "START".
+        """
+        result: list[str] = [
+            scene_data.get("next_scene"),
+            scene_data.get("past_scene")
+        ]
+        for choice_data in scene_data.get("choices", {}).values():
+            result.append(choice_data["branching"])
+        return result
+
+    def set_scene(self, *, scene_name: str, screenplay: dict):
+        """
+        Collect objects of scenes reachable from new scene in prefetch queue.
+        :param scene_name: Name of new current scene.
+        :type scene_name: str
+        :param screenplay: Screenplay data from SceneValidator.
+        :type screenplay: dict
+        """
+        self._prefetch_queue.clear()
+
+        # Breadth-first search by screenplay:
+        visited_scenes: set[str] = {scene_name}
+        scenes_to_visit: list[str] = [scene_name]
+        for _ in range(self._lookahead_depth):
+            next_scenes: list[str] = []
+            for visited_scene_name in scenes_to_visit:
+                for linked_scene_name in self._get_scene_links(screenplay[visited_scene_name]):
+                    if linked_scene_name in screenplay and linked_scene_name not in visited_scenes:
+                        visited_scenes.add(linked_scene_name)
+                        next_scenes.append(linked_scene_name)
+
+            for next_scene_name in next_scenes:
+                scene_data: dict = screenplay[next_scene_name]
+                scene_objects: list[tuple[str, str]] = [
+                    ("background", scene_data["background"]["background_sprite_sheet"])
+                ]
+                scene_objects.extend(
+                    ("character", character_name) for character_name in scene_data["actors"]
+                )
+                for scene_object in scene_objects:
+                    if scene_object not in self._prefetch_queue:
+                        self._prefetch_queue.append(scene_object)
+            scenes_to_visit: list[str] = next_scenes
+
+        self._set_decode_jobs()
+
+    def _get_object_texture(self, scene_object: tuple[str, str]) -> tuple[str, str]:
+        """
+        :param scene_object: Object from prefetch queue: (object type, object name).
+        :type scene_object: tuple[str, str]
+        :return: Texture type and texture name of scene object.
+        """
+        return self._stage_director.get_scene_object_texture(
+            object_type=scene_object[0],
+            object_name=scene_object[1]
+        )
+
+    def _decode_texture(self, texture_type: str, texture_name: str) -> Surface:
+        """
+        Decode texture file in worker thread.
+        :param texture_type: Characters|Backgrounds
+        :type texture_type: str
+        :param texture_name: Name of texture from texture configurations.
+        :type texture_name: str
+        :return: Decoded image Surface.
+        """
+        return self._asset_loader.image_decode(
+            art_name=texture_name,
+            asset_type=texture_type
+        )
+
+    def _set_decode_jobs(self):
+        """
+        Start decode of not loaded textures from prefetch queue in FrameScheduler worker thread.
+        Jobs of textures which are not in queue anymore are cancelled.
+        """
+        from ..Application_layer.Frame_Scheduler import FrameScheduler
+
+        queue_textures: list[tuple[str, str]] = []
+        for scene_object in self._prefetch_queue:
+            texture: tuple[str, str] = self._get_object_texture(scene_object)
+            if texture not in queue_textures \
+                    and self._texture_master.get_texture_loaded_status(*texture) is False:
+                queue_textures.append(texture)
+
+        for texture in [texture for texture in self._decode_jobs if texture not in queue_textures]:
+            self._decode_jobs.pop(texture).cancel()
+        for texture in queue_textures:
+            if texture not in self._decode_jobs:
+                self._decode_jobs[texture]: Future = FrameScheduler().run_in_background(
+                    self._decode_texture,
+                    *texture
+                )
+
+    def _prefetch_step(self) -> bool:
+        """
+        Make one prefetch step: one scaled frame or one decoded texture conversion.
+        :return: False if step must wait for worker thread or prefetch queue is empty.
+        """
+        # Object prefetch in progress:
+        if self._prefetch_steps is not None:
+            try:
+                next(self._prefetch_steps)
+            except StopIteration:
+                self._prefetch_steps: None = None
+            return True
+
+        if len(self._prefetch_queue) == 0:
+            return False
+
+        # Texture of next object is decoded in worker thread:
+        texture_type, texture_name = self._get_object_texture(self._prefetch_queue[0])
+        if self._texture_master.get_texture_loaded_status(texture_type, texture_name) is False:
+            decode_job: Future | None = self._decode_jobs.get((texture_type, texture_name))
+            if decode_job is not None:
+                if decode_job.done() is False:
+                    return False
+                del self._decode_jobs[(texture_type, texture_name)]
+                if decode_job.cancelled() is True or decode_job.exception() is not None:
+                    # Texture will be loaded on first use, error is logged by FrameScheduler:
+                    self._prefetch_queue.popleft()
+                    return True
+                self._texture_master.preload(
+                    texture_type,
+                    (texture_name,),
+                    decoded_images={texture_name: decode_job.result()}
+                )
+                return True
+
+        object_type, object_name = self._prefetch_queue.popleft()
+        self._prefetch_steps: Iterator[None] = self._stage_director.prefetch_scene_object(
+            object_type=object_type,
+            object_name=object_name
+        )
+        return True
+
+    def __call__(self):
+        """
+        Prefetch queued scene objects until frame time budget is spent.
+        At least one step is made per call, if it does not wait for worker thread.
+        """
+        start_time: float = perf_counter()
+        while self._prefetch_step() is True:
+            if perf_counter() - start_time >= self._frame_time_budget:
+                return
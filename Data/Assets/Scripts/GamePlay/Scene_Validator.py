@@ -1,4 +1,6 @@
 from ..Application_layer.Stage_Director import StageDirector
+from ..Application_layer.Frame_Profiler import InputLatencyMeter
+from .Scene_Prefetcher import ScenePrefetcher
 from ..Universal_computing.Assets_load import AssetLoader
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
 """
@@ -14,6 +16,8 @@ class SceneValidator(SingletonPattern):
         # Program layers settings:
         self._asset_loader: AssetLoader = AssetLoader()
         self._stage_director: StageDirector = StageDirector()
+        self._scene_prefetcher: ScenePrefetcher = ScenePrefetcher()
+        self._input_latency_meter: InputLatencyMeter = InputLatencyMeter()
 
         # Screenplay loading:
         self._screenplay: dict = self._asset_loader.json_load(
@@ -27,6 +31,10 @@ class SceneValidator(SingletonPattern):
         self._current_scene_name: str | None = None
         self._possible_next_scene_checker_flag: str | None = None
         self._scene_update_status: bool = True
+        # Number of scenes builds, same scene can be built again after save load:
+        self._scene_builds_count: int = 0
+        # Dequeue time of input event which switched scene, for input to display latency:
+        self._switch_event_time: float | None = None
 
         # Over settings:
         self._scene_data: dict | None = None
@@ -68,6 +76,7 @@ class SceneValidator(SingletonPattern):
         Used in GamePlayDialoguesChoice, GamePlayReading, LoadMenu, StartMenu.
         """
         self._possible_next_scene_checker_flag: str = new_scene_name
+        self._switch_event_time: float | None = self._input_latency_meter.get_event_time()
 
     def get_current_scene_data(self) -> dict:
         """
@@ -83,6 +92,12 @@ class SceneValidator(SingletonPattern):
         """
         return self._current_scene_name
 
+    def get_scene_builds_count(self) -> int:
+        """
+        Used in GamePlayDialoguesChoice.
+        """
+        return self._scene_builds_count
+
     def set_scene_update_status(self, status: bool):
         """
         Used in GamePlayReading.
@@ -100,22 +115,40 @@ class SceneValidator(SingletonPattern):
                         self._scene_update_status is False
                 )
         ):
+            # Warm textures of next scenes between frames:
+            self._scene_prefetcher()
             return
 
         # Set new scene settings:
         self._current_scene_name: str = self._possible_next_scene_checker_flag
         self._scene_data: dict = self._screenplay[self._current_scene_name]
         self._scene_update_status: bool = False
+        self._scene_builds_count += 1
 
         # Build a scene:
         self._stage_director.build_a_scene(
-            self.get_current_scene_data()
+            self.get_current_scene_data(),
+            event_time=self._switch_event_time
+        )
+        self._switch_event_time: float | None = None
+        self._scene_render_reset()
+        self._scene_prefetcher.set_scene(
+            scene_name=self._current_scene_name,
+            screenplay=self._screenplay
         )
 
         # Autosave:
         if self._scene_data['gameplay_type'] == 'reading':
             self._autosave()
 
+    @staticmethod
+    def _scene_render_reset():
+        """
+        Report new scene to Render for scene batches rebuild.
+        """
+        from ..Render.Render import Render
+        Render().set_reset_status()
+
     @staticmethod
     def _autosave():
         """
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from pygame import Surface
 
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
@@ -99,16 +101,11 @@ class Background(SingletonPattern):
                     self._display_surface.get_height()
         )
 
-        # Calculate scale coefficient:
-        coefficient: int | float = min(
-            self._last_screen_size[0] / background_texture_size_width,
-            self._last_screen_size[1] / background_texture_size_height
-        )
         # Set background sprite size:
-        self._background_size: tuple[int, int] = (
-                int(background_texture_size_width * coefficient),
-                int(background_texture_size_height * coefficient)
-            )
+        self._background_size: tuple[int, int] = self._get_fit_size(
+            texture_size=(background_texture_size_width, background_texture_size_height),
+            screen_size=self._last_screen_size
+        )
         self._sprite.scale(self._background_size)
 
         self._texture_master.set_new_scale_frame(
@@ -124,3 +121,76 @@ class Background(SingletonPattern):
             (self._last_screen_size[1] - self._background_size[1]) // 2
         )
         self._sprite.set_coordinates(self._background_coordinates)
+
+    @staticmethod
+    def _get_fit_size(*, texture_size: tuple[int, int], screen_size: tuple[int, int]) -> tuple[int, int]:
+        """
+        Calculate background size which fit in screen with texture aspect ratio.
+        :param texture_size: Background texture size.
+        :type texture_size: tuple[int, int]
+        :param screen_size: Display screen size.
+        :type screen_size: tuple[int, int]
+        :return: Background size.
+        """
+        # Calculate scale coefficient:
+        coefficient: int | float = min(
+            screen_size[0] / texture_size[0],
+            screen_size[1] / texture_size[1]
+        )
+        return int(texture_size[0] * coefficient), int(texture_size[1] * coefficient)
+
+    def get_texture_name(self, background_name: str) -> str:
+        """
+        Used in StageDirector.
+        :param background_name: Name of background from "backgrounds_sprites.json".
+        :type background_name: str
+        :return: Name of background texture.
+        """
+        return self._all_backgrounds_sprites_settings[background_name]["texture"]
+
+    def prefetch(self, background_name: str) -> Iterator[None]:
+        """
+        Load background texture and scale its frames for current screen before scene start.
+        Generator, yields after every scaled frame, so work can be split between frames.
+        Used in StageDirector.
+        :param background_name: Name of background from "backgrounds_sprites.json".
+        :type background_name: str
+        """
+        background_settings: dict = self._all_backgrounds_sprites_settings[background_name]
+        texture_name: str = background_settings["texture"]
+        self._texture_master.preload("Backgrounds", (texture_name,))
+
+        # Frames names of all background animations:
+        sprite_sheet_configuration: dict = background_settings["sprite_sheet_configuration"]
+        if sprite_sheet_configuration["sprite_sheet"]:
+            frames_collection: dict[str, dict] = {
+                animation_name: animation_data["frames"]
+                for animation_name, animation_data in sprite_sheet_configuration["animations"].items()
+            }
+        else:
+            frames_collection: dict[str, dict] = {
+                "statick_frames": sprite_sheet_configuration["statick_frames"]
+            }
+
+        screen_size: tuple[int, int] = (
+            self._display_surface.get_width(),
+            self._display_surface.get_height()
+        )
+        for animation_name, frames in frames_collection.items():
+            for frame in frames:
+                self._texture_master.set_new_scale_frame(
+                    texture_name=texture_name,
+                    texture_type="Backgrounds",
+                    animation_name=animation_name,
+                    frame=frame,
+                    image_size=self._get_fit_size(
+                        texture_size=self._texture_master.get_texture_size(
+                            texture_type="Backgrounds",
+                            texture_name=texture_name,
+                            animation_name=animation_name,
+                            frame=frame
+                        ),
+                        screen_size=screen_size
+                    )
+                )
+                yield
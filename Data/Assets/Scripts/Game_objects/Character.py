@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from ..Universal_computing.Assets_load import AssetLoader
 from ..Render.Sprite import Sprite
 from .Background import Background
@@ -126,11 +128,23 @@ class Character:
         :type pose_number: str
         """
         self.pose_number: str = pose_number
-        if self.animation is True:
-            self._sprite.animation_name = self._poses[self.pose_number]
-        else:
-            self._sprite.animation_name = self.default_animation
-            self._sprite.statick_frame_key = int(self.pose_number)
+
+    def get_texture_name(self) -> str:
+        """
+        Used in StageDirector.
+        :return: Name of character texture.
+        """
+        return self._texture_name
+
+    def prefetch(self) -> Iterator[None]:
+        """
+        Load character texture before scene start.
+        Character frames are scaled from their own size with background context, so only decoding is prefetched.
+        Generator with one step, as Background.prefetch.
+        Used in StageDirector.
+        """
+        self._texture_master.preload("Characters", (self._texture_name,))
+        yield
 
     def scale(self):
         """
@@ -1,7 +1,9 @@
-from pygame import font, Surface
+from pygame import font, Surface, Rect, SRCALPHA, time
 
 from ..Universal_computing.Assets_load import AssetLoader
+from ..Universal_computing.Font_Pool import FontPool
 from .Background import Background
+from .Glyph_Atlas import GlyphAtlasKeeper, GlyphAtlas
 from ..Application_layer.Settings_Keeper import SettingsKeeper
 from ..User_Interface.UI_Text_Canvas import TextCanvas
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
@@ -28,7 +30,8 @@ class DialoguesWords(SingletonPattern):
         self._background_surface: Background = Background()
         self._screen: Surface = SettingsKeeper().get_window()
         self._text_canvas: TextCanvas = TextCanvas()
-        self._asset_loader: AssetLoader = AssetLoader()
+        self._font_pool: FontPool = FontPool()
+        self._glyph_atlas_keeper: GlyphAtlasKeeper = GlyphAtlasKeeper()
         self._texture_master: TexturesMaster = TexturesMaster()
 
         # Dialogues attributes:
@@ -39,22 +42,40 @@ class DialoguesWords(SingletonPattern):
         self._font_coordinates: tuple[int, int] = (0, 0)
         self.status: bool = True
 
+        # Speech text reveal is composed from glyph atlas, whole text lines are rendered by font with kerning:
+        self._glyph_atlas_status: bool = SettingsKeeper().get_glyph_atlas_text()
+
+        # Text sprites, text_type: Sprite.
+        # Texture of sprite is changed only if new text was rendered:
+        self._words_sprites: dict[str, Sprite] = {}
+        # text_type: ((text, color, font name, font size), text Surface).
+        self._words_surfaces: dict[str, tuple[tuple[str, str, str | None, int], Surface]] = {}
+
+        # Speech text reveal settings:
+        # Characters per second, 0 shows whole text at once:
+        self._text_reveal_speed: int = SettingsKeeper().get_text_reveal_speed()
+        self._text_reveal_start_time: int = time.get_ticks()
+        self._text_reveal_complete_status: bool = False
+        # (text, color, font name, font size) of revealed text, None if text is shown whole:
+        self._text_reveal_key: tuple[str, str, str | None, int] | None = None
+        self._text_reveal_glyph_atlas: GlyphAtlas | None = None
+        self._text_reveal_glyphs_places: list[tuple[tuple[int, int], Rect]] = []
+        # New glyphs are appended to two text Surfaces by turns,
+        # so Render sees new texture and last frame texture is not changed:
+        self._text_reveal_surfaces: list[Surface] = []
+        self._text_reveal_glyphs_counts: list[int] = []
+        self._text_reveal_surface_index: int = 0
+
     def _set_font(self, *, font_name: str | None):
         """
         :param font_name: String with font file name.
         :type font_name: str | None
         """
         self._font_name: str = font_name
-        if self._font_name is None:
-            self._used_font = font.Font(
-                font.get_default_font(),
-                self._font_size
-            )
-        else:
-            self._used_font: font.Font = self._asset_loader.font_load(
-                font_name=font_name,
-                font_size=self._font_size
-            )
+        self._used_font: font.Font = self._font_pool.get_font(
+            font_name=self._font_name,
+            font_size=self._font_size
+        )
 
     def make_words(self, *, text_string: str, text_color: str, text_type: str) -> Sprite:
         """
@@ -80,39 +101,199 @@ class DialoguesWords(SingletonPattern):
             self._font_coordinates: tuple[int, int] = self._character_speech_text_coordinates(
                 text_type='speech'
             )
-        self._set_font(font_name=self._font_name)
-        surface: Surface = self._used_font.render(
-                text_string,
-                True,
-                text_color
+        if text_type == 'words' and self._set_text_reveal(text_string=text_string, text_color=text_color) is True:
+            self.update_text_reveal()
+            surface: Surface = self._text_reveal_surfaces[self._text_reveal_surface_index]
+        else:
+            surface: Surface = self._get_words_surface(
+                text_string=text_string,
+                text_color=text_color,
+                text_type=text_type
             )
 
-        universal_texture_data: dict = {
-            "texture_type": text_type,
-            "texture_name": text_type,
-            "animation_name": "statick_frames",
-            "frame": text_type
-        }
-        self._texture_master.devnull_temporary_texture(
-            **universal_texture_data
-        )
+        # The same text Surface is not set again:
         self._texture_master.set_temporary_texture(
-            **universal_texture_data | {"surface": surface}
+            texture_type=text_type,
+            texture_name=text_type,
+            animation_name="statick_frames",
+            frame=text_type,
+            surface=surface
         )
-        return Sprite(
-            layer=4,
-            name=text_type,
-            texture_mame=text_type,
-            coordinates=self._font_coordinates,
-            sprite_size=surface.get_size(),
-            sprite_sheet_data={
-                "texture_type": text_type,
-                "sprite_sheet": False,
-                "statick_frames": {
-                    text_type: {}
+
+        words_sprite: Sprite | None = self._words_sprites.get(text_type)
+        if words_sprite is None:
+            words_sprite: Sprite = Sprite(
+                layer=4,
+                name=text_type,
+                texture_mame=text_type,
+                coordinates=self._font_coordinates,
+                sprite_size=surface.get_size(),
+                sprite_sheet_data={
+                    "texture_type": text_type,
+                    "sprite_sheet": False,
+                    "statick_frames": {
+                        text_type: {}
+                    }
                 }
-            }
+            )
+            self._words_sprites[text_type]: Sprite = words_sprite
+        words_sprite.set_coordinates(self._font_coordinates)
+        words_sprite.scale(surface.get_size())
+        return words_sprite
+
+    def _get_words_surface(self, *, text_string: str, text_color: str, text_type: str) -> Surface:
+        """
+        Get text Surface, text is rendered again only if it was changed.
+        :param text_string: String from StageDirector.text_dict value.
+        :type text_string: str
+        :param text_color: String with HTML color format.
+        :type text_color: str
+        :param text_type: String 'speaker' or 'words'
+        :type text_type: str
+        :return: Text Surface.
+        """
+        words_surface_key: tuple[str, str, str | None, int] = (
+            text_string, text_color, self._font_name, self._font_size
+        )
+        words_surface_data: tuple[tuple[str, str, str | None, int], Surface] | None = \
+            self._words_surfaces.get(text_type)
+        if words_surface_data is not None and words_surface_data[0] == words_surface_key:
+            return words_surface_data[1]
+
+        surface: Surface = self._font_pool.render_text(
+            text=text_string,
+            font_name=self._font_name,
+            font_size=self._font_size,
+            color=text_color
+        )
+        self._words_surfaces[text_type]: tuple[tuple[str, str, str | None, int], Surface] = (
+            words_surface_key, surface
+        )
+        return surface
+
+    def start_text_reveal(self):
+        """
+        Start speech text reveal from first glyph.
+        Used in StageDirector for every new reading scene.
+        """
+        self._text_reveal_start_time: int = time.get_ticks()
+        self._text_reveal_complete_status: bool = False
+        self._text_reveal_key: None = None
+
+    def _set_text_reveal(self, *, text_string: str, text_color: str) -> bool:
+        """
+        Prepare text Surfaces for speech text reveal.
+        Surfaces are prepared again only if text or font size was changed, revealed glyphs are drawn at next update.
+        :param text_string: String from StageDirector.text_dict value.
+        :type text_string: str
+        :param text_color: String with HTML color format.
+        :type text_color: str
+        :return: False if text must be shown whole.
+        """
+        if self._text_reveal_speed <= 0 or self._glyph_atlas_status is False:
+            return False
+
+        text_reveal_key: tuple[str, str, str | None, int] = (
+            text_string, text_color, self._font_name, self._font_size
+        )
+        if self._text_reveal_key == text_reveal_key:
+            return True
+
+        glyph_atlas: GlyphAtlas = self._glyph_atlas_keeper.get_atlas(
+            font_name=self._font_name,
+            font_size=self._font_size
         )
+        # Text with glyphs out of atlas is rendered by font:
+        if glyph_atlas.has_glyphs(text_string) is False:
+            self._text_reveal_key: None = None
+            return False
+
+        self._text_reveal_key: tuple[str, str, str | None, int] = text_reveal_key
+        self._text_reveal_glyph_atlas: GlyphAtlas = glyph_atlas
+        self._text_reveal_glyphs_places: list[tuple[tuple[int, int], Rect]] = \
+            glyph_atlas.get_glyphs_places(text_string)
+        text_size: tuple[int, int] = glyph_atlas.get_text_size(text_string)
+        self._text_reveal_surfaces: list[Surface] = [
+            Surface(text_size, SRCALPHA),
+            Surface(text_size, SRCALPHA)
+        ]
+        self._text_reveal_glyphs_counts: list[int] = [0, 0]
+        self._text_reveal_surface_index: int = 0
+        return True
+
+    def _get_text_reveal_glyphs_count(self) -> int:
+        """
+        Get number of glyphs which must be shown now.
+        """
+        glyphs_count: int = len(self._text_reveal_glyphs_places)
+        if self._text_reveal_complete_status is True:
+            return glyphs_count
+        return min(
+            (time.get_ticks() - self._text_reveal_start_time) * self._text_reveal_speed // 1000,
+            glyphs_count
+        )
+
+    def update_text_reveal(self):
+        """
+        Append newly revealed glyphs to speech text Surface.
+        Only glyphs which were not drawn yet are drawn, so frame cost does not depend on text length.
+        Texture switch damages only words sprite area, Layer recomposites its canvas only there.
+        Used in StageDirector every frame.
+        """
+        if self._text_reveal_key is None:
+            return
+
+        glyphs_count: int = self._get_text_reveal_glyphs_count()
+        if glyphs_count <= self._text_reveal_glyphs_counts[self._text_reveal_surface_index]:
+            return
+
+        # Surface of last frame is behind current one by glyphs of last reveal step:
+        surface_index: int = 1 - self._text_reveal_surface_index
+        self._text_reveal_glyph_atlas.blit_glyphs(
+            surface=self._text_reveal_surfaces[surface_index],
+            glyphs_places=self._text_reveal_glyphs_places[
+                self._text_reveal_glyphs_counts[surface_index]:glyphs_count
+            ],
+            color=self._text_reveal_key[1]
+        )
+        self._text_reveal_glyphs_counts[surface_index]: int = glyphs_count
+        self._text_reveal_surface_index: int = surface_index
+
+        self._texture_master.set_temporary_texture(
+            texture_type='words',
+            texture_name='words',
+            animation_name="statick_frames",
+            frame='words',
+            surface=self._text_reveal_surfaces[surface_index]
+        )
+
+    def complete_text_reveal(self) -> bool:
+        """
+        Show whole speech text at once.
+        Used in StageDirector.
+        :return: True if text was not revealed whole before.
+        """
+        if self._text_reveal_key is None or self._text_reveal_complete_status is True:
+            return False
+        if self._text_reveal_glyphs_counts[self._text_reveal_surface_index] >= len(self._text_reveal_glyphs_places):
+            return False
+
+        self._text_reveal_complete_status: bool = True
+        self.update_text_reveal()
+        return True
+
+    def get_text_reveal_deadline(self) -> int | None:
+        """
+        Get time of next glyph reveal.
+        Used in StageDirector for FrameScheduler idle mode.
+        :return: Time in "pygame.time.get_ticks" milliseconds or None if text is revealed whole.
+        """
+        if self._text_reveal_key is None or self._text_reveal_complete_status is True:
+            return None
+        glyphs_count: int = self._text_reveal_glyphs_counts[self._text_reveal_surface_index]
+        if glyphs_count >= len(self._text_reveal_glyphs_places):
+            return None
+        return self._text_reveal_start_time - (-(glyphs_count + 1) * 1000 // self._text_reveal_speed)
 
     def _character_speech_text_coordinates(self, *, text_type: str) -> tuple[int, int]:
         """
@@ -0,0 +1,228 @@
+from collections import OrderedDict
+
+from pygame import font, Surface, Rect, Color, SRCALPHA, BLEND_RGBA_MULT
+
+from ..Universal_computing.Font_Pool import FontPool
+from ..Universal_computing.Pattern_Singleton import SingletonPattern
+from ..Application_layer.Settings_Keeper import SettingsKeeper
+"""
+Contains the code of glyph atlas text render for dialogues.
+"""
+
+
+class GlyphAtlas:
+    """
+    Keep glyphs of one font and size in one Surface and compose text from glyphs rects.
+    Glyphs are rendered white once, atlas copies are colored for every text color.
+    Kerning pairs are not applied, glyphs are placed by their own widths.
+    Instances are created by GlyphAtlasKeeper.
+    """
+    # Width of atlas Surface in pixels:
+    _atlas_width: int = 1024
+    # Number of kept colored atlases:
+    _colored_atlases_limit: int = 8
+
+    def __init__(self, *, used_font: font.Font, glyphs: str):
+        """
+        :param used_font: Loaded font.
+        :type used_font: font.Font
+        :param glyphs: String with all glyphs of atlas.
+        :type glyphs: str
+        """
+        # Glyph: glyph Rect in atlas Surface.
+        self._glyphs_rects: dict[str, Rect] = {}
+        # Text color: colored atlas Surface, from least to most recently used.
+        self._colored_atlases: OrderedDict[str | tuple, Surface] = OrderedDict()
+
+        glyphs_surfaces: dict[str, Surface] = {
+            glyph: used_font.render(glyph, True, (255, 255, 255))
+            for glyph in glyphs
+        }
+        # Glyphs with descenders are higher than font height, all glyphs have the same top line:
+        self._glyph_height: int = max(
+            [used_font.get_height()] + [glyph_surface.get_height() for glyph_surface in glyphs_surfaces.values()]
+        )
+        self._line_height: int = used_font.get_linesize()
+
+        # Glyphs are packed in rows:
+        glyph_x, glyph_y = 0, 0
+        for glyph, glyph_surface in glyphs_surfaces.items():
+            if glyph_x + glyph_surface.get_width() > self._atlas_width:
+                glyph_x, glyph_y = 0, glyph_y + self._glyph_height
+            self._glyphs_rects[glyph]: Rect = Rect((glyph_x, glyph_y), glyph_surface.get_size())
+            glyph_x += glyph_surface.get_width()
+
+        self._atlas: Surface = Surface(
+            (self._atlas_width, glyph_y + self._glyph_height),
+            SRCALPHA
+        )
+        # Alpha blit to transparent Surface copies glyphs pixels as is:
+        self._atlas.blits(
+            [
+                (glyphs_surfaces[glyph], glyph_rect)
+                for glyph, glyph_rect in self._glyphs_rects.items()
+            ],
+            doreturn=False
+        )
+
+    def _get_colored_atlas(self, color: str | tuple) -> Surface:
+        """
+        Get atlas copy with glyphs of text color.
+        :param color: Text color.
+        :type color: str | tuple
+        :return: Colored atlas Surface.
+        """
+        colored_atlas: Surface | None = self._colored_atlases.get(color)
+        if colored_atlas is not None:
+            self._colored_atlases.move_to_end(color)
+            return colored_atlas
+
+        colored_atlas: Surface = self._atlas.copy()
+        colored_atlas.fill(
+            Color(color),
+            special_flags=BLEND_RGBA_MULT
+        )
+        self._colored_atlases[color]: Surface = colored_atlas
+        if len(self._colored_atlases) > self._colored_atlases_limit:
+            self._colored_atlases.popitem(last=False)
+        return colored_atlas
+
+    def has_glyphs(self, text: str) -> bool:
+        """
+        Check that atlas contains all glyphs of text.
+        :param text: Text string.
+        :type text: str
+        """
+        return all(glyph in self._glyphs_rects for glyph in text if glyph != '\n')
+
+    def get_text_size(self, text: str) -> tuple[int, int]:
+        """
+        Calculate size of composed text.
+        :param text: Text string, can contain line breaks.
+        :type text: str
+        :return: Tuple with width and height of text Surface.
+        """
+        rows: list[str] = text.split('\n')
+        return (
+            max(
+                sum(self._glyphs_rects[glyph].width for glyph in row)
+                for row in rows
+            ),
+            self._glyph_height + self._line_height * (len(rows) - 1)
+        )
+
+    def get_glyphs_places(self, text: str) -> list[tuple[tuple[int, int], Rect]]:
+        """
+        Calculate places of text glyphs in composed text Surface.
+        Used in DialoguesWords text reveal.
+        :param text: Text string, can contain line breaks.
+        :type text: str
+        :return: List with tuples of glyph coordinates and glyph Rect in atlas, line breaks are skipped.
+        """
+        glyphs_rects: dict[str, Rect] = self._glyphs_rects
+        result: list[tuple[tuple[int, int], Rect]] = []
+        for row_index, row in enumerate(text.split('\n')):
+            glyph_x: int = 0
+            glyph_y: int = row_index * self._line_height
+            for glyph in row:
+                glyph_rect: Rect = glyphs_rects[glyph]
+                result.append(
+                    ((glyph_x, glyph_y), glyph_rect)
+                )
+                glyph_x += glyph_rect.width
+        return result
+
+    def blit_glyphs(self, *, surface: Surface, glyphs_places: list[tuple[tuple[int, int], Rect]],
+                    color: str | tuple):
+        """
+        Draw glyphs on text Surface.
+        Used in DialoguesWords text reveal, so only new glyphs are drawn on already composed text.
+        :param surface: Transparent text Surface with size from get_text_size.
+        :type surface: Surface
+        :param glyphs_places: Places of glyphs from get_glyphs_places.
+        :type glyphs_places: list[tuple[tuple[int, int], Rect]]
+        :param color: Text color.
+        :type color: str | tuple
+        """
+        colored_atlas: Surface = self._get_colored_atlas(color)
+        surface.blits(
+            [
+                (colored_atlas, glyph_coordinates, glyph_rect)
+                for glyph_coordinates, glyph_rect in glyphs_places
+            ],
+            doreturn=False
+        )
+
+
+class GlyphAtlasKeeper(SingletonPattern):
+    """
+    Keep glyph atlases of dialogues fonts for current text language.
+    Atlas contains glyphs of all dialogues of language, so it is built only if font size or language is changed.
+    Used in DialoguesWords.
+    """
+    # Glyphs of text not from dialogues, as numbers and latin names:
+    _base_glyphs: str = "".join(chr(glyph_code) for glyph_code in range(32, 127))
+    # Number of kept atlases, font size is changed with window size:
+    _atlases_limit: int = 4
+
+    def __init__(self):
+        # Program layers settings:
+        self._font_pool: FontPool = FontPool()
+        self._settings_keeper: SettingsKeeper = SettingsKeeper()
+
+        # Atlases settings:
+        self._language_flag: str | None = None
+        self._language_glyphs: str = self._base_glyphs
+        # (font name, font size): GlyphAtlas, from least to most recently used.
+        self._atlases: OrderedDict[tuple[str | None, int], GlyphAtlas] = OrderedDict()
+
+    def _set_language(self, language_flag: str):
+        """
+        Collect glyphs of all dialogues of language and drop atlases of previous language.
+        :param language_flag: Text language flag.
+        :type language_flag: str
+        """
+        from .Dialogues import DialogueKeeper
+
+        glyphs: set[str] = set(self._base_glyphs)
+        reading_dialogues: dict = DialogueKeeper().get_dialogues_data().get("reading", {})
+        for scene_data in reading_dialogues.get(language_flag, {}).values():
+            glyphs.update(scene_data["who"]["text"])
+            glyphs.update(scene_data["what"]["text"])
+        glyphs.discard('\n')
+
+        self._language_flag: str = language_flag
+        self._language_glyphs: str = "".join(sorted(glyphs))
+        self._atlases.clear()
+
+    def get_atlas(self, *, font_name: str | None, font_size: int) -> GlyphAtlas:
+        """
+        Get glyph atlas of font for current text language, atlas is built on first request.
+        :param font_name: String with file name in '*/Fonts/*' folder.
+                          None for pygame default font.
+        :type font_name: str | None
+        :param font_size: Font size.
+        :type font_size: int
+        :return: GlyphAtlas
+        """
+        language_flag: str = self._settings_keeper.get_text_language()
+        if language_flag != self._language_flag:
+            self._set_language(language_flag)
+
+        atlas_key: tuple[str | None, int] = (font_name, font_size)
+        glyph_atlas: GlyphAtlas | None = self._atlases.get(atlas_key)
+        if glyph_atlas is not None:
+            self._atlases.move_to_end(atlas_key)
+            return glyph_atlas
+
+        glyph_atlas: GlyphAtlas = GlyphAtlas(
+            used_font=self._font_pool.get_font(
+                font_name=font_name,
+                font_size=font_size
+            ),
+            glyphs=self._language_glyphs
+        )
+        self._atlases[atlas_key]: GlyphAtlas = glyph_atlas
+        if len(self._atlases) > self._atlases_limit:
+            self._atlases.popitem(last=False)
+        return glyph_atlas
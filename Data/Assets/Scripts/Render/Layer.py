@@ -1,4 +1,4 @@
-from pygame import Surface, SRCALPHA
+from pygame import Surface, SRCALPHA, Rect
 
 from ..Application_layer.Settings_Keeper import SettingsKeeper
 from ..Render.Sprite import Sprite
@@ -10,26 +10,105 @@ Contains code for Layers.
 class Layer:
     """
     Layer keep sprites and draw it on oneself.
+    Layer canvas is kept between frames, only areas of changed sprites are recomposited.
     """
+    # Layers which are drawn straight to the display screen without canvas:
+    _opaque_layers_names: tuple[int | str] = (
+        1,  # Backgrounds.
+    )
+
     def __init__(self, key: int):
         self._screen = SettingsKeeper().get_window()
         self._name: str | int = key
         self.sprite_collection: list = []
         self._layer_canvas: Surface | None = None
+        self._render_data: list[tuple[Rect, Surface]] = []
+        # (sprite Rect as tuple, texture id) of last frame sprites, in draw order:
+        self._render_data_keys: list[tuple[tuple[int, int, int, int], int]] = []
+
+        # Canvas settings:
+        self._opaque: bool = self._name in self._opaque_layers_names
+        # Whole canvas must be recomposited:
+        self._canvas_status: bool = True
+        # Canvas areas of changed sprites, which must be recomposited:
+        self._canvas_damaged_areas: set[tuple[int, int, int, int]] = set()
 
     def initialization(self):
         """
-        Render sprites in layer canvas.
+        Render sprites in layer canvas, if layer sprites have changed.
+        Only damaged areas are recomposited, so cost of sprite change depends on sprite size, not on canvas size.
         """
-        self._layer_canvas: Surface = Surface(
-            (self._screen.get_width(), self._screen.get_height()),
-            SRCALPHA
-        )
+        if self._opaque is True:
+            return
+
+        screen_size: tuple[int, int] = (self._screen.get_width(), self._screen.get_height())
+        if self._layer_canvas is None or self._layer_canvas.get_size() != screen_size:
+            self._layer_canvas: Surface = Surface(
+                screen_size,
+                SRCALPHA
+            )
+            self._canvas_status: bool = True
+
+        if self._canvas_status is True:
+            self._layer_canvas.fill((0, 0, 0, 0))
+            for sprite_rect, texture in self._render_data:
+                self._layer_canvas.blit(texture, sprite_rect)
+
+        else:
+            for damaged_area in self._canvas_damaged_areas:
+                area: Rect = Rect(damaged_area)
+                self._layer_canvas.set_clip(area)
+                self._layer_canvas.fill((0, 0, 0, 0), area)
+                for sprite_rect, texture in self._render_data:
+                    if sprite_rect.colliderect(area):
+                        self._layer_canvas.blit(texture, sprite_rect)
+            self._layer_canvas.set_clip(None)
 
+        self._canvas_status: bool = False
+        self._canvas_damaged_areas.clear()
+
+    def update(self) -> list[tuple[Rect, Surface]]:
+        """
+        Switch sprites frames and collect their display areas with textures.
+        Used in Render for dirty rectangles search.
+        :return: List with tuples of sprite Rect and sprite texture Surface.
+        """
+        render_data: list[tuple[Rect, Surface]] = []
         for sprite in self.sprite_collection:
-            sprite.blit_to(
-                self._layer_canvas
+            sprite.update()
+            render_data.append(
+                sprite.get_render_data()
+            )
+
+        render_data_keys: list[tuple[tuple[int, int, int, int], int]] = [
+            (tuple(sprite_rect), id(texture))
+            for sprite_rect, texture in render_data
+        ]
+        if render_data_keys != self._render_data_keys:
+            changed_sprites: set[tuple[tuple[int, int, int, int], int]] = \
+                set(render_data_keys).symmetric_difference(self._render_data_keys)
+            if len(changed_sprites) == 0:
+                # Only draw order of sprites was changed:
+                self._canvas_status: bool = True
+            self._canvas_damaged_areas.update(
+                sprite_rect for sprite_rect, texture_id in changed_sprites
             )
+        self._render_data: list[tuple[Rect, Surface]] = render_data
+        self._render_data_keys: list[tuple[tuple[int, int, int, int], int]] = render_data_keys
+        return self._render_data
+
+    def get_next_frame_deadline(self) -> int | None:
+        """
+        Get the nearest animation frame switch time of layer sprites.
+        Used in Render idle mode.
+        :return: Time in "pygame.time.get_ticks" milliseconds or None if layer has no animations.
+        """
+        result: int | None = None
+        for sprite in self.sprite_collection:
+            sprite_deadline: int | None = sprite.get_next_frame_deadline()
+            if sprite_deadline is not None and (result is None or sprite_deadline < result):
+                result: int = sprite_deadline
+        return result
 
     def append(self, sprite: Sprite):
         """
@@ -45,7 +124,34 @@ class Layer:
 
     def draw(self):
         """
-        Render layer on display screen
+        Render layer on display screen.
+        Layer must be updated before.
         """
+        if self._opaque is True:
+            for sprite_rect, texture in self._render_data:
+                self._screen.blit(texture, sprite_rect)
+            return
+
         self.initialization()
         self._screen.blit(self._layer_canvas, (0, 0))
+
+    def draw_areas(self, areas: list[Rect]):
+        """
+        Render layer on display screen only inside damaged areas.
+        Layer must be updated before.
+        Used in Render dirty rectangles mode.
+        :param areas: List with damaged display areas.
+        :type areas: list[Rect]
+        """
+        if self._opaque is True:
+            for area in areas:
+                self._screen.set_clip(area)
+                for sprite_rect, texture in self._render_data:
+                    if sprite_rect.colliderect(area):
+                        self._screen.blit(texture, sprite_rect)
+            self._screen.set_clip(None)
+            return
+
+        self.initialization()
+        for area in areas:
+            self._screen.blit(self._layer_canvas, area, area)
@@ -1,4 +1,6 @@
-from pygame import display, Surface
+from collections import Counter
+
+from pygame import display, Surface, Rect
 
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
 from ..Application_layer.Settings_Keeper import SettingsKeeper
@@ -27,8 +29,27 @@ class Render(SingletonPattern):
         self.batch_collection: list = []
         self.sprite_collection: list = []
 
+        # Scene batches are rebuilt only after producers report changes:
         self.reset: bool = True
-        self.save_screen: Surface = self._settings_keeper.get_window()
+        self._scene_screen_size: tuple[int, int] = (0, 0)
+        # Copy of last reading scene image for game saves, taken only when it is needed:
+        self._save_screen: Surface = self._settings_keeper.get_window()
+        self._save_screen_outdated_status: bool = False
+
+        # Dirty rectangles render settings:
+        # "full" or "dirty_rectangles".
+        self._render_mode: str = self._settings_keeper.get_render_mode()
+        self._last_render_data: list[tuple[int | str, Rect, Surface]] = []
+        self._last_screen_size: tuple[int, int] = (0, 0)
+        # Part of display area after which the whole screen is redrawn:
+        self._full_redraw_area_factor: float = 0.5
+
+        # Idle mode settings:
+        self._frame_changed_status: bool = True
+
+        # Present settings:
+        # Display areas drawn by last image render, None for the whole display:
+        self._present_areas: list[Rect] | None = []
 
     def _screen_clear(self):
         """
@@ -41,15 +62,40 @@ class Render(SingletonPattern):
     def _render_devnull(self):
         """
         Devnull sprite, batch and layers collections.
+        Layers are kept with their canvases, only their sprites are removed.
         """
-        self.layers_collection.clear()
+        for layer in self.layers_collection.values():
+            layer.clear()
         self.batch_collection.clear()
         self.sprite_collection.clear()
 
+    def set_reset_status(self, status: bool = True):
+        """
+        Report scene changes, scene batches will be rebuilt before next frame render.
+        Used by changes producers: SceneValidator, StageDirector, InterfaceController, SaveKeeper, menus and buttons.
+        :param status: True if scene batches must be rebuilt.
+        :type status: bool
+        """
+        self.reset: bool = status
+
+    def set_full_redraw_status(self):
+        """
+        Redraw the whole display image in next frame.
+        For example after window expose.
+        Used in InputCommandsReactions.
+        """
+        self._last_screen_size: tuple[int, int] = (0, 0)
+
     def _initialization(self):
         """
         Prepare the scene for frame rendering.
+        Scene batches are retained between frames and rebuilt only after reset or window resize.
         """
+        screen_size: tuple[int, int] = (self._screen.get_width(), self._screen.get_height())
+        if self._scene_screen_size != screen_size:
+            self._scene_screen_size: tuple[int, int] = screen_size
+            self.reset: bool = True
+
         if self.reset is True:
             self._render_devnull()
 
@@ -79,16 +125,46 @@ class Render(SingletonPattern):
                     self._interface_controller.generate_menus_batch()
                 )
 
-    def _save_screen_prepare(self):
+        # Batch render initialization:
+            for batch in self.batch_collection:
+                if batch.active is True:
+                    batch.initialization()
+
+        # Single sprites render initialization:
+            if len(self.sprite_collection) > 0:
+                self._single_sprites_initialization()
+
+            self._layers_initialization()
+            self.reset: bool = False
+
+    def _get_save_screen_frame_status(self) -> bool:
         """
-        Collect screen for game save.
+        Check that display image is reading scene without menus.
         """
         from ..User_Interface.UI_Menus.UI_Game_menu import GameMenu
 
-        if self._interface_controller.gameplay_type_reading is True \
-                and self._interface_controller.menu_name is None\
-                and GameMenu().status is False:
-            self.save_screen: Surface = self._settings_keeper.get_window().convert()
+        return self._interface_controller.gameplay_type_reading is True \
+            and self._interface_controller.menu_name is None \
+            and GameMenu().status is False
+
+    def _save_screen_prepare(self):
+        """
+        Copy last reading scene image before it is covered by menu.
+        Called before frame render, so display still has last frame image.
+        """
+        if self._save_screen_outdated_status is True and self._get_save_screen_frame_status() is False:
+            self._save_screen: Surface = self._settings_keeper.get_window().convert()
+            self._save_screen_outdated_status: bool = False
+
+    def get_save_screen(self) -> Surface:
+        """
+        Get screen for game save, display image is copied only if it was changed after last copy.
+        Used in SaveKeeper.
+        """
+        if self._save_screen_outdated_status is True and self._get_save_screen_frame_status() is True:
+            self._save_screen: Surface = self._settings_keeper.get_window().convert()
+            self._save_screen_outdated_status: bool = False
+        return self._save_screen
 
     def _menu_screen_mask(self):
         """
@@ -116,7 +192,7 @@ class Render(SingletonPattern):
 
     def _layers_initialization(self):
         """
-        Sort layers.
+        Sort layers and remove layers without sprites.
         """
         if len(self.layers_collection) > 0:
             sorted_layers: list = sorted(
@@ -124,6 +200,7 @@ class Render(SingletonPattern):
             )
             self.layers_collection: dict = {
                 key: value for key, value in sorted_layers
+                if len(value.sprite_collection) > 0
             }
 
     def _single_sprites_initialization(self):
@@ -144,31 +221,172 @@ class Render(SingletonPattern):
                 if sprite not in self.layers_collection[sprite_layer].sprite_collection:
                     self.layers_collection[sprite_layer].append(sprite)
 
-    def image_render(self):
+    def _get_damaged_areas(self, render_data: list[tuple[int | str, Rect, Surface]]) -> list[Rect]:
         """
-        Render image on display screen.
+        Compare sprites of the current frame with sprites of the last frame.
+        :param render_data: List with tuples of layer name, sprite Rect and sprite texture Surface.
+        :type render_data: list[tuple[int | str, Rect, Surface]]
+        :return: List with display areas for redraw.
         """
-        # Clear old screen:
-        self._screen_clear()
+        screen_rect: Rect = self._screen.get_rect()
 
-        # Render initialization:
-        self._initialization()
+        # Screen size changed:
+        if self._last_screen_size != screen_rect.size:
+            self._last_screen_size: tuple[int, int] = screen_rect.size
+            return [screen_rect]
 
-        # Batch render initialization:
-        if len(self.batch_collection) > 0:
-            for batch in self.batch_collection:
-                if batch.active is True:
-                    batch.initialization()
+        # Nothing changed:
+        if render_data == self._last_render_data:
+            return []
 
-        # Single sprites render initialization:
-        if len(self.sprite_collection) > 0:
-            self._single_sprites_initialization()
+        # Textures are compared by identity, last frame data keeps them alive:
+        render_data_counter: Counter = Counter(
+            (layer_name, tuple(sprite_rect), id(texture))
+            for layer_name, sprite_rect, texture in render_data
+        )
+        last_render_data_counter: Counter = Counter(
+            (layer_name, tuple(sprite_rect), id(texture))
+            for layer_name, sprite_rect, texture in self._last_render_data
+        )
+        changed_sprites: Counter = \
+            (render_data_counter - last_render_data_counter) \
+            + (last_render_data_counter - render_data_counter)
+
+        # Only the drawing order changed:
+        if len(changed_sprites) == 0:
+            return [screen_rect]
+
+        damaged_areas: list[Rect] = []
+        for layer_name, sprite_rect, texture_id in changed_sprites:
+            area: Rect = Rect(sprite_rect).clip(screen_rect)
+            if area.width == 0 or area.height == 0:
+                continue
+            # Merge intersecting areas:
+            area_index: int = area.collidelist(damaged_areas)
+            while area_index != -1:
+                area.union_ip(
+                    damaged_areas.pop(area_index)
+                )
+                area_index: int = area.collidelist(damaged_areas)
+            damaged_areas.append(area)
+
+        damaged_area_size: int = sum(
+            area.width * area.height
+            for area in damaged_areas
+        )
+        if damaged_area_size >= screen_rect.width * screen_rect.height * self._full_redraw_area_factor:
+            return [screen_rect]
+        return damaged_areas
+
+    def _update_layers(self) -> list[tuple[int | str, Rect, Surface]]:
+        """
+        Switch sprites frames in all layers and collect frame render data.
+        :return: List with tuples of layer name, sprite Rect and sprite texture Surface.
+        """
+        render_data: list[tuple[int | str, Rect, Surface]] = []
+        for layer_name, layer in self.layers_collection.items():
+            for sprite_rect, texture in layer.update():
+                render_data.append(
+                    (layer_name, sprite_rect, texture)
+                )
+        return render_data
+
+    def _dirty_rectangles_render(self) -> bool:
+        """
+        Redraw only display areas with moved, appeared, vanished or changed sprites.
+        :return: True if display image was changed.
+        """
+        render_data: list[tuple[int | str, Rect, Surface]] = self._update_layers()
+
+        damaged_areas: list[Rect] = self._get_damaged_areas(render_data)
+        self._last_render_data: list[tuple[int | str, Rect, Surface]] = render_data
+        self._present_areas: list[Rect] = damaged_areas
+        if len(damaged_areas) == 0:
+            return False
+
+        # Clear damaged areas:
+        for area in damaged_areas:
+            self._screen.fill(
+                (0, 0, 0),
+                area
+            )
+        # Redraw damaged areas:
+        for layer in self.layers_collection.values():
+            layer.draw_areas(damaged_areas)
+        return True
+
+    def _full_render(self) -> bool:
+        """
+        Redraw the whole display image.
+        :return: True if display image was changed.
+        """
+        render_data: list[tuple[int | str, Rect, Surface]] = self._update_layers()
+        screen_size: tuple[int, int] = (self._screen.get_width(), self._screen.get_height())
+        frame_changed_status: bool = \
+            render_data != self._last_render_data or screen_size != self._last_screen_size
+        self._last_render_data: list[tuple[int | str, Rect, Surface]] = render_data
+        self._last_screen_size: tuple[int, int] = screen_size
+
+        # Clear old screen:
+        self._screen_clear()
 
-        # Display image render:
-        self._layers_initialization()
         for layer in self.layers_collection.values():
             layer.draw()
+        self._present_areas: None = None
+        return frame_changed_status
+
+    def get_frame_changed_status(self) -> bool:
+        """
+        Used in FrameScheduler idle mode.
+        :return: False if last frame had no scene changes and display image was not changed.
+        """
+        return self._frame_changed_status
 
+    def get_next_frame_deadline(self) -> int | None:
+        """
+        Get the nearest animation frame switch time of scene sprites.
+        Used in FrameScheduler idle mode.
+        :return: Time in "pygame.time.get_ticks" milliseconds or None if scene has no animations.
+        """
+        result: int | None = None
+        for layer in self.layers_collection.values():
+            layer_deadline: int | None = layer.get_next_frame_deadline()
+            if layer_deadline is not None and (result is None or layer_deadline < result):
+                result: int = layer_deadline
+        return result
+
+    def present(self):
+        """
+        Show display image drawn by last image render.
+        Flip only damaged areas in dirty rectangles mode.
+        Used in GameMaster after image_render.
+        """
         # Flip all surfaces:
-        display.update()
+        if self._present_areas is None:
+            display.update()
+        # Flip only damaged areas:
+        elif len(self._present_areas) > 0:
+            display.update(self._present_areas)
+        self._present_areas: list[Rect] = []
+
+    def image_render(self):
+        """
+        Render image on display screen surface.
+        Image is shown by present.
+        """
+        # Scene changes reported before frame:
+        scene_changed_status: bool = self.reset
         self._save_screen_prepare()
+
+        # Render initialization:
+        self._initialization()
+
+        # Display image render:
+        if self._render_mode == "dirty_rectangles":
+            image_changed_status: bool = self._dirty_rectangles_render()
+        else:
+            image_changed_status: bool = self._full_render()
+        self._frame_changed_status: bool = scene_changed_status or image_changed_status
+
+        if self._frame_changed_status is True and self._get_save_screen_frame_status() is True:
+            self._save_screen_outdated_status: bool = True
@@ -1,6 +1,6 @@
 from random import randint
 
-from pygame import Surface, time, transform
+from pygame import Surface, Rect, time, transform
 
 from .Texture_Master import TexturesMaster
 """
@@ -12,6 +12,13 @@ class Sprite:
     """
     Spites uses in batch rendering.
     """
+    __slots__ = (
+        "_texture_master", "_name", "_layer", "_coordinates", "_texture_id", "_sprite_sheet_data",
+        "_frame_time", "_image_size", "_animations_table", "_animation_name", "_frames_count",
+        "_frame_duration", "_frame_keys", "_sprite_sheet_frame", "_pause_duration", "_texture_handle",
+        "_scene_name", "_recache_status", "_temporary_texture", "_temporary_texture_key"
+    )
+
     def __init__(
             self, *, layer: int = 1,
             coordinates: tuple[int, int] = (0, 0),
@@ -63,13 +70,69 @@ class Sprite:
         self._image_size: tuple[int, int] = sprite_size
 
         # Sprite sheet animation data:
+        # Animation name: (frames count, frame duration in milliseconds, frames names in TexturesMaster).
+        self._animations_table: dict[str, tuple[int, float, tuple[str, ...]]] = self._get_animations_table()
         self._animation_name: str = self._get_default_animation_name()
+        self._frames_count: int = 0
+        self._frame_duration: float = 0.0
+        self._frame_keys: tuple[str, ...] = ()
+        self._set_animation_table()
         self._sprite_sheet_frame: int | str = self._get_sprite_frame_name()
-        self._pause_duration: int = randint(2, 5)
+        # Pause between animation cycles in milliseconds:
+        self._pause_duration: int = randint(2, 5) * 1000
+        self._texture_handle: int = 0
+        self._set_texture_handle()
 
         # Render settings:
         self._scene_name: str | None = None
         self._recache_status: bool = True
+        self._temporary_texture: Surface | None = None
+        self._temporary_texture_key: tuple | None = None
+
+    def _get_animations_table(self) -> dict[str, tuple[int, float, tuple[str, ...]]]:
+        """
+        Precompute frames count, frame duration and frames names of all sprite sheet animations.
+        :return: Dict with animations names keys and tuples with animations data.
+        """
+        if self._sprite_sheet_data is None or self._sprite_sheet_data["sprite_sheet"] is False:
+            return {}
+
+        result: dict[str, tuple[int, float, tuple[str, ...]]] = {}
+        for animation_name, animation_data in self._sprite_sheet_data["animations"].items():
+            frames_count: int = len(animation_data["frames"])
+            result[animation_name]: tuple[int, float, tuple[str, ...]] = (
+                frames_count,
+                animation_data["time_duration"] * 1000 / frames_count,
+                tuple(
+                    str(frame) for frame in range(1, frames_count + 1)
+                )
+            )
+        return result
+
+    def _set_animation_table(self):
+        """
+        Set current animation data from animations table.
+        """
+        self._frames_count, self._frame_duration, self._frame_keys = self._animations_table.get(
+            self._animation_name,
+            (0, 0.0, ())
+        )
+
+    def _set_texture_handle(self):
+        """
+        Resolve TexturesMaster handle of current frame.
+        Called only when animation or frame is switched.
+        """
+        if self._animation_name != "statick_frames" and 0 < self._sprite_sheet_frame <= self._frames_count:
+            frame: str = self._frame_keys[self._sprite_sheet_frame - 1]
+        else:
+            frame: str = str(self._sprite_sheet_frame)
+        self._texture_handle: int = self._texture_master.get_texture_handle(
+            texture_type=self._sprite_sheet_data["texture_type"],
+            texture_name=self._texture_id,
+            animation_name=self._animation_name,
+            frame=frame
+        )
 
     def _get_default_animation_name(self) -> str | None:
         """
@@ -111,85 +174,75 @@ class Sprite:
         """
         Recache sprite in TextureMaster if necessary.
         """
-        universal_parameters: dict = {
-            "texture_type": self._sprite_sheet_data["texture_type"],
-            "texture_name": self._texture_id,
-            "animation_name": self._animation_name,
-            "frame": self._sprite_sheet_frame
-        }
+        texture_handle: int = self._texture_handle
         # No scaling required:
-        if self._texture_master.get_texture_size(
-                **universal_parameters
-        ) == self._image_size:
+        if self._texture_master.get_texture_size_by_handle(texture_handle) == self._image_size:
             return
 
         # Temporary texture:
         if self._recache_status is False:
-            temporary_texture: Surface = Surface(self._image_size)
-            temporary_texture.blit(
-                transform.scale(
-                    surface=self._texture_master.get_texture(
-                        **universal_parameters
+            temporary_texture_key: tuple = (self._animation_name, self._sprite_sheet_frame, self._image_size)
+            if self._temporary_texture_key != temporary_texture_key:
+                temporary_texture: Surface = Surface(self._image_size)
+                temporary_texture.blit(
+                    transform.scale(
+                        surface=self._texture_master.get_texture_by_handle(texture_handle),
+                        size=self._image_size
                     ),
-                    size=self._image_size
-                ),
-                (0, 0)
-            )
-            self._texture_master.set_temporary_texture(
-                **universal_parameters,
-                surface=temporary_texture
+                    (0, 0)
+                )
+                self._temporary_texture: Surface = temporary_texture
+                self._temporary_texture_key: tuple = temporary_texture_key
+
+            # The same Surface is reused while the frame and size are the same,
+            # so the dirty rectangles render does not see a new texture every frame:
+            self._texture_master.set_temporary_texture_by_handle(
+                texture_handle,
+                self._temporary_texture
             )
             return
 
         # Texture caching:
-        self._texture_master.set_new_scale_frame(
-            **universal_parameters,
-            image_size=self._image_size
+        self._texture_master.set_new_scale_frame_by_handle(
+            texture_handle,
+            self._image_size
         )
 
-    def blit_to(self, any_surface: Surface):
+    def update(self):
         """
-        Draw sprite image on surface.
-        Can be used in Render, Layer classes in context of render pipline.
-        :param any_surface: Any Surface.
-        :type any_surface: Surface
+        Switch animation frame and recache sprite texture before render.
+        Used in Layer.
         """
         self._sprite_sheet_next_frame()
         self._recache_sprite()
-        any_surface.blit(
-            self._texture_master.get_texture(
-                texture_type=self._sprite_sheet_data["texture_type"],
-                texture_name=self._texture_id,
-                animation_name=self._animation_name,
-                frame=self._sprite_sheet_frame
-            ),
-            self._coordinates
-        )
 
-    def blit(self, any_surface: Surface, coordinates: tuple[int, int]):
+    def get_texture(self) -> Surface:
         """
-        Draw surface image on Sprite texture and crate temporary texture for TextureMaster.
-        Can be use in Buttons in context of UI image Render pipline.
+        Get current frame texture Surface.
+        Used in Layer.
+        """
+        return self._texture_master.get_texture_by_handle(self._texture_handle)
+
+    def get_render_data(self) -> tuple[Rect, Surface]:
+        """
+        Get display area and texture of current frame with one TexturesMaster lookup.
+        Used in Layer.
+        :return: Tuple with sprite Rect and sprite texture Surface.
+        """
+        texture: Surface = self._texture_master.get_texture_by_handle(self._texture_handle)
+        return Rect(self._coordinates, texture.get_size()), texture
+
+    def blit_to(self, any_surface: Surface):
+        """
+        Draw sprite image on surface.
+        Can be used in Render, Layer classes in context of render pipline.
         :param any_surface: Any Surface.
         :type any_surface: Surface
-        :param coordinates: Render coordinates.
-        :type coordinates: tuple[int, int]
         """
-        self._recache_sprite()
-        temporary_texture: Surface = self._texture_master.get_texture(
-            texture_type=self._sprite_sheet_data["texture_type"],
-            texture_name=self._texture_id,
-            animation_name=self._animation_name,
-            frame=self._sprite_sheet_frame
-        )
-        temporary_texture.blit(
-            any_surface,
-            coordinates
-        )
-        self._texture_master.set_temporary_texture(
-            texture_type=self._sprite_sheet_data["texture_type"],
-            texture_name=self._texture_id,
-            surface=temporary_texture
+        self.update()
+        any_surface.blit(
+            self.get_texture(),
+            self._coordinates
         )
 
     def _sprite_sheet_next_frame(self):
@@ -203,6 +256,8 @@ class Sprite:
             self._animation_name: str = list(
                 self._sprite_sheet_data.keys()
             )[0]
+            self._set_animation_table()
+            self._set_texture_handle()
 
         if self._animation_name == "statick_frames":
             return
@@ -234,31 +289,41 @@ class Sprite:
 
         # Animation frame:
         current_time_frame: int = time.get_ticks()
+        frame_elapsed_time: int = current_time_frame - self._frame_time
 
         # Animation pause:
-        if (current_time_frame - self._frame_time) / 1000 >= self._pause_duration:
+        if frame_elapsed_time >= self._pause_duration:
             self._frame_time: int = current_time_frame
             return self._sprite_sheet_frame
 
         # Switch animation frame:
-        if (current_time_frame - self._frame_time) / 1000 >= (
-                self._sprite_sheet_data["animations"][self._animation_name]["time_duration"]
-                / len(self._sprite_sheet_data["animations"][self._animation_name]["frames"])
-        ):
+        if frame_elapsed_time >= self._frame_duration:
             # Next frame of animation:
-            if self._sprite_sheet_frame + 1 <= len(
-                        self._sprite_sheet_data["animations"][self._animation_name]["frames"]
-            ):
+            if self._sprite_sheet_frame < self._frames_count:
                 self._sprite_sheet_frame += 1
                 self._frame_time: int = current_time_frame
             # End of animation sprite sheet:
             else:
                 self._sprite_sheet_frame: int = 1
-                self._pause_duration: int = randint(2, 5)
-                self._frame_time: int = current_time_frame + self._pause_duration * 1000  # TODO: Crutch
+                self._pause_duration: int = randint(2, 5) * 1000
+                self._frame_time: int = current_time_frame + self._pause_duration  # TODO: Crutch
+            self._set_texture_handle()
 
         return self._sprite_sheet_frame
 
+    def get_next_frame_deadline(self) -> int | None:
+        """
+        Get time of next animation frame switch.
+        Used in Layer for Render idle mode.
+        :return: Time in "pygame.time.get_ticks" milliseconds or None for statick sprites.
+        """
+        if self._sprite_sheet_data is None or self._animation_name == "statick_frames":
+            return None
+
+        return self._frame_time + int(
+            min(self._frame_duration, self._pause_duration)
+        )
+
     def set_recache_status(self, recache_status: bool = True):
         """
         :param recache_status: If there is no need to cache the sprite texture, a temporary image will be created.
@@ -279,6 +344,8 @@ class Sprite:
         Set new animation to play.
         """
         self._animation_name: str = animation_name
+        self._set_animation_table()
+        self._set_texture_handle()
 
     def set_coordinates(self, current_coordinates: tuple[int, int]):
         """
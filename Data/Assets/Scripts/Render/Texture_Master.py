@@ -1,9 +1,13 @@
-from typing import Callable
+import logging
+from typing import Iterable
+from collections import OrderedDict
 
-from pygame import Surface, SRCALPHA, transform
+from pygame import Surface, SRCALPHA, transform, Rect
 
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
 from ..Universal_computing.Assets_load import AssetLoader
+from ..Universal_computing.Texture_Disk_Cache import TextureDiskCache
+from ..Application_layer.Settings_Keeper import SettingsKeeper
 """
 Contains code responsible for collecting and storing textures.
 """
@@ -13,6 +17,15 @@ class TexturesMaster(SingletonPattern):
     """
     Storing textures data for image calculation.
     """
+    # Catalogs of texture memory accounting:
+    # "raw" - not scaled frames of configured and UI textures,
+    # "static" - textures loaded by path, as save slots screen previews,
+    # "scaled" - scaled frames in memory pool,
+    # "temporary" - textures generated by game objects and Sprites.
+    _memory_catalogs_names: tuple[str, ...] = ("raw", "static", "scaled", "temporary")
+    # Number of the largest textures per texture type in memory log dump:
+    _memory_log_textures_limit: int = 5
+
     def __init__(self):
         # Program layers settings:
         self._asset_loader: AssetLoader = AssetLoader()
@@ -23,13 +36,54 @@ class TexturesMaster(SingletonPattern):
             "Backgrounds": "backgrounds_sprites"
         }
         self._texture_configs_catalog: dict = {}
-        self._raw_images_catalog: dict = {}
         self._raw_textures_catalog: dict = {
             "User_Interface": {}
         }
-        self._texture_catalog: dict = {}
         self._image_memory_pool_bytes: int = 262144000  # 250mb as default
-        self._temporary_textures: dict = {}
+
+        # Texture frames handles:
+        # (texture type, texture name, animation name, frame name): handle.
+        self._texture_handles: dict[tuple[str, str, str, str], int] = {}
+        # Lists indexed by handle:
+        self._handles_keys: list[tuple[str, str, str, str]] = []
+        # Scaled or raw frames, None if frame is not resolved yet:
+        self._handles_textures: list[Surface | None] = []
+        self._handles_temporary_textures: list[Surface | None] = []
+
+        # Memory pool of scaled frames, from least to most recently used: handle: bytes.
+        self._memory_pool: OrderedDict[int, int] = OrderedDict()
+        # Temporary textures are not evicted, they take only this part of memory pool from scaled frames:
+        self._temporary_memory_limit_bytes: int = self._image_memory_pool_bytes // 2
+        # Evicted scaled frames, scaled again frame means that scene needs more memory than pool size:
+        self._evicted_handles: set[int] = set()
+        # Memory pool warnings already written to log file:
+        self._memory_pool_warnings: set[str] = set()
+
+        # Texture memory accounting:
+        # catalog name: (texture type, texture name): [surfaces number, pixels bytes].
+        self._memory_usage: dict[str, dict[tuple[str, str | None], list[int]]] = {
+            catalog_name: {} for catalog_name in self._memory_catalogs_names
+        }
+        self._memory_usage_bytes: dict[str, int] = {
+            catalog_name: 0 for catalog_name in self._memory_catalogs_names
+        }
+        self._memory_usage_peak_bytes: dict[str, int] = {
+            catalog_name: 0 for catalog_name in self._memory_catalogs_names
+        }
+        self._memory_usage_total_peak_bytes: int = 0
+
+        # Raw sprite sheet frames are views into loaded images, without copying pixels:
+        self._subsurface_frames: bool = SettingsKeeper().get_subsurface_texture_frames()
+        # Characters and Backgrounds images are loaded on first request:
+        self._lazy_loading: bool = SettingsKeeper().get_lazy_texture_loading()
+
+        # Scaled frames from previous launches:
+        self._texture_disk_cache: TextureDiskCache = TextureDiskCache()
+        # (texture type, texture name): source image file hash.
+        self._textures_files_hashes: dict[tuple[str, str], str] = {}
+        # Handles of frames scaled in current launch, cache is read only for first scale of frame at cold start.
+        # Later scales are window resizes, their sizes are not cached yet:
+        self._scaled_handles: set[int] = set()
 
         # TexturesMaster settings:
         self.__initialisation()
@@ -48,13 +102,16 @@ class TexturesMaster(SingletonPattern):
 
     def __initialisation(self):
         """
-        Collect raw texture data and create sprite sheets.
+        Collect texture configurations and create sprite sheets.
         """
-        # Collect raw textures:
+        # Collect texture configurations:
         self._collect_texture_configurations()
-        self._collect_raw_images()
-        self._create_raw_sprite_sheet_frames()
-        self._raw_images_catalog.clear()
+        for texture_type in self._texture_configs_catalog:
+            self._raw_textures_catalog.update(
+                {
+                    texture_type: {}
+                }
+            )
 
         # Create technical textures:
         self._create_void_background()
@@ -63,16 +120,59 @@ class TexturesMaster(SingletonPattern):
         # Collect raw UI textures:
         self._collect_raw_ui_images()
 
-        # Create texture catalog:
-        deep_copy_surfaces: Callable = lambda dict_to_copy: {
-            key: (
-                value.copy() if isinstance(value, Surface)
-                else deep_copy_surfaces(value) if isinstance(value, dict)
-                else value
+        # Collect raw textures, in lazy mode they are loaded on first request:
+        if self._lazy_loading is False:
+            for texture_type, texture_collection in self._texture_configs_catalog.items():
+                self.preload(texture_type, texture_collection)
+
+    def preload(self, texture_type: str, texture_names: Iterable[str],
+                decoded_images: dict[str, Surface] | None = None):
+        """
+        Load texture images and create their sprite sheets, if they are not loaded yet.
+        Can be used for warming textures before scene start.
+        :param texture_type: Characters|Backgrounds
+        :type texture_type: str
+        :param texture_names: Names of textures from texture configurations.
+        :type texture_names: Iterable[str]
+        :param decoded_images: Images decoded in worker thread by AssetLoader, as example by ScenePrefetcher.
+        :type decoded_images: dict[str, Surface] | None
+        """
+        textures_images: dict[str, Surface] = self._asset_loader.image_load_many(
+            art_names=[
+                texture_name for texture_name in texture_names
+                if texture_name not in self._raw_textures_catalog[texture_type]
+            ],
+            asset_type=texture_type,
+            decoded_images=decoded_images
+        )
+        for texture_name, texture_image in textures_images.items():
+            self._set_texture_file_hash(
+                texture_type=texture_type,
+                texture_name=texture_name
             )
-            for key, value in dict_to_copy.items()
-        }
-        self._texture_catalog: dict = deep_copy_surfaces(self._raw_textures_catalog)
+            self._create_raw_sprite_sheet_frames(
+                texture_type=texture_type,
+                texture_name=texture_name,
+                texture_image=texture_image
+            )
+
+    def get_texture_loaded_status(self, texture_type: str, texture_name: str) -> bool:
+        """
+        Used in ScenePrefetcher.
+        :return: True if texture image is loaded and its sprite sheet is created.
+        """
+        return texture_name in self._raw_textures_catalog[texture_type]
+
+    def _lazy_load(self, texture_type: str, texture_name: str):
+        """
+        Load texture on first request, if it has configuration and is not loaded yet.
+        :param texture_type: Characters|Backgrounds|User_Interface
+        :type texture_type: str
+        :param texture_name: Name of texture.
+        :type texture_name: str
+        """
+        if texture_name in self._texture_configs_catalog.get(texture_type, {}):
+            self.preload(texture_type, (texture_name,))
 
     def _collect_raw_ui_images(self):
         """
@@ -84,18 +184,23 @@ class TexturesMaster(SingletonPattern):
             ]
         )
         for catalog_name in raw_ui_data:
-            for texture_image_name in raw_ui_data[catalog_name]:
-                raw_image_surface: Surface = self._asset_loader.image_load(
-                    art_name=texture_image_name,
-                    asset_type="User_Interface",
+            raw_images_surfaces: dict[str, Surface] = self._asset_loader.image_load_many(
+                art_names=raw_ui_data[catalog_name],
+                asset_type="User_Interface",
+                file_catalog=catalog_name
+            )
+            for texture_image_name, raw_image_surface in raw_images_surfaces.items():
+                self._set_texture_file_hash(
+                    texture_type="User_Interface",
+                    texture_name=texture_image_name,
                     file_catalog=catalog_name
                 )
-                self._raw_textures_catalog["User_Interface"].update(
-                    {
-                        texture_image_name: {
-                            "statick_frames": {
-                                texture_image_name: raw_image_surface
-                            }
+                self._set_raw_texture(
+                    texture_type="User_Interface",
+                    texture_name=texture_image_name,
+                    raw_texture={
+                        "statick_frames": {
+                            texture_image_name: raw_image_surface
                         }
                     }
                 )
@@ -127,49 +232,29 @@ class TexturesMaster(SingletonPattern):
                 }
         :type asset_type: str
         """
-        self._raw_textures_catalog[texture_type].update(
-            {
-                texture_path: {
-                    "statick_frames": {
-                        texture_path: self._asset_loader.image_load(
-                            art_name=texture_path,
-                            asset_type=asset_type,
-                            art_name_is_path=True
-                        )
-                    }
+        self._set_raw_texture(
+            texture_type=texture_type,
+            texture_name=texture_path,
+            raw_texture={
+                "statick_frames": {
+                    texture_path: self._asset_loader.image_load(
+                        art_name=texture_path,
+                        asset_type=asset_type,
+                        art_name_is_path=True
+                    )
                 }
-            }
+            },
+            catalog_name="static"
         )
 
-        if texture_type not in self._texture_catalog:
-            self._texture_catalog.update(
-                {
-                    texture_type: {}
-                }
-            )
-
-        if texture_path not in self._texture_catalog[texture_type]:
-            self._texture_catalog[texture_type].update(
-                {
-                    texture_path: {}
-                }
-            )
-
-        self._texture_catalog[texture_type][texture_path].update(
-            {
-                "statick_frames": {
-                    texture_path: self._raw_textures_catalog[
-                        texture_type
-                    ][
-                        texture_path
-                    ][
-                        "statick_frames"
-                    ][
-                        texture_path
-                    ].copy()
-                }
-            }
+        # Texture can be reloaded from the same path, as example after new save:
+        texture_handle: int = self.get_texture_handle(
+            texture_type=texture_type,
+            texture_name=texture_path,
+            frame=texture_path
         )
+        self._memory_pool_remove(texture_handle)
+        self._handles_textures[texture_handle]: None = None
 
     def _create_void_background(self):
         """
@@ -181,12 +266,12 @@ class TexturesMaster(SingletonPattern):
         void_surface.fill(
             (0, 0, 0)
         )
-        self._raw_textures_catalog["Backgrounds"].update(
-            {
-                None: {
-                    "statick_frames": {
-                        "void_texture": void_surface
-                    }
+        self._set_raw_texture(
+            texture_type="Backgrounds",
+            texture_name=None,
+            raw_texture={
+                "statick_frames": {
+                    "void_texture": void_surface
                 }
             }
         )
@@ -203,16 +288,86 @@ class TexturesMaster(SingletonPattern):
             (0, 0, 0)
         )
         screen_mask.set_alpha(210)
-        self._raw_textures_catalog["Backgrounds"].update(
-            {
-                "ui#screen_mask": {
-                    "statick_frames": {
-                        "screen_mask": screen_mask
-                    }
+        self._set_raw_texture(
+            texture_type="Backgrounds",
+            texture_name="ui#screen_mask",
+            raw_texture={
+                "statick_frames": {
+                    "screen_mask": screen_mask
                 }
             }
         )
 
+    def get_texture_handle(self, *, texture_type: str, texture_name: str | None,
+                           animation_name: str = "statick_frames", frame: int | str = 0) -> int:
+        """
+        Get integer handle of texture frame for access without catalogs lookups.
+        Handle is created on first request and can be resolved before texture loading.
+        Use in Sprites.
+        :param texture_type: Characters|Backgrounds|User_Interface
+        :type texture_type: str
+        :param texture_name: Name of texture.
+        :type texture_name: str | None
+        :param animation_name: Animation name of sprite sheet.
+        :type animation_name: str
+        :param frame: Animation frame number, or frame name for statick images.
+        :type frame: int | str
+        :return: Texture frame handle.
+        """
+        texture_key: tuple[str, str, str, str] = (texture_type, texture_name, animation_name, str(frame))
+        texture_handle: int | None = self._texture_handles.get(texture_key)
+        if texture_handle is None:
+            texture_handle: int = len(self._handles_keys)
+            self._texture_handles[texture_key]: int = texture_handle
+            self._handles_keys.append(texture_key)
+            self._handles_textures.append(None)
+            self._handles_temporary_textures.append(None)
+        return texture_handle
+
+    def _get_raw_texture(self, texture_handle: int) -> Surface:
+        """
+        Get not scaled frame of texture handle.
+        Texture is loaded on first request in lazy mode.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        :return: Raw frame Surface.
+        """
+        texture_type, texture_name, animation_name, frame = self._handles_keys[texture_handle]
+        if texture_name not in self._raw_textures_catalog[texture_type]:
+            self._lazy_load(texture_type, texture_name)
+        return self._raw_textures_catalog[texture_type][texture_name][animation_name][frame]
+
+    def get_texture_by_handle(self, texture_handle: int) -> Surface:
+        """
+        Get texture Surface by texture frame handle.
+        Temporary texture has priority over scaled or raw frame.
+        Use in Sprites.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        :return: Texture frame Surface
+        """
+        texture: Surface | None = self._handles_temporary_textures[texture_handle]
+        if texture is not None:
+            return texture
+
+        texture: Surface | None = self._handles_textures[texture_handle]
+        if texture is None:
+            texture: Surface = self._get_raw_texture(texture_handle)
+            self._handles_textures[texture_handle]: Surface = texture
+        # Mark scaled frame as recently used:
+        elif texture_handle in self._memory_pool:
+            self._memory_pool.move_to_end(texture_handle)
+        return texture
+
+    def get_texture_size_by_handle(self, texture_handle: int) -> tuple[int, int]:
+        """
+        Get texture size by texture frame handle.
+        Use in Sprites.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        """
+        return self.get_texture_by_handle(texture_handle).get_size()
+
     def get_texture(self, *, texture_type: str, texture_name: str,
                     animation_name: str, frame: int | str) -> Surface:
         """
@@ -227,10 +382,265 @@ class TexturesMaster(SingletonPattern):
         :type frame: int | str
         :return: Texture frame Surface
         """
-        try:
-            return self._temporary_textures[texture_type][texture_name][animation_name][str(frame)]
-        except KeyError:
-            return self._texture_catalog[texture_type][texture_name][animation_name][str(frame)]
+        return self.get_texture_by_handle(
+            self.get_texture_handle(
+                texture_type=texture_type,
+                texture_name=texture_name,
+                animation_name=animation_name,
+                frame=frame
+            )
+        )
+
+    @staticmethod
+    def _get_surface_bytes(surface: Surface) -> int:
+        """
+        :return: Size of Surface pixels in bytes.
+        """
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _get_memory_pool_used_bytes(self) -> int:
+        """
+        :return: Bytes of scaled frames and temporary textures up to their limit.
+        """
+        return self._memory_usage_bytes["scaled"] + min(
+            self._memory_usage_bytes["temporary"],
+            self._temporary_memory_limit_bytes
+        )
+
+    def _log_memory_pool_warning(self, warning_name: str, warning_text: str):
+        """
+        Write memory pool warning to log file once per game launch.
+        :param warning_name: Name of warning case.
+        :type warning_name: str
+        :param warning_text: Text of warning.
+        :type warning_text: str
+        """
+        if warning_name in self._memory_pool_warnings:
+            return
+        self._memory_pool_warnings.add(warning_name)
+        logging.warning(
+            f"TexturesMaster memory pool of {self._image_memory_pool_bytes} bytes: {warning_text}"
+        )
+
+    def _memory_pool_append(self, texture_handle: int, surface: Surface):
+        """
+        Count scaled frame in memory pool and evict least recently used scaled frames over pool size.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        :param surface: Scaled frame Surface.
+        :type surface: Surface
+        """
+        self._memory_pool_remove(texture_handle)
+        surface_bytes: int = self._get_surface_bytes(surface)
+        self._memory_pool[texture_handle]: int = surface_bytes
+        self._count_memory(
+            catalog_name="scaled",
+            texture_type=self._handles_keys[texture_handle][0],
+            texture_name=self._handles_keys[texture_handle][1],
+            surfaces=1,
+            surfaces_bytes=surface_bytes
+        )
+        self._memory_pool_evict(texture_handle)
+
+    def _memory_pool_evict(self, protected_texture_handle: int | None = None):
+        """
+        Evict least recently used scaled frames while memory pool is over its size.
+        Temporary textures are owned by game objects, so they are counted up to their limit but never evicted.
+        Evicted frame is reverted to raw frame and will be scaled again by Sprite on demand.
+        :param protected_texture_handle: Handle of just scaled frame, which is never evicted.
+        :type protected_texture_handle: int | None
+        """
+        used_bytes: int = self._get_memory_pool_used_bytes()
+        if used_bytes <= self._image_memory_pool_bytes:
+            return
+
+        evicted_handles: list[int] = []
+        for texture_handle, surface_bytes in self._memory_pool.items():
+            if used_bytes <= self._image_memory_pool_bytes:
+                break
+            if texture_handle == protected_texture_handle:
+                continue
+            evicted_handles.append(texture_handle)
+            used_bytes -= surface_bytes
+
+        for texture_handle in evicted_handles:
+            self._memory_pool_remove(texture_handle)
+            self._handles_textures[texture_handle]: None = None
+        self._evicted_handles.update(evicted_handles)
+
+    def _memory_pool_remove(self, texture_handle: int):
+        """
+        Stop count scaled frame in memory pool.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        """
+        surface_bytes: int | None = self._memory_pool.pop(texture_handle, None)
+        if surface_bytes is not None:
+            self._count_memory(
+                catalog_name="scaled",
+                texture_type=self._handles_keys[texture_handle][0],
+                texture_name=self._handles_keys[texture_handle][1],
+                surfaces=-1,
+                surfaces_bytes=-surface_bytes
+            )
+
+    def _get_raw_texture_memory(self, raw_texture: dict) -> tuple[int, int]:
+        """
+        Count surfaces and pixels bytes of raw texture frames.
+        Frames cut as views from one image share its pixels, so image is counted once.
+        :param raw_texture: Dict with animations names keys and dicts of frames Surfaces.
+        :type raw_texture: dict
+        :return: Tuple with surfaces number and pixels bytes.
+        """
+        surfaces: int = 0
+        images_bytes: dict[int, int] = {}
+        for animation_frames in raw_texture.values():
+            for frame_surface in animation_frames.values():
+                surfaces += 1
+                image_surface: Surface = frame_surface
+                while image_surface.get_parent() is not None:
+                    image_surface: Surface = image_surface.get_parent()
+                images_bytes[id(image_surface)]: int = self._get_surface_bytes(image_surface)
+        return surfaces, sum(images_bytes.values())
+
+    def _count_memory(self, *, catalog_name: str, texture_type: str, texture_name: str | None,
+                      surfaces: int, surfaces_bytes: int):
+        """
+        Change texture memory accounting and update peaks.
+        :param catalog_name: raw|static|scaled|temporary
+        :type catalog_name: str
+        :param texture_type: Characters|Backgrounds|User_Interface
+        :type texture_type: str
+        :param texture_name: Name of texture.
+        :type texture_name: str | None
+        :param surfaces: Change of surfaces number, negative for removed surfaces.
+        :type surfaces: int
+        :param surfaces_bytes: Change of pixels bytes, negative for removed surfaces.
+        :type surfaces_bytes: int
+        """
+        catalog_usage: dict[tuple[str, str | None], list[int]] = self._memory_usage[catalog_name]
+        texture_usage: list[int] = catalog_usage.setdefault((texture_type, texture_name), [0, 0])
+        texture_usage[0] += surfaces
+        texture_usage[1] += surfaces_bytes
+        if texture_usage[0] <= 0:
+            del catalog_usage[(texture_type, texture_name)]
+
+        self._memory_usage_bytes[catalog_name] += surfaces_bytes
+        if surfaces_bytes > 0:
+            self._memory_usage_peak_bytes[catalog_name]: int = max(
+                self._memory_usage_peak_bytes[catalog_name],
+                self._memory_usage_bytes[catalog_name]
+            )
+            self._memory_usage_total_peak_bytes: int = max(
+                self._memory_usage_total_peak_bytes,
+                sum(self._memory_usage_bytes.values())
+            )
+
+    def get_memory_report(self) -> dict:
+        """
+        Get surfaces number and pixels bytes of textures by catalog, texture type and texture name.
+        Peaks are counted from game launch.
+        Used in FrameProfiler log dump and Render benchmark utility.
+        :return: Dict as example:
+            {
+                "total": {"surfaces": 12, "bytes": 9437184, "peak_bytes": 9437184},
+                "memory_pool": {"size_bytes": 262144000, "used_bytes": 1048576},
+                "catalogs": {
+                    "raw": {
+                        "surfaces": 10, "bytes": 8388608, "peak_bytes": 8388608,
+                        "textures_types": {
+                            "Characters": {
+                                "surfaces": 10, "bytes": 8388608,
+                                "textures": {
+                                    "blank": {"surfaces": 10, "bytes": 8388608}
+                                }
+                            }
+                        }
+                    },
+                    "static": {...},
+                    "scaled": {...},
+                    "temporary": {...}
+                }
+            }
+        """
+        catalogs_report: dict[str, dict] = {}
+        for catalog_name in self._memory_catalogs_names:
+            textures_types_report: dict[str, dict] = {}
+            for (texture_type, texture_name), (surfaces, surfaces_bytes) in self._memory_usage[catalog_name].items():
+                texture_type_report: dict = textures_types_report.setdefault(
+                    texture_type,
+                    {"surfaces": 0, "bytes": 0, "textures": {}}
+                )
+                texture_type_report["surfaces"] += surfaces
+                texture_type_report["bytes"] += surfaces_bytes
+                texture_type_report["textures"][str(texture_name)]: dict[str, int] = {
+                    "surfaces": surfaces,
+                    "bytes": surfaces_bytes
+                }
+
+            catalogs_report[catalog_name]: dict = {
+                "surfaces": sum(
+                    texture_type_report["surfaces"] for texture_type_report in textures_types_report.values()
+                ),
+                "bytes": self._memory_usage_bytes[catalog_name],
+                "peak_bytes": self._memory_usage_peak_bytes[catalog_name],
+                "textures_types": textures_types_report
+            }
+
+        return {
+            "total": {
+                "surfaces": sum(catalog_report["surfaces"] for catalog_report in catalogs_report.values()),
+                "bytes": sum(self._memory_usage_bytes.values()),
+                "peak_bytes": self._memory_usage_total_peak_bytes
+            },
+            "memory_pool": {
+                "size_bytes": self._image_memory_pool_bytes,
+                "used_bytes": self._get_memory_pool_used_bytes()
+            },
+            "catalogs": catalogs_report
+        }
+
+    def get_memory_report_text(self) -> str:
+        """
+        Get texture memory report text for log file.
+        Only the largest textures of every texture type are listed.
+        Used in FrameProfiler log dump.
+        """
+        def __megabytes(surfaces_bytes: int) -> str:
+            """
+            Format bytes for log.
+            :param surfaces_bytes: Pixels bytes.
+            :type surfaces_bytes: int
+            """
+            return f"{surfaces_bytes / 1048576:.1f}mb"
+
+        memory_report: dict = self.get_memory_report()
+        report: list[str] = [
+            f"Textures memory: {__megabytes(memory_report['total']['bytes'])} "
+            f"in {memory_report['total']['surfaces']} surfaces, "
+            f"peak={__megabytes(memory_report['total']['peak_bytes'])}, "
+            f"memory pool={__megabytes(memory_report['memory_pool']['used_bytes'])}"
+            f"/{__megabytes(memory_report['memory_pool']['size_bytes'])}"
+        ]
+        for catalog_name, catalog_report in memory_report["catalogs"].items():
+            report.append(
+                f"{catalog_name}: {__megabytes(catalog_report['bytes'])} "
+                f"in {catalog_report['surfaces']} surfaces, peak={__megabytes(catalog_report['peak_bytes'])}"
+            )
+            for texture_type, texture_type_report in catalog_report["textures_types"].items():
+                largest_textures: list[tuple[str, dict[str, int]]] = sorted(
+                    texture_type_report["textures"].items(),
+                    key=lambda texture_report: texture_report[1]["bytes"],
+                    reverse=True
+                )[:self._memory_log_textures_limit]
+                report.append(
+                    f"    {texture_type}: {__megabytes(texture_type_report['bytes'])} "
+                    f"in {texture_type_report['surfaces']} surfaces; " + ", ".join(
+                        f"{texture_name}={__megabytes(texture_report['bytes'])}"
+                        for texture_name, texture_report in largest_textures
+                    )
+                )
+        return "\n".join(report)
 
     def _collect_texture_configurations(self):
         """
@@ -270,40 +680,21 @@ class TexturesMaster(SingletonPattern):
                     }
                 )
 
-    def _collect_raw_images(self):
-        """
-        Collect row texture images for scale.
-        """
-        for texture_type, texture_collection in self._texture_configs_catalog.items():
-            if texture_type not in self._raw_images_catalog:
-                self._raw_images_catalog.update(
-                    {
-                        texture_type: {}
-                    }
-                )
-
-            for texture_name in texture_collection:
-                texture_image: Surface = self._asset_loader.image_load(
-                    art_name=texture_name,
-                    asset_type=texture_type,
-                )
-                self._raw_images_catalog[texture_type].update(
-                    {
-                        texture_name: texture_image
-                    }
-                )
-
-    def _create_raw_sprite_sheet_frames(self):
+    def _create_raw_sprite_sheet_frames(self, *, texture_type: str, texture_name: str, texture_image: Surface):
         """
-        Create raw sprite sheet.
+        Create raw sprite sheet of one texture.
         Frames of this sprite sheet are not scale from raw state.
         They will be scale when loading a game map or video clip into a separate collection.
+        :param texture_type: Characters|Backgrounds
+        :type texture_type: str
+        :param texture_name: Name of texture from texture configurations.
+        :type texture_name: str
+        :param texture_image: Loaded texture image.
+        :type texture_image: Surface
         """
-        def __get_frames(*, texture_type_name: str, frames: dict) -> dict:
+        def __get_frames(frames: dict) -> dict:
             """
             Get sprite sheet frame from texture image.
-            :param texture_type_name: Asset type for raw image getting.
-            :type texture_type_name: str
             :param frames: Dictionary with frame coordinates data.
             :type frames: dict
             """
@@ -317,6 +708,20 @@ class TexturesMaster(SingletonPattern):
                     bottom_right_corner["y"] - top_left_corner["y"]
                 )
 
+                # Frame as view into texture image:
+                frame_rect: Rect = Rect(
+                    (top_left_corner["x"], top_left_corner["y"]),
+                    bounding_box
+                )
+                if self._subsurface_frames is True and texture_image.get_rect().contains(frame_rect):
+                    result.update(
+                        {
+                            frame: texture_image.subsurface(frame_rect)
+                        }
+                    )
+                    continue
+
+                # Frame out of texture image bounds is copied to transparent Surface:
                 frame_surface: Surface = Surface(
                     bounding_box,
                     SRCALPHA
@@ -327,9 +732,8 @@ class TexturesMaster(SingletonPattern):
                     - top_left_corner["y"]
                 )
 
-                texture: Surface = self._raw_images_catalog[texture_type_name][texture_name]
                 frame_surface.blit(
-                    texture, frame_blit_coordinates
+                    texture_image, frame_blit_coordinates
                 )
 
                 result.update(
@@ -340,43 +744,69 @@ class TexturesMaster(SingletonPattern):
             return result
 
         # Create sprites:
-        for texture_type, texture_catalog in self._texture_configs_catalog.items():
-            if texture_type not in self._raw_textures_catalog:
-                self._raw_textures_catalog.update(
-                    {
-                        texture_type: {}
-                    }
-                )
+        texture_data: dict = self._texture_configs_catalog[texture_type][texture_name]
+        raw_texture: dict = {}
 
-            for texture_name, texture_data in texture_catalog.items():
-                self._raw_textures_catalog[texture_type].update(
+        # Animation sprites:
+        if texture_data["sprite_sheet"]:
+            for animation in texture_data["animations"]:
+                raw_texture.update(
                     {
-                        texture_name: {}
+                        animation: __get_frames(
+                            texture_data["animations"][animation]["frames"]
+                        )
                     }
                 )
 
-                # Animation sprites:
-                if texture_data["sprite_sheet"]:
-                    for animation in texture_data["animations"]:
-                        self._raw_textures_catalog[texture_type][texture_name].update(
-                            {
-                                animation: __get_frames(
-                                    texture_type_name=texture_type,
-                                    frames=texture_data["animations"][animation]["frames"]
-                                )
-                            }
-                        )
-
-                # Statick sprites:
-                else:
-                    self._raw_textures_catalog[texture_type][texture_name].update(
-                        {
-                            "statick_frames": __get_frames(
-                                texture_type_name=texture_type,
-                                frames=texture_data["statick_frames"]
-                            )
-                        }
+        # Statick sprites:
+        else:
+            raw_texture.update(
+                {
+                    "statick_frames": __get_frames(
+                        texture_data["statick_frames"]
                     )
+                }
+            )
+
+        self._set_raw_texture(
+            texture_type=texture_type,
+            texture_name=texture_name,
+            raw_texture=raw_texture
+        )
+
+    def _set_raw_texture(self, *, texture_type: str, texture_name: str | None,
+                         raw_texture: dict, catalog_name: str = "raw"):
+        """
+        Set raw texture frames in _raw_textures_catalog and count their memory.
+        :param texture_type: Characters|Backgrounds|User_Interface
+        :type texture_type: str
+        :param texture_name: Name of texture.
+        :type texture_name: str | None
+        :param raw_texture: Dict with animations names keys and dicts of frames Surfaces.
+        :type raw_texture: dict
+        :param catalog_name: "raw" or "static" catalog of memory accounting.
+        :type catalog_name: str
+        """
+        old_raw_texture: dict | None = self._raw_textures_catalog[texture_type].get(texture_name)
+        if old_raw_texture is not None:
+            surfaces, surfaces_bytes = self._get_raw_texture_memory(old_raw_texture)
+            self._count_memory(
+                catalog_name=catalog_name,
+                texture_type=texture_type,
+                texture_name=texture_name,
+                surfaces=-surfaces,
+                surfaces_bytes=-surfaces_bytes
+            )
+
+        self._raw_textures_catalog[texture_type][texture_name]: dict = raw_texture
+        surfaces, surfaces_bytes = self._get_raw_texture_memory(raw_texture)
+        self._count_memory(
+            catalog_name=catalog_name,
+            texture_type=texture_type,
+            texture_name=texture_name,
+            surfaces=surfaces,
+            surfaces_bytes=surfaces_bytes
+        )
 
     def set_new_scale_frame(self, *, texture_name: str, texture_type: str, frame: int | str,
                             image_size: tuple[int, int], animation_name: str = "statick_frames"):
@@ -393,35 +823,149 @@ class TexturesMaster(SingletonPattern):
         :param animation_name: Name of animation for non statick textures.
         :type animation_name: str
         """
-        try:
-            image_surface: Surface = transform.scale(
-                self._temporary_textures[texture_type][texture_name][animation_name][str(frame)],
+        self.set_new_scale_frame_by_handle(
+            self.get_texture_handle(
+                texture_type=texture_type,
+                texture_name=texture_name,
+                animation_name=animation_name,
+                frame=frame
+            ),
+            image_size
+        )
+
+    def set_new_scale_frame_by_handle(self, texture_handle: int, image_size: tuple[int, int]):
+        """
+        Cash new frame size by texture frame handle.
+        Use in Sprites.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        :param image_size: Frame image surface.
+        :type image_size: tuple[int, int]
+        """
+        temporary_texture: Surface | None = self._handles_temporary_textures[texture_handle]
+        if temporary_texture is not None:
+            self.set_temporary_texture_by_handle(
+                texture_handle,
+                transform.scale(
+                    temporary_texture,
+                    image_size
+                )
+            )
+            return
+
+        # Frame is already cached in this size, as example by ScenePrefetcher:
+        if self.get_texture_by_handle(texture_handle).get_size() == image_size:
+            return
+
+        raw_frame: Surface = self._get_raw_texture(texture_handle)
+        # Native size frame is not copied:
+        if raw_frame.get_size() == image_size:
+            self._memory_pool_remove(texture_handle)
+            self._handles_textures[texture_handle]: Surface = raw_frame
+            return
+
+        # Evicted frame is requested again:
+        if texture_handle in self._evicted_handles:
+            self._evicted_handles.discard(texture_handle)
+            self._log_memory_pool_warning(
+                "scaled_again",
+                "evicted scaled frames are scaled again, pool size is too small for scene textures."
+            )
+
+        scaled_frame: Surface = self._scale_raw_frame(
+            texture_handle=texture_handle,
+            raw_frame=raw_frame,
+            image_size=image_size
+        )
+        self._handles_textures[texture_handle]: Surface = scaled_frame
+        self._memory_pool_append(texture_handle, scaled_frame)
+
+    def _set_texture_file_hash(self, *, texture_type: str, texture_name: str, file_catalog: str = ""):
+        """
+        Remember source image file hash of texture for texture disk cache.
+        :param texture_type: Characters|Backgrounds|User_Interface
+        :type texture_type: str
+        :param texture_name: Name of texture.
+        :type texture_name: str
+        :param file_catalog: Catalog in Asset_Type_Folder, for User_Interface textures.
+        :type file_catalog: str
+        """
+        if self._texture_disk_cache.get_status() is False:
+            return
+        self._textures_files_hashes[(texture_type, texture_name)]: str = self._texture_disk_cache.get_file_hash(
+            self._asset_loader.get_image_path(
+                art_name=texture_name,
+                asset_type=texture_type,
+                file_catalog=file_catalog
+            )
+        )
+
+    def _get_frame_rect(self, *, texture_type: str, texture_name: str,
+                        animation_name: str, frame: str) -> tuple[int, int, int, int]:
+        """
+        Get frame x, y, width and height in source image.
+        Textures without configuration are whole image frames.
+        :return: Frame rect tuple.
+        """
+        texture_data: dict | None = self._texture_configs_catalog.get(texture_type, {}).get(texture_name)
+        if texture_data is None:
+            return 0, 0, *self._raw_textures_catalog[texture_type][texture_name][animation_name][frame].get_size()
+
+        if animation_name == "statick_frames":
+            frame_data: dict = texture_data["statick_frames"][frame]
+        else:
+            frame_data: dict = texture_data["animations"][animation_name]["frames"][frame]
+        top_left_corner: dict = frame_data["top_left_corner"]
+        bottom_right_corner: dict = frame_data["bottom_right_corner"]
+        return (
+            top_left_corner["x"],
+            top_left_corner["y"],
+            bottom_right_corner["x"] - top_left_corner["x"],
+            bottom_right_corner["y"] - top_left_corner["y"]
+        )
+
+    def _scale_raw_frame(self, *, texture_handle: int, raw_frame: Surface, image_size: tuple[int, int]) -> Surface:
+        """
+        Scale raw frame or load it from texture disk cache.
+        Texture disk cache is read only for first scale of frame, new scaled frames are saved in worker thread.
+        :return: Scaled frame Surface.
+        """
+        first_scale_status: bool = texture_handle not in self._scaled_handles
+        self._scaled_handles.add(texture_handle)
+        texture_type, texture_name, animation_name, frame = self._handles_keys[texture_handle]
+        file_hash: str | None = self._textures_files_hashes.get((texture_type, texture_name))
+        if file_hash is None or self._texture_disk_cache.get_status() is False:
+            return transform.scale(
+                raw_frame,
                 image_size
             )
-            self._temporary_textures[texture_type][texture_name][animation_name][str(frame)]: Surface = image_surface
-
-        except KeyError:
-            self._texture_catalog[
-                texture_type
-            ][
-                texture_name
-            ][
-                animation_name
-            ][
-                str(frame)
-            ]: Surface = \
-                transform.scale(
-                self._raw_textures_catalog[
-                    texture_type
-                ][
-                    texture_name
-                ][
-                    animation_name
-                ][
-                    str(frame)
-                ].copy(),
+
+        frame_rect: tuple[int, int, int, int] = self._get_frame_rect(
+            texture_type=texture_type,
+            texture_name=texture_name,
+            animation_name=animation_name,
+            frame=frame
+        )
+        scaled_frame: Surface | None = None
+        if first_scale_status is True:
+            scaled_frame: Surface | None = self._texture_disk_cache.load(
+                file_hash=file_hash,
+                alpha_chanel=bool(raw_frame.get_flags() & SRCALPHA),
+                frame_rect=frame_rect,
+                texture_size=image_size
+            )
+        if scaled_frame is None:
+            scaled_frame: Surface = transform.scale(
+                raw_frame,
                 image_size
             )
+            self._texture_disk_cache.save(
+                file_hash=file_hash,
+                surface=scaled_frame,
+                frame_rect=frame_rect,
+                texture_size=image_size
+            )
+        return scaled_frame
 
     def set_temporary_texture(self, *, texture_type: str, texture_name: str,
                               surface: Surface, animation_name: str, frame: int | str):
@@ -440,32 +984,53 @@ class TexturesMaster(SingletonPattern):
         :param surface: Pygame.Surface object.
         :type surface: Surface
         """
-        if texture_type not in self._temporary_textures:
-            self._temporary_textures.update(
-                {
-                    texture_type: {}
-                }
-            )
-        if texture_name not in self._temporary_textures[texture_type]:
-            self._temporary_textures[texture_type].update(
-                {
-                    texture_name: {}
-                }
-            )
-        if animation_name not in self._temporary_textures[texture_type][texture_name]:
-            self._temporary_textures[texture_type][texture_name].update(
-                {
-                    animation_name: {}
-                }
+        self.set_temporary_texture_by_handle(
+            self.get_texture_handle(
+                texture_type=texture_type,
+                texture_name=texture_name,
+                animation_name=animation_name,
+                frame=frame
+            ),
+            surface
+        )
+
+    def set_temporary_texture_by_handle(self, texture_handle: int, surface: Surface):
+        """
+        Set temporary texture by texture frame handle.
+        Use in Sprites.
+        :param texture_handle: Texture frame handle.
+        :type texture_handle: int
+        :param surface: Pygame.Surface object.
+        :type surface: Surface
+        """
+        temporary_texture: Surface | None = self._handles_temporary_textures[texture_handle]
+        # The same texture is set again by Sprite every frame:
+        if temporary_texture is surface:
+            return
+
+        texture_type, texture_name = self._handles_keys[texture_handle][:2]
+        if temporary_texture is not None:
+            self._count_memory(
+                catalog_name="temporary",
+                texture_type=texture_type,
+                texture_name=texture_name,
+                surfaces=-1,
+                surfaces_bytes=-self._get_surface_bytes(temporary_texture)
             )
-        if str(frame) not in self._temporary_textures[texture_type][texture_name][animation_name]:
-            self._temporary_textures[texture_type][texture_name][animation_name].update(
-                {
-                    str(frame): surface
-                }
+        self._handles_temporary_textures[texture_handle]: Surface = surface
+        self._count_memory(
+            catalog_name="temporary",
+            texture_type=texture_type,
+            texture_name=texture_name,
+            surfaces=1,
+            surfaces_bytes=self._get_surface_bytes(surface)
+        )
+        if self._memory_usage_bytes["temporary"] > self._temporary_memory_limit_bytes:
+            self._log_memory_pool_warning(
+                "temporary_limit",
+                f"temporary textures are over their limit of {self._temporary_memory_limit_bytes} bytes."
             )
-        else:
-            self._temporary_textures[texture_type][texture_name][animation_name][str(frame)]: Surface = surface
+        self._memory_pool_evict()
 
     def devnull_temporary_texture(self, *, texture_type: str, texture_name: str,
                                   animation_name: str, frame: int | str):
@@ -482,10 +1047,22 @@ class TexturesMaster(SingletonPattern):
         :param animation_name: Name of animation for non statick textures.
         :type animation_name: str
         """
-        try:
-            del self._temporary_textures[texture_type][texture_name][animation_name][str(frame)]
-        except KeyError:
-            pass
+        texture_handle: int = self.get_texture_handle(
+            texture_type=texture_type,
+            texture_name=texture_name,
+            animation_name=animation_name,
+            frame=frame
+        )
+        temporary_texture: Surface | None = self._handles_temporary_textures[texture_handle]
+        if temporary_texture is not None:
+            self._count_memory(
+                catalog_name="temporary",
+                texture_type=texture_type,
+                texture_name=texture_name,
+                surfaces=-1,
+                surfaces_bytes=-self._get_surface_bytes(temporary_texture)
+            )
+            self._handles_temporary_textures[texture_handle]: None = None
 
     def get_temporary_texture(self, texture_type: str, texture_name: str,
                               animation_name: str, frame: int | str) -> Surface:
@@ -500,8 +1077,19 @@ class TexturesMaster(SingletonPattern):
         :type frame: int | str
         :param animation_name: Name of animation for non statick textures.
         :type animation_name: str
+        :raise KeyError: If temporary texture is not set.
         """
-        return self._temporary_textures[texture_type][texture_name][animation_name][str(frame)]
+        temporary_texture: Surface | None = self._handles_temporary_textures[
+            self.get_texture_handle(
+                texture_type=texture_type,
+                texture_name=texture_name,
+                animation_name=animation_name,
+                frame=frame
+            )
+        ]
+        if temporary_texture is None:
+            raise KeyError((texture_type, texture_name, animation_name, str(frame)))
+        return temporary_texture
 
     def get_texture_size(
             self, *,
@@ -521,14 +1109,11 @@ class TexturesMaster(SingletonPattern):
         :param animation_name: Name of animation for non statick textures.
         :type animation_name: str
         """
-        try:
-            texture_surface: Surface = self.get_temporary_texture(
+        return self.get_texture_size_by_handle(
+            self.get_texture_handle(
                 texture_type=texture_type,
                 texture_name=texture_name,
                 animation_name=animation_name,
-                frame=str(frame)
+                frame=frame
             )
-            return texture_surface.get_width(), texture_surface.get_height()
-        except KeyError:
-            return self._texture_catalog[texture_type][texture_name][animation_name][str(frame)].get_width(), \
-                self._texture_catalog[texture_type][texture_name][animation_name][str(frame)].get_height()
+        )
@@ -1,5 +1,7 @@
-from os import path
+from os import path, cpu_count
 from csv import DictReader
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 import json
 
 from pygame import image, font, mixer, Surface
@@ -51,6 +53,8 @@ class AssetLoader(SingletonPattern):
                 "alpha_chanel": False
                 }
         }
+        # Images decoding thread pool size:
+        self.__image_load_workers: int = min(32, (cpu_count() or 1) + 4)
 
     def json_load(self, path_list: list[str]) -> dict:
         """
@@ -67,6 +71,37 @@ class AssetLoader(SingletonPattern):
                 json_file.read()
             )
 
+    def get_image_path(self, *, art_name: str, asset_type: str, file_catalog: str = "",
+                       root_path: str = 'Images', art_name_is_path: bool = False) -> str:
+        """
+        Get image file path by name.
+        Arguments are the same as in image_load.
+        Used in TexturesMaster for texture disk cache.
+        :return: Path to image file.
+        """
+        file_format: str = self.__images_instructions[asset_type]["file_format"]
+        if art_name_is_path is False:
+            art_additional_part: str = f"{path.join(*[root_path, asset_type, file_catalog, art_name])}"
+            return f"{self.__root_path}{art_additional_part}.{file_format}"
+        else:
+            return f"{art_name}.{file_format}"
+
+    def _convert_image(self, *, image_surface: Surface, asset_type: str) -> Surface:
+        """
+        Convert decoded image to display pixel format.
+        Must be called in main thread.
+        :param image_surface: Decoded image.
+        :type image_surface: Surface
+        :param asset_type: String.
+                           Example: "Characters".
+        :type asset_type: str
+        :return: Surface
+        """
+        if self.__images_instructions[asset_type]["alpha_chanel"] is True:
+            return image_surface.convert_alpha()
+        else:
+            return image_surface.convert()
+
     def image_load(self, *, art_name: str, asset_type: str,
                    file_catalog: str = "", root_path: str = 'Images',
                    art_name_is_path: bool = False) -> Surface:
@@ -85,17 +120,98 @@ class AssetLoader(SingletonPattern):
         :type art_name_is_path: bool
         :return: Surface
         """
-        file_format: str = self.__images_instructions[asset_type]["file_format"]
-        if art_name_is_path is False:
-            art_additional_part: str = f"{path.join(*[root_path, asset_type, file_catalog, art_name])}"
-            art_path: str = f"{self.__root_path}{art_additional_part}.{file_format}"
-        else:
-            art_path: str = f"{art_name}.{file_format}"
+        return self._convert_image(
+            image_surface=image.load(
+                self.get_image_path(
+                    art_name=art_name,
+                    asset_type=asset_type,
+                    file_catalog=file_catalog,
+                    root_path=root_path,
+                    art_name_is_path=art_name_is_path
+                )
+            ),
+            asset_type=asset_type
+        )
 
-        if self.__images_instructions[asset_type]["alpha_chanel"] is True:
-            return image.load(art_path).convert_alpha()
+    def image_decode(self, *, art_name: str, asset_type: str) -> Surface:
+        """
+        Decode image file without conversion to display pixel format.
+        Can be called in worker thread, decoded image is converted by image_load_many in main thread.
+        Used in ScenePrefetcher.
+        :param art_name: File name without file format.
+        :type art_name: str
+        :param asset_type: String.
+                           Example: "Characters".
+        :type asset_type: str
+        :return: Decoded image Surface.
+        """
+        return image.load(
+            self.get_image_path(
+                art_name=art_name,
+                asset_type=asset_type
+            )
+        )
+
+    def image_load_many(self, *, art_names: Iterable[str], asset_type: str, file_catalog: str = "",
+                        root_path: str = 'Images',
+                        decoded_images: dict[str, Surface] | None = None) -> dict[str, Surface]:
+        """
+        Load images by names and return them as Surfaces for image rendering.
+        Files are decoded in thread pool, pygame releases GIL while decoding.
+        Decoded images are converted to display pixel format in main thread.
+        :param art_names: Files names without file format.
+        :type art_names: Iterable[str]
+        :param asset_type: String.
+                           Example: "Characters".
+        :type asset_type: str
+        :param file_catalog: Catalog in Asset_Type_Folder.
+                             Null as default.
+        :type file_catalog: str
+        :param root_path: Root path for get image file. Images as default.
+        :type root_path: str
+        :param decoded_images: Images already decoded by image_decode, they are only converted.
+        :type decoded_images: dict[str, Surface] | None
+        :return: Dict with art names keys and Surfaces values.
+        """
+        arts_paths: dict[str, str] = {
+            art_name: self.get_image_path(
+                art_name=art_name,
+                asset_type=asset_type,
+                file_catalog=file_catalog,
+                root_path=root_path,
+                art_name_is_path=False
+            )
+            for art_name in art_names
+        }
+        result: dict[str, Surface] = {}
+
+        # Images decoded in worker thread:
+        if decoded_images is not None:
+            for art_name in arts_paths:
+                if art_name in decoded_images:
+                    result[art_name]: Surface = self._convert_image(
+                        image_surface=decoded_images[art_name],
+                        asset_type=asset_type
+                    )
+
+        # Decode images:
+        arts_to_decode: list[str] = [art_name for art_name in arts_paths if art_name not in result]
+        arts_to_decode_paths: list[str] = [arts_paths[art_name] for art_name in arts_to_decode]
+        if len(arts_to_decode) < 2:
+            decoded_surfaces: Iterable[Surface] = map(image.load, arts_to_decode_paths)
         else:
-            return image.load(art_path).convert()
+            with ThreadPoolExecutor(max_workers=min(self.__image_load_workers, len(arts_to_decode))) as executor:
+                decoded_surfaces: Iterable[Surface] = list(executor.map(image.load, arts_to_decode_paths))
+
+        for art_name, decoded_image in zip(arts_to_decode, decoded_surfaces):
+            result[art_name]: Surface = self._convert_image(
+                image_surface=decoded_image,
+                asset_type=asset_type
+            )
+
+        return {
+            art_name: result[art_name] for art_name in arts_paths
+        }
 
     def sound_load(self, *, asset_type: str, file_name: str) -> mixer.music.load:
         """
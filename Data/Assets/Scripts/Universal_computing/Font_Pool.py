@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+from pygame import font, Surface
+
+from .Pattern_Singleton import SingletonPattern
+from .Assets_load import AssetLoader
+"""
+Contains code for FontPool.
+"""
+
+
+class FontPool(SingletonPattern):
+    """
+    Keep loaded fonts and rendered text shared by all game text.
+    Every font is loaded once per font name and size, least recently used fonts are dropped over pool size.
+    Rendered text is kept the same way, so unchanged text is not rendered again every frame.
+    Used in DialoguesWords, BaseButton, MenuText and SettingsKeeper.
+    """
+    def __init__(self):
+        # Program layers settings:
+        self._asset_loader: AssetLoader = AssetLoader()
+
+        # Pool settings:
+        # Number of kept fonts, enough for all text sizes of two window sizes:
+        self._pool_size: int = 32
+        # (font name, font size): Font, from least to most recently used.
+        self._fonts: OrderedDict[tuple[str | None, int], font.Font] = OrderedDict()
+
+        # Rendered text settings:
+        # Number of kept text surfaces:
+        self._rendered_texts_pool_size: int = 64
+        # (text, font name, font size, color, antialias): Surface, from least to most recently used.
+        self._rendered_texts: OrderedDict[tuple[str, str | None, int, str | tuple, bool], Surface] = OrderedDict()
+
+    def get_font(self, *, font_name: str | None, font_size: int) -> font.Font:
+        """
+        Get font from pool, font is loaded on first request.
+        :param font_name: String with file name in '*/Fonts/*' folder.
+                          None for pygame default font.
+        :type font_name: str | None
+        :param font_size: Font size.
+        :type font_size: int
+        :return: Loaded font.
+        """
+        font_key: tuple[str | None, int] = (font_name, font_size)
+        loaded_font: font.Font | None = self._fonts.get(font_key)
+        if loaded_font is not None:
+            self._fonts.move_to_end(font_key)
+            return loaded_font
+
+        if font_name is None:
+            loaded_font: font.Font = font.Font(
+                font.get_default_font(),
+                font_size
+            )
+        else:
+            loaded_font: font.Font = self._asset_loader.font_load(
+                font_name=font_name,
+                font_size=font_size
+            )
+        self._fonts[font_key]: font.Font = loaded_font
+        if len(self._fonts) > self._pool_size:
+            self._fonts.popitem(last=False)
+        return loaded_font
+
+    def render_text(self, *, text: str, font_name: str | None, font_size: int,
+                    color: str | tuple, antialias: bool = True) -> Surface:
+        """
+        Get rendered text Surface from pool, text is rendered on first request.
+        Returned Surface is shared, so it must not be changed.
+        :param text: Text string.
+        :type text: str
+        :param font_name: String with file name in '*/Fonts/*' folder.
+                          None for pygame default font.
+        :type font_name: str | None
+        :param font_size: Font size.
+        :type font_size: int
+        :param color: Text color.
+        :type color: str | tuple
+        :param antialias: Antialias of text.
+        :type antialias: bool
+        :return: Text Surface.
+        """
+        text_key: tuple[str, str | None, int, str | tuple, bool] = (text, font_name, font_size, color, antialias)
+        text_surface: Surface | None = self._rendered_texts.get(text_key)
+        if text_surface is not None:
+            self._rendered_texts.move_to_end(text_key)
+            return text_surface
+
+        text_surface: Surface = self.get_font(
+            font_name=font_name,
+            font_size=font_size
+        ).render(
+            text, antialias, color
+        )
+        self._rendered_texts[text_key]: Surface = text_surface
+        if len(self._rendered_texts) > self._rendered_texts_pool_size:
+            self._rendered_texts.popitem(last=False)
+        return text_surface
+
+    def clear_rendered_texts(self):
+        """
+        Drop all rendered text.
+        Text of old window size or language will not be requested again.
+        Used in SettingsKeeper.
+        """
+        self._rendered_texts.clear()
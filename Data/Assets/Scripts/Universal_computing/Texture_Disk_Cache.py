@@ -0,0 +1,230 @@
+from os import path, makedirs, replace, remove, scandir, utime, DirEntry
+from hashlib import blake2b
+from struct import pack, unpack, calcsize
+
+from pygame import image, Surface, SRCALPHA
+
+from .Pattern_Singleton import SingletonPattern
+from ..Application_layer.Settings_Keeper import SettingsKeeper
+"""
+Contains code for TextureDiskCache.
+"""
+
+
+class TextureDiskCache(SingletonPattern):
+    """
+    Keep scaled textures frames as raw pixel buffers between game launches.
+    Entries are keyed by source file hash, frame rect, texture size and pixel format.
+    Entries are written in FrameScheduler worker thread, cache size is limited by removing least recently used entries.
+    Used in TexturesMaster.
+    """
+    # Entry header with texture width and height:
+    _header_format: str = "<II"
+    # Longest size of all cache entries, in bytes:
+    _cache_size_limit: int = 128 * 1024 * 1024
+    # Number of kept texture sizes for one source file, older sizes are from previous window sizes.
+    # Characters frames have different sizes for scene plans, so several sizes are used in one window size:
+    _texture_sizes_limit: int = 8
+
+    def __init__(self):
+        # Path settings:
+        script_root_path: str = path.abspath(__file__) \
+            .replace(path.join(
+                *['Assets', 'Scripts', 'Universal_computing', 'Texture_Disk_Cache.py']
+            ), '')
+        self._cache_folder_path: str = path.join(
+            *[script_root_path, 'Cache', 'Textures']
+        )
+
+        # Cache settings:
+        self._status: bool = SettingsKeeper().get_texture_disk_cache()
+        self._files_hashes: dict[str, str] = {}
+
+    def get_status(self) -> bool:
+        """
+        Used in TexturesMaster.
+        """
+        return self._status
+
+    def set_status(self, status: bool):
+        """
+        Switch cache on or off for current launch.
+        Used in Render benchmark utility, for keep cache folder untouched and results independent of previous runs.
+        :param status: False for switch cache off.
+        :type status: bool
+        """
+        self._status: bool = status
+
+    def get_file_hash(self, file_path: str) -> str:
+        """
+        Get hash of source image file content.
+        Hash is calculated once per game launch.
+        :param file_path: Path to image file.
+        :type file_path: str
+        :return: Hexadecimal hash string.
+        """
+        file_hash: str | None = self._files_hashes.get(file_path)
+        if file_hash is None:
+            with open(file_path, 'rb') as image_file:
+                file_hash: str = blake2b(image_file.read(), digest_size=16).hexdigest()
+            self._files_hashes[file_path]: str = file_hash
+        return file_hash
+
+    def _get_entry_path(self, *, file_hash: str, frame_rect: tuple[int, int, int, int],
+                        texture_size: tuple[int, int], alpha_chanel: bool) -> str:
+        """
+        Get cache entry file path by entry key.
+        File name starts with source file hash and texture size, they are used for cache prune.
+        :return: Path to cache entry file.
+        """
+        entry_key: str = repr(
+            (file_hash, frame_rect, texture_size, "RGBA" if alpha_chanel is True else "RGB")
+        )
+        return path.join(
+            self._cache_folder_path,
+            f"{file_hash}_{texture_size[0]}x{texture_size[1]}_"
+            f"{blake2b(entry_key.encode('utf-8'), digest_size=16).hexdigest()}.texture"
+        )
+
+    def load(self, *, file_hash: str, alpha_chanel: bool, frame_rect: tuple[int, int, int, int],
+             texture_size: tuple[int, int]) -> Surface | None:
+        """
+        Load texture from cache in display pixel format.
+        Entry modification time is updated, so recently used entries are kept by cache prune.
+        :param file_hash: Hash of source image file.
+        :type file_hash: str
+        :param alpha_chanel: True for textures with per pixel alpha.
+        :type alpha_chanel: bool
+        :param frame_rect: Frame x, y, width and height in source image.
+        :type frame_rect: tuple[int, int, int, int]
+        :param texture_size: Scaled texture size.
+        :type texture_size: tuple[int, int]
+        :return: Texture Surface or None, if texture is not cached.
+        """
+        entry_path: str = self._get_entry_path(
+            file_hash=file_hash,
+            frame_rect=frame_rect,
+            texture_size=texture_size,
+            alpha_chanel=alpha_chanel
+        )
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                entry_data: bytes = entry_file.read()
+            utime(entry_path)
+        except OSError:
+            return None
+
+        header_size: int = calcsize(self._header_format)
+        if len(entry_data) < header_size:
+            return None
+        width, height = unpack(self._header_format, entry_data[:header_size])
+        pixel_format: str = "RGBA" if alpha_chanel is True else "RGB"
+        # Broken entry:
+        if len(entry_data) - header_size != width * height * len(pixel_format):
+            return None
+
+        texture: Surface = image.frombuffer(entry_data[header_size:], (width, height), pixel_format)
+        if alpha_chanel is True:
+            return texture.convert_alpha()
+        else:
+            return texture.convert()
+
+    def save(self, *, file_hash: str, surface: Surface, frame_rect: tuple[int, int, int, int],
+             texture_size: tuple[int, int]):
+        """
+        Save texture to cache.
+        Pixels are copied in main thread, entry is written in FrameScheduler worker thread.
+        Surface is not read in worker thread, because locked Surface can not be blitted in main thread.
+        :param file_hash: Hash of source image file.
+        :type file_hash: str
+        :param surface: Texture Surface.
+        :type surface: Surface
+        :param frame_rect: Frame x, y, width and height in source image.
+        :type frame_rect: tuple[int, int, int, int]
+        :param texture_size: Scaled texture size.
+        :type texture_size: tuple[int, int]
+        """
+        from ..Application_layer.Frame_Scheduler import FrameScheduler
+
+        alpha_chanel: bool = bool(surface.get_flags() & SRCALPHA)
+        entry_path: str = self._get_entry_path(
+            file_hash=file_hash,
+            frame_rect=frame_rect,
+            texture_size=texture_size,
+            alpha_chanel=alpha_chanel
+        )
+        entry_data: bytes = pack(self._header_format, *surface.get_size()) \
+            + image.tobytes(surface, "RGBA" if alpha_chanel is True else "RGB")
+        FrameScheduler().run_in_background(self._write_entry, entry_path, entry_data)
+
+    def _write_entry(self, entry_path: str, entry_data: bytes):
+        """
+        Write cache entry and prune cache.
+        Cache is switched off for current launch, if cache folder is not writable.
+        Run in FrameScheduler worker thread.
+        :param entry_path: Path to cache entry file.
+        :type entry_path: str
+        :param entry_data: Entry header and pixels.
+        :type entry_data: bytes
+        """
+        try:
+            makedirs(self._cache_folder_path, exist_ok=True)
+            # Entry is written to temporary file first, so interrupted writing does not leave broken entry:
+            with open(f"{entry_path}.tmp", 'wb') as entry_file:
+                entry_file.write(entry_data)
+            replace(f"{entry_path}.tmp", entry_path)
+        except OSError:
+            self._status: bool = False
+            return
+        self._prune()
+
+    def _prune(self):
+        """
+        Remove entries of old texture sizes of every source file
+        and least recently used entries over cache size limit.
+        Run in FrameScheduler worker thread.
+        """
+        try:
+            entries: list[DirEntry] = [
+                entry for entry in scandir(self._cache_folder_path)
+                if entry.is_file() and entry.name.endswith(".texture")
+            ]
+            # (modification time, size, path, name), from most to least recently used:
+            entries_data: list[tuple[float, int, str, str]] = sorted(
+                (
+                    (entry.stat().st_mtime, entry.stat().st_size, entry.path, entry.name)
+                    for entry in entries
+                ),
+                reverse=True
+            )
+        except OSError:
+            return
+
+        # Texture sizes of every source file, from most to least recently used:
+        kept_sizes: dict[str, list[str]] = {}
+        removed_entries: list[str] = []
+        cache_size: int = 0
+        for _, entry_size, entry_path, entry_name in entries_data:
+            name_parts: list[str] = entry_name.split('_')
+            # Entries with other file names have no source file hash and texture size:
+            if len(name_parts) != 3:
+                removed_entries.append(entry_path)
+                continue
+
+            file_hash, texture_size = name_parts[0], name_parts[1]
+            source_sizes: list[str] = kept_sizes.setdefault(file_hash, [])
+            if texture_size not in source_sizes:
+                source_sizes.append(texture_size)
+            if source_sizes.index(texture_size) >= self._texture_sizes_limit:
+                removed_entries.append(entry_path)
+                continue
+
+            cache_size += entry_size
+            if cache_size > self._cache_size_limit:
+                removed_entries.append(entry_path)
+
+        for entry_path in removed_entries:
+            try:
+                remove(entry_path)
+            except OSError:
+                continue
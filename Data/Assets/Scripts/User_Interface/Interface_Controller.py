@@ -1,7 +1,11 @@
+from pygame import mouse, MOUSEBUTTONUP, MOUSEBUTTONDOWN
+from pygame.event import Event
+
 from ..User_Interface.UI_Button_Factory import button_generator
 from ..Universal_computing.Pattern_Singleton import SingletonPattern
 from ..User_Interface.UI_Menu_Text import menus_text_generator, MenuText
 from ..User_Interface.UI_Buttons.UI_Base_Button import BaseButton
+from ..User_Interface.UI_Buttons_Grid import ButtonsGrid
 """
 Contents code for user interface controller.
 """
@@ -22,8 +26,8 @@ class InterfaceController(SingletonPattern):
 
         # In game user interface:
         # "True/False" and "False" as default.
-        self.gameplay_interface_hidden_status: bool = False
-        self.gameplay_interface_status: bool = False
+        self._gameplay_interface_hidden_status: bool = False
+        self._gameplay_interface_status: bool = False
         # GamePlay type:
         # "True/False" and "False" as default.
         self.gameplay_type_reading: bool = False
@@ -36,7 +40,60 @@ class InterfaceController(SingletonPattern):
         self.game_menu_status: bool = False
         # In game or start menu flag:
         # "True/False" and "True" as default.
-        self.start_menu_flag: bool = True
+        self._start_menu_flag: bool = True
+
+        # Buttons hit test:
+        # Grid of current buttons dict, built again when buttons dict or layout is changed:
+        self._buttons_grid: ButtonsGrid = ButtonsGrid()
+        # Button under cursor, cursor position is sampled once per frame:
+        self._hovered_button: BaseButton | None = None
+
+    @staticmethod
+    def _render_reset():
+        """
+        Report interface changes to Render for scene batches rebuild.
+        """
+        from ..Render.Render import Render
+        Render().set_reset_status()
+
+    @property
+    def gameplay_interface_hidden_status(self) -> bool:
+        """
+        Gameplay interface and speech are hidden.
+        """
+        return self._gameplay_interface_hidden_status
+
+    @gameplay_interface_hidden_status.setter
+    def gameplay_interface_hidden_status(self, status: bool):
+        if status != self._gameplay_interface_hidden_status:
+            self._render_reset()
+        self._gameplay_interface_hidden_status: bool = status
+
+    @property
+    def gameplay_interface_status(self) -> bool:
+        """
+        Gameplay interface is shown instead of menus.
+        """
+        return self._gameplay_interface_status
+
+    @gameplay_interface_status.setter
+    def gameplay_interface_status(self, status: bool):
+        if status != self._gameplay_interface_status:
+            self._render_reset()
+        self._gameplay_interface_status: bool = status
+
+    @property
+    def start_menu_flag(self) -> bool:
+        """
+        Game is in start menu, not in game menu.
+        """
+        return self._start_menu_flag
+
+    @start_menu_flag.setter
+    def start_menu_flag(self, status: bool):
+        if status != self._start_menu_flag:
+            self._render_reset()
+        self._start_menu_flag: bool = status
 
     def get_ui_buttons_dict(self) -> dict[str, BaseButton]:
         """
@@ -80,6 +137,17 @@ class InterfaceController(SingletonPattern):
                 button: BaseButton = ui_buttons_dict[key]
                 button.scale()
 
+        # Button under cursor:
+        buttons_grid: ButtonsGrid = self._get_buttons_grid(
+            buttons_dict=ui_buttons_dict,
+            check_layout=True
+        )
+        self._set_hovered_button(
+            buttons_grid.get_button(
+                buttons_grid.get_button_name(mouse.get_pos())
+            )
+        )
+
         # UI Text scale:
         text_dict: dict[str, MenuText] = self.get_menus_text_dict()
         if text_dict is not None:
@@ -87,6 +155,40 @@ class InterfaceController(SingletonPattern):
                 text: MenuText = text_dict[key]
                 text.scale()
 
+    def _get_buttons_grid(self, *, buttons_dict: dict[str, BaseButton] | None,
+                          check_layout: bool = False) -> ButtonsGrid:
+        """
+        Get hit test grid of buttons dict, grid is built again if buttons dict or layout was changed.
+        :param buttons_dict: Current buttons dict from get_ui_buttons_dict.
+        :type buttons_dict: dict[str, BaseButton] | None
+        :param check_layout: True for check of buttons coordinates and sizes.
+                             Layout is checked once per frame after buttons scale.
+        :type check_layout: bool
+        :return: ButtonsGrid
+        """
+        buttons_layout: tuple | None = None
+        if check_layout is True and buttons_dict is not None:
+            buttons_layout: tuple = ButtonsGrid.get_buttons_layout(buttons_dict)
+        if self._buttons_grid.get_status(buttons_dict, buttons_layout) is False:
+            self._buttons_grid: ButtonsGrid = ButtonsGrid(buttons_dict)
+        return self._buttons_grid
+
+    def _set_hovered_button(self, button: BaseButton | None):
+        """
+        Switch hover status of buttons.
+        Hovered button change is reported to Render, buttons sprites are collected on scene batches rebuild.
+        :param button: Button under cursor or None.
+        :type button: BaseButton | None
+        """
+        if button is self._hovered_button:
+            return
+        self._render_reset()
+        if self._hovered_button is not None:
+            self._hovered_button.set_hover_status(False)
+        if button is not None:
+            button.set_hover_status(True)
+        self._hovered_button: BaseButton | None = button
+
     def button_clicked_status(self, event) -> tuple[str | None, bool]:
         """
         Check left click of mouse to button status.
@@ -94,39 +196,30 @@ class InterfaceController(SingletonPattern):
         :return: tuple[str | None, True | False]
         """
         if self.gameplay_interface_hidden_status is False:
-            gameplay_ui_dict: dict = self.get_ui_buttons_dict()
-            for button in gameplay_ui_dict:
-                click_status: bool = gameplay_ui_dict[button].button_clicked_status(event)
-                if click_status is True:
-                    return button, True
+            if event.type == MOUSEBUTTONUP and event.button == 1:  # event.button return int of button type.
+                button_name: str | None = self._get_buttons_grid(
+                    buttons_dict=self.get_ui_buttons_dict()
+                ).get_button_name(event.pos)
+                if button_name is not None:
+                    return button_name, True
         return None, False
 
-    def button_push_status(self) -> tuple[str | None, bool]:
+    def button_push_status(self, event: Event) -> tuple[str | None, bool]:
         """
         Check left click of mouse to button status.
+        :param event: pygame.event from main_loop.
+        :type event: Event
         :return: tuple[str | None, True | False]
         """
         if self.gameplay_interface_hidden_status is False:
-            gameplay_ui_dict: dict[str, BaseButton] = self.get_ui_buttons_dict()
-            for button in gameplay_ui_dict:
-                click_status: bool = gameplay_ui_dict[button].button_click_hold()
-                if click_status is True:
-                    return button, True
+            if event.type == MOUSEBUTTONDOWN and event.button == 1:  # event.button return int of button type.
+                button_name: str | None = self._get_buttons_grid(
+                    buttons_dict=self.get_ui_buttons_dict()
+                ).get_button_name(event.pos)
+                if button_name is not None:
+                    return button_name, True
         return None, False
 
-    def button_cursor_position_status(self) -> bool:
-        """
-        Checking the cursor position above the button.
-        :return: True | False
-        """
-        gameplay_ui_dict: dict = self.get_ui_buttons_dict()
-        for button in gameplay_ui_dict:
-            cursor_position_status: bool = gameplay_ui_dict[button].button_cursor_position_status()
-            if cursor_position_status is True:
-                return True
-            else:
-                return False
-
     def generate_menus_batch(self):
         """
         Generate UI_batch for display image render.
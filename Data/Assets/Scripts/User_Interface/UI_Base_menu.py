@@ -16,7 +16,33 @@ class BaseMenu:
         self._state_machine: StateMachine = StateMachine()
         # User Interface controller settings:
         self._interface_controller: InterfaceController = InterfaceController()
-        self.status: bool = False
+        self._status: bool = False
+
+    @property
+    def status(self) -> bool:
+        """
+        Menu is shown.
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: bool):
+        """
+        Menu switch is reported to Render for scene batches rebuild.
+        :param status: True for shown menu.
+        :type status: bool
+        """
+        if status != self._status:
+            self._render_reset()
+        self._status: bool = status
+
+    @staticmethod
+    def _render_reset():
+        """
+        Report menu changes to Render for scene batches rebuild.
+        """
+        from ..Render.Render import Render
+        Render().set_reset_status()
 
     def _input_wait_ready(self):
         """
@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 
-from pygame import Surface, mouse, font, MOUSEBUTTONUP, draw, Rect, transform
-from pygame.event import Event
+from pygame import Surface, draw, Rect, transform
 
-from ...Universal_computing.Assets_load import AssetLoader
+from ...Universal_computing.Font_Pool import FontPool
 from ...Game_objects.Background import Background
 from ...Application_layer.Settings_Keeper import SettingsKeeper
 from ...Render.Sprite import Sprite
@@ -65,7 +64,7 @@ class BaseButton(ABC):
         :type text_offset_y: int | float | None
         """
         # Program layers settings:
-        self._assets_loader: AssetLoader = AssetLoader()
+        self._font_pool: FontPool = FontPool()
         self._settings_keeper: SettingsKeeper = SettingsKeeper()
 
         # Game scene objects settings:
@@ -73,7 +72,9 @@ class BaseButton(ABC):
 
         # Button settings:
         self._button_name: str = button_name
-        self.select: bool = False
+        self._select: bool = False
+        # Cursor above button, set by InterfaceController once per frame:
+        self._hover_status: bool = False
 
         # Button Sprite:
         self._button_sprite_data: dict[str | int] = button_image_data
@@ -112,16 +113,20 @@ class BaseButton(ABC):
             self._text_color: str = str(self._button_sprite_data['color'])
             if self._button_sprite_data['font'] is not None:
                 self._font_name: str = str(self._button_sprite_data['font'])
-                self._set_button_font: font.Font = self._assets_loader.font_load(
-                    font_name=self._font_name,
-                    font_size=self._font_size
-                )
             else:
                 self._font_name: None = None
-                self._set_button_font: font.Font = font.Font(
-                    font.get_default_font(),
-                    self._font_size
-                )
+
+        # Button states surfaces cache:
+        # (button state, button size, font size, select frame fatness, language flag, button text): Surface.
+        self._button_state_surfaces: dict[tuple[str, tuple[int, int], int, int, str, str | None], Surface] = {}
+        self._button_state_sprite: Sprite = Sprite(
+            layer=self._button_layer,
+            coordinates=self._button_coordinates,
+            texture_mame=self._button_name,
+            name=self._button_name,
+            sprite_sheet_data=self._button_sprite.get_sprite_sheet_data(),
+            sprite_size=self._button_size
+        )
 
     def _load_real_path_button_static_texture(self):
         """
@@ -146,34 +151,89 @@ class BaseButton(ABC):
             surface=surface
         )
 
+    @property
+    def select(self) -> bool:
+        """
+        Button is selected after pressed, as save slot.
+        """
+        return self._select
+
+    @select.setter
+    def select(self, status: bool):
+        """
+        Select switch is reported to Render for scene batches rebuild.
+        :param status: True for selected button.
+        :type status: bool
+        """
+        if status != self._select:
+            from ...Render.Render import Render
+            Render().set_reset_status()
+        self._select: bool = status
+
     def get_coordinates(self) -> tuple[int, int]:
         """
         Get Button coordinates.
         """
         return self._button_coordinates
 
+    def get_size(self) -> tuple[int, int]:
+        """
+        Used in ButtonsGrid.
+        """
+        return self._button_size
+
     def get_sprite(self) -> Sprite:
         """
         Use in InterfaceController.
         """
-        TexturesMaster().devnull_temporary_texture(
-            texture_type="User_Interface",
-            texture_name=self._button_name,
-            animation_name="statick_frames",
-            frame=self._button_sprite.get_current_animation_frame(),
-        )
+        button_state: str = self._get_button_state()
 
         # Standard UI button:
-        if all(
-                (
-                        self._button_text is None,
-                        self.select is False,
-                        self.button_cursor_position_status() is False
-                )
-        ):
+        if self._button_text is None and button_state == "normal":
+            TexturesMaster().devnull_temporary_texture(
+                texture_type="User_Interface",
+                texture_name=self._button_name,
+                animation_name="statick_frames",
+                frame=self._button_sprite.get_current_animation_frame(),
+            )
             return self._button_sprite
 
-        # Surface for specific buttons:
+        # Surface for specific buttons, recomposed only if its state, size or text was changed:
+        if self._button_text_localization_dict is not None:
+            self._localization_button_text()
+        button_state_key: tuple[str, tuple[int, int], int, int, str, str | None] = (
+            button_state,
+            self._button_size,
+            self._get_font_size(),
+            self._get_select_frame_fatness(),
+            self._language_flag,
+            self._button_text
+        )
+        button_surface: Surface | None = self._button_state_surfaces.get(button_state_key)
+        if button_surface is None:
+            button_surface: Surface = self._render_button_state_surface(button_state)
+            self._button_state_surfaces[button_state_key]: Surface = button_surface
+
+        self._cache_temporary_image(button_surface)
+        return self._button_state_sprite
+
+    def _get_button_state(self) -> str:
+        """
+        Get button render state.
+        :return: normal|hover|selected|selected_hover
+        """
+        cursor_position_status: bool = self.button_cursor_position_status()
+        if self.select is True:
+            return "selected_hover" if cursor_position_status is True else "selected"
+        return "hover" if cursor_position_status is True else "normal"
+
+    def _render_button_state_surface(self, button_state: str) -> Surface:
+        """
+        Compose button texture, text, cursor hover mask and select frame.
+        :param button_state: normal|hover|selected|selected_hover
+        :type button_state: str
+        :return: Button Surface.
+        """
         button_surface: Surface = transform.scale(
             TexturesMaster().get_texture(
                 texture_type="User_Interface",
@@ -189,7 +249,7 @@ class BaseButton(ABC):
             button_surface: Surface = self._button_text_render(button_surface)
 
         # Button ready to be pressed:
-        if self.button_cursor_position_status() is True:
+        if button_state in ("hover", "selected_hover"):
             # Mask settings:
             screen_mask: Surface = Surface(self._button_size)
             screen_mask.fill(self._button_selected_color)
@@ -201,16 +261,7 @@ class BaseButton(ABC):
             )
 
         # Button selected after pressed:
-        if self.select is True:
-            select_frame_fatness: int = max(
-                int(
-                    min(
-                        self._settings_keeper.get_window().get_width(),
-                        self._settings_keeper.get_window().get_height()
-                    ) / 500
-                ) * 4,
-                1
-            )
+        if button_state in ("selected", "selected_hover"):
             draw.rect(
                 surface=button_surface,
                 color=self._select_frame_color,
@@ -219,34 +270,55 @@ class BaseButton(ABC):
                     self._button_size[0],
                     self._button_size[1]
                 ),
-                width=select_frame_fatness
+                width=self._get_select_frame_fatness()
             )
+        return button_surface
 
-        self._cache_temporary_image(button_surface)
-        return Sprite(
-            layer=self._button_layer,
-            coordinates=self._button_coordinates,
-            texture_mame=self._button_name,
-            name=self._button_name,
-            sprite_sheet_data=self._button_sprite.get_sprite_sheet_data(),
-            sprite_size=self._button_size
+    def _get_select_frame_fatness(self) -> int:
+        """
+        Calculate select frame width by window size.
+        """
+        return max(
+            int(
+                min(
+                    self._settings_keeper.get_window().get_width(),
+                    self._settings_keeper.get_window().get_height()
+                ) / 500
+            ) * 4,
+            1
         )
 
+    def _get_font_size(self) -> int:
+        """
+        Calculate button text font size by background size.
+        """
+        return self._background.get_size()[1] // 50
+
     def scale(self):
         """
         Scale button surface, with background context.
         """
         # Button size scale:
-        self._button_size: tuple[int, int] = self._get_button_size()
+        button_size: tuple[int, int] = self._get_button_size()
+        # Button states surfaces of previous size will not be used again:
+        if button_size != self._button_size:
+            self._button_state_surfaces.clear()
+        self._button_size: tuple[int, int] = button_size
         self._button_sprite.scale(
             self._button_size
         )
+        self._button_state_sprite.scale(
+            self._button_size
+        )
 
         # Scale coordinates:
         self._calculate_coordinates()
         self._button_sprite.set_coordinates(
             self._button_coordinates
         )
+        self._button_state_sprite.set_coordinates(
+            self._button_coordinates
+        )
 
     def _button_middle_point_coordinates(self) -> tuple[int, int]:
         """
@@ -282,21 +354,12 @@ class BaseButton(ABC):
         if self._button_text_localization_dict is not None:
             self._localization_button_text()
 
-        self._font_size: int = self._background.get_size()[1] // 50
-
-        # Font reload for size scale:
-        if self._font_name is None:
-            self._set_button_font: font.Font = font.Font(
-                font.get_default_font(),
-                self._font_size
-            )
-        else:
-            self._set_button_font: font.Font = self._assets_loader.font_load(
-                font_name=self._font_name,
-                font_size=self._font_size
-            )
-        text_surface: Surface = self._set_button_font.render(
-            self._button_text, True, self._text_color
+        self._font_size: int = self._get_font_size()
+        text_surface: Surface = self._font_pool.render_text(
+            text=self._button_text,
+            font_name=self._font_name,
+            font_size=self._font_size,
+            color=self._text_color
         )
 
         # Button text coordinates:
@@ -349,14 +412,14 @@ class BaseButton(ABC):
             )
         return result
 
-    def button_cursor_position_status(self) -> bool:
+    def get_cursor_position_status(self, cursor_position: tuple[int, int]) -> bool:
         """
         Checking the cursor position above the button.
-        Use in InterfaceController and another button calculation.
+        Use in ButtonsGrid.
+        :param cursor_position: Cursor x and y coordinates.
+        :type cursor_position: tuple[int, int]
         :return: True | False
         """
-        # Mouse processing:
-        cursor_position: tuple[int, int] = mouse.get_pos()
         # Button processing:
         button_x_size, button_y_size = self._button_size
         button_coordinates_x, button_coordinates_y = self._button_coordinates
@@ -371,28 +434,22 @@ class BaseButton(ABC):
         else:
             return False
 
-    def button_click_hold(self) -> bool:
+    def set_hover_status(self, hover_status: bool):
         """
-        Check left click of mouse to button status.
-        Use in InterfaceController.
-        :return: True | False
+        Used in InterfaceController.
+        :param hover_status: True if cursor is above the button.
+        :type hover_status: bool
         """
-        if self.button_cursor_position_status() is True:
-            button_clicked: tuple[bool, bool, bool] = mouse.get_pressed()
-            if button_clicked[0] is True:
-                return True
+        self._hover_status: bool = hover_status
 
-    def button_clicked_status(self, event: Event) -> bool:
+    def button_cursor_position_status(self) -> bool:
         """
-        Check left push out mouse left button status.
-        Use in InterfaceController.
-        :param event: pygame.event element.
-        :type event: Event
+        Checking the cursor position above the button.
+        Cursor position is sampled once per frame by InterfaceController.
+        Use in another button calculation.
         :return: True | False
         """
-        if self.button_cursor_position_status() is True:
-            if event.type == MOUSEBUTTONUP and event.button == 1:  # event.button return int of button type.
-                return True
+        return self._hover_status
 
     @abstractmethod
     def _calculate_coordinates(self):
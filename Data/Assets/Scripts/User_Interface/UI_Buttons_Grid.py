@@ -0,0 +1,93 @@
+from ..User_Interface.UI_Buttons.UI_Base_Button import BaseButton
+"""
+Contents code for buttons hit test grid.
+"""
+
+
+class ButtonsGrid:
+    """
+    Uniform grid of display cells with buttons which cross them.
+    Button under cursor is searched only among buttons of one cell.
+    Grid is built for one buttons dict and layout in InterfaceController.
+    """
+    # Cell width and height in pixels:
+    _cell_size: int = 64
+
+    def __init__(self, buttons_dict: dict[str, BaseButton] | None = None):
+        """
+        :param buttons_dict: Dict with buttons names as keys and buttons as values.
+                             None for empty grid.
+        :type buttons_dict: dict[str, BaseButton] | None
+        """
+        self._buttons_dict: dict[str, BaseButton] | None = buttons_dict
+        self._layout: tuple[tuple[str, tuple[int, int], tuple[int, int]], ...] = ()
+        # (cell x, cell y): list with buttons names in buttons dict order.
+        self._cells: dict[tuple[int, int], list[str]] = {}
+        if buttons_dict is not None:
+            self._layout: tuple[tuple[str, tuple[int, int], tuple[int, int]], ...] = \
+                self.get_buttons_layout(buttons_dict)
+            self._set_cells()
+
+    @staticmethod
+    def get_buttons_layout(
+            buttons_dict: dict[str, BaseButton]
+    ) -> tuple[tuple[str, tuple[int, int], tuple[int, int]], ...]:
+        """
+        Get coordinates and sizes of buttons.
+        Used in InterfaceController to find layout changes.
+        :param buttons_dict: Dict with buttons names as keys and buttons as values.
+        :type buttons_dict: dict[str, BaseButton]
+        :return: Tuple with tuples of button name, coordinates and size.
+        """
+        return tuple(
+            (button_name, button.get_coordinates(), button.get_size())
+            for button_name, button in buttons_dict.items()
+        )
+
+    def _set_cells(self):
+        """
+        Add every button in all cells crossed by button area.
+        """
+        cell_size: int = self._cell_size
+        # Some buttons have float coordinates:
+        for button_name, (button_x, button_y), (button_width, button_height) in self._layout:
+            for cell_x in range(int(button_x // cell_size), int((button_x + button_width) // cell_size) + 1):
+                for cell_y in range(int(button_y // cell_size), int((button_y + button_height) // cell_size) + 1):
+                    self._cells.setdefault((cell_x, cell_y), []).append(button_name)
+
+    def get_status(self, buttons_dict: dict[str, BaseButton] | None, layout: tuple | None = None) -> bool:
+        """
+        Check that grid was built for buttons dict and layout.
+        :param buttons_dict: Dict with buttons names as keys and buttons as values.
+        :type buttons_dict: dict[str, BaseButton] | None
+        :param layout: Layout from get_buttons_layout, None if layout is not checked.
+        :type layout: tuple | None
+        :return: True if grid is actual.
+        """
+        if buttons_dict is not self._buttons_dict:
+            return False
+        if layout is not None and layout != self._layout:
+            return False
+        return True
+
+    def get_button_name(self, cursor_position: tuple[int, int]) -> str | None:
+        """
+        Find button under cursor.
+        If buttons are overlapped, the first one in buttons dict is found.
+        :param cursor_position: Cursor x and y coordinates.
+        :type cursor_position: tuple[int, int]
+        :return: Button name or None.
+        """
+        cursor_x, cursor_y = cursor_position
+        for button_name in self._cells.get((cursor_x // self._cell_size, cursor_y // self._cell_size), ()):
+            if self._buttons_dict[button_name].get_cursor_position_status(cursor_position) is True:
+                return button_name
+        return None
+
+    def get_button(self, button_name: str | None) -> BaseButton | None:
+        """
+        :return: Button from buttons dict of grid or None.
+        """
+        if button_name is None:
+            return None
+        return self._buttons_dict[button_name]
@@ -1,6 +1,7 @@
-from pygame import Surface, font, SRCALPHA, transform
+from pygame import Surface, SRCALPHA, transform
 
 from ..Universal_computing.Assets_load import AssetLoader
+from ..Universal_computing.Font_Pool import FontPool
 from ..Application_layer.Settings_Keeper import SettingsKeeper
 from ..Game_objects.Background import Background
 from ..Render.Texture_Master import TexturesMaster
@@ -60,7 +61,7 @@ class MenuText:
         :type menu_text_factor: int | float
         """
         # Program layers settings:
-        self._asset_loader: AssetLoader = AssetLoader()
+        self._font_pool: FontPool = FontPool()
         self._background: Background = Background()
         self._settings_keeper: SettingsKeeper = SettingsKeeper()
         self._texture_master: TexturesMaster = TexturesMaster()
@@ -77,23 +78,30 @@ class MenuText:
         self._menu_text_scale_factor: int = menu_text_factor
         self._menu_text_substrate: str | None = menu_text_substrate
 
-        if menu_text_font is not None:
-            self._font_name: str = menu_text_font
-            self._set_text_font: font.Font = self._asset_loader.font_load(
-                font_name=self._font_name,
-                font_size=self._font_size
-            )
-        else:
-            self._font_name: None = None
-            self._set_text_font: font.Font = font.Font(
-                font.get_default_font(),
-                self._font_size
-            )
+        self._font_name: str | None = menu_text_font
 
         # Other attributes:
         self._menu_text_coordinates: tuple[int, int] = (0, 0)
         self._menu_text_surface_size: tuple[int, int] = (0, 0)
 
+        # Rendered menu text, recomposed only if text, font size or surface size was changed:
+        self._menu_text_surface: Surface | None = None
+        self._menu_text_surface_key: tuple[str, int, tuple[int, int]] | None = None
+        self._menu_text_sprite: Sprite = Sprite(
+            name="Menu_Text",
+            texture_mame="Menu_Text",
+            layer=6,
+            coordinates=self._menu_text_coordinates,
+            sprite_size=self._menu_text_surface_size,
+            sprite_sheet_data={
+                "texture_type": "User_Interface",
+                "sprite_sheet": False,
+                "statick_frames": {
+                    "Menu_Text": {}
+                }
+            }
+        )
+
     def _set_text_surface_size(self):
         """
         Set text Surface size.
@@ -160,34 +168,18 @@ class MenuText:
         Used in InterfaceController.
         :return: Sprite
         """
-        universal_parameters: dict = {
-            "texture_type": "User_Interface",
-            "texture_name": "Menu_Text",
-            "animation_name": "statick_frames",
-            "frame": "Menu_Text"
-        }
-        self._texture_master.devnull_temporary_texture(
-            **universal_parameters
-        )
+        # The same text Surface is not set again:
         self._texture_master.set_temporary_texture(
-            **universal_parameters,
+            texture_type="User_Interface",
+            texture_name="Menu_Text",
+            animation_name="statick_frames",
+            frame="Menu_Text",
             surface=self._text_render()
         )
 
-        return Sprite(
-            name="Menu_Text",
-            texture_mame="Menu_Text",
-            layer=6,
-            coordinates=self._menu_text_coordinates,
-            sprite_size=self._menu_text_surface_size,
-            sprite_sheet_data={
-                "texture_type": "User_Interface",
-                "sprite_sheet": False,
-                "statick_frames": {
-                    "Menu_Text": {}
-                }
-            }
-        )
+        self._menu_text_sprite.set_coordinates(self._menu_text_coordinates)
+        self._menu_text_sprite.scale(self._menu_text_surface_size)
+        return self._menu_text_sprite
 
     def _localization_menu_text(self):
         """
@@ -208,17 +200,13 @@ class MenuText:
             * self._menu_text_scale_factor
         )
 
-        # Font reload for size scale:
-        if self._font_name is not None:
-            self._set_text_font: font.Font = self._asset_loader.font_load(
-                font_name=self._font_name,
-                font_size=self._font_size
-            )
-        else:
-            self._set_text_font: font.Font = font.Font(
-                font.get_default_font(),
-                self._font_size
-            )
+        menu_text_surface_key: tuple[str, int, tuple[int, int]] = (
+            self._menu_text,
+            self._font_size,
+            self._menu_text_surface_size
+        )
+        if menu_text_surface_key == self._menu_text_surface_key:
+            return self._menu_text_surface
 
         # Generate text:
         menu_text_surface: Surface = Surface(
@@ -229,8 +217,11 @@ class MenuText:
         rows_list: list = []
 
         for index, row in enumerate(self._menu_text.split('\n')):
-            text_surface: Surface = self._set_text_font.render(
-                row, True, self._text_color
+            text_surface: Surface = self._font_pool.render_text(
+                text=row,
+                font_name=self._font_name,
+                font_size=self._font_size,
+                color=self._text_color
             )
             # Menu surface text coordinates:
             text_coordinates: tuple[int, int] = (
@@ -289,6 +280,8 @@ class MenuText:
                     text_coordinates
                 )
 
+        self._menu_text_surface: Surface = menu_text_surface
+        self._menu_text_surface_key: tuple[str, int, tuple[int, int]] = menu_text_surface_key
         return menu_text_surface
 
 
@@ -64,6 +64,7 @@ class LoadMenu(BaseMenu, SingletonPattern):
 
         menu_data: dict = self._interface_controller.menus_collection[self.menu_name]
         menu_data[self.text_file_flag]: str = self.page_flag
+        self._render_reset()
 
     def start_game(self, scene_name: str):
         """
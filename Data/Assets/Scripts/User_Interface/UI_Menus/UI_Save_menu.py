@@ -67,6 +67,7 @@ class SaveMenu(BaseMenu, SingletonPattern):
 
         menu_data: dict = self._interface_controller.menus_collection[self.menu_name]
         menu_data[self.text_file_flag]: str = self.page_flag
+        self._render_reset()
 
     def save_slots_ui_reread(self):
         """
@@ -0,0 +1,18 @@
+# Run Render benchmark with shell PowerShell.
+# Can get string argument with path to JSON result file.
+# If have no arguments print result to standard output.
+
+# Catching the path argument:
+param (
+    [string]$output_path
+)
+
+# Create task:
+if ($output_path) {
+    $benchmark_task = "python3 -B $PSScriptRoot\Render_Benchmark.py -o $output_path"
+} else {
+    $benchmark_task = "python3 -B $PSScriptRoot\Render_Benchmark.py"
+}
+
+# Execute:
+Invoke-Expression $benchmark_task
@@ -0,0 +1,14 @@
+#!/bin/bash
+# Run Render benchmark with shell Bash.
+# Can get string argument with path to JSON result file.
+# If have no arguments print result to standard output.
+
+# Catching the path argument:
+output_path="$1"
+
+# Execute task:
+if [ -n "$output_path" ]; then
+    python3 -B "./Render_Benchmark.py" -o "$output_path"
+else
+    python3 -B "./Render_Benchmark.py"
+fi
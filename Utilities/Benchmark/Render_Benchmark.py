@@ -0,0 +1,442 @@
+from os import path, environ, makedirs
+import sys
+import json
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser, Namespace
+"""
+The utility for headless render benchmark of the game.
+"""
+
+
+class RenderBenchmark:
+    """
+    Drive game main loop frames without display and collect frames timings.
+    Covers reading and choice scenes, game menu overlay and save/load menus.
+    """
+    def __init__(
+            self, *,
+            frames: int,
+            warmup_frames: int,
+            window_sizes: list[tuple[int, int]],
+            synthetic_scenes: int = 0,
+            save_slots: int = 11,
+            texture_memory: bool = False
+    ):
+        """
+        :param frames: Number of measured frames per benchmark case.
+        :type frames: int
+        :param warmup_frames: Number of not measured frames before every benchmark case.
+        :type warmup_frames: int
+        :param window_sizes: Window sizes for benchmark.
+        :type window_sizes: list[tuple[int, int]]
+        :param synthetic_scenes: Number of generated scenes instead of screenplay.json scenes.
+                                 0 for use screenplay.json.
+        :type synthetic_scenes: int
+        :param save_slots: Number of generated save slots for save/load menus.
+        :type save_slots: int
+        :param texture_memory: Add TexturesMaster memory to every case and full memory report to result.
+        :type texture_memory: bool
+        """
+        # Path Settings:
+        self.__replace_path: str = path.join(
+            *[
+                'Utilities', 'Benchmark', 'Render_Benchmark.py'
+            ]
+        )
+        self.__root_path: str = f"{path.abspath(__file__).replace(self.__replace_path, '')}"
+        self.__game_path: str = path.join(
+            *[
+                self.__root_path, "Data"
+            ]
+        )
+
+        # Benchmark settings:
+        self._frames: int = frames
+        self._warmup_frames: int = warmup_frames
+        self._window_sizes: list[tuple[int, int]] = window_sizes
+        self._synthetic_scenes: int = synthetic_scenes
+        self._save_slots: int = save_slots
+        self._texture_memory: bool = texture_memory
+        self._synthetic_scene_prefix: str = "benchmark_scene_"
+        self._results: list[dict] = []
+
+    def _game_import(self):
+        """
+        Set headless SDL drivers and import game.
+        """
+        environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        if self.__game_path not in sys.path:
+            sys.path.insert(0, self.__game_path)
+
+        from pygame import display
+        display.init()
+
+        from Assets.Scripts.Application_layer.Game_Master import GameMaster
+        self._game_master: GameMaster = GameMaster()
+
+    def _get_scenes(self) -> dict[str, list[str]]:
+        """
+        Get scenes names for benchmark.
+        :return: Dict with "reading" and "choice" keys and lists with scenes names.
+        """
+        from Assets.Scripts.GamePlay.Scene_Validator import SceneValidator
+        screenplay: dict = SceneValidator().get_screenplay_data()
+        if self._synthetic_scenes > 0:
+            screenplay: dict = {
+                scene_name: scene_data
+                for scene_name, scene_data in screenplay.items()
+                if scene_name.startswith(self._synthetic_scene_prefix)
+            }
+        result: dict[str, list[str]] = {
+            "reading": [],
+            "choice": []
+        }
+        for scene_name, scene_data in screenplay.items():
+            result[scene_data["gameplay_type"]].append(scene_name)
+        return result
+
+    def _generate_synthetic_screenplay(self):
+        """
+        Generate scenes chain with all characters and backgrounds from textures configs.
+        Every fourth scene is choice scene.
+        Scenes are added to SceneValidator screenplay and DialogueKeeper dialogues.
+        """
+        from Assets.Scripts.GamePlay.Scene_Validator import SceneValidator
+        from Assets.Scripts.Game_objects.Dialogues import DialogueKeeper
+        from Assets.Scripts.Universal_computing.Assets_load import AssetLoader
+
+        asset_loader: AssetLoader = AssetLoader()
+        characters_data: dict = asset_loader.json_load(
+            path_list=['Scripts', 'Json_data', 'characters_sprites']
+        )
+        backgrounds_data: dict = asset_loader.json_load(
+            path_list=['Scripts', 'Json_data', 'backgrounds_sprites']
+        )
+        characters_names: list[str] = list(characters_data)
+        backgrounds_names: list[str] = list(backgrounds_data)
+        positions: tuple[str, ...] = ("left", "middle", "right")
+        plans: tuple[str, ...] = ("first_plan", "background_plan")
+        speech_text: str = " ".join(["Lorem ipsum dolor sit amet, consectetur adipiscing elit."] * 3)
+
+        screenplay: dict = SceneValidator().get_screenplay_data()
+        dialogues: dict = DialogueKeeper().get_dialogues_data()
+        scenes_names: list[str] = [
+            f"{self._synthetic_scene_prefix}{index:03}"
+            for index in range(self._synthetic_scenes)
+        ]
+        for index, scene_name in enumerate(scenes_names):
+            next_scene: str = scenes_names[(index + 1) % len(scenes_names)]
+            scene_data: dict = {
+                "gameplay_type": "choice" if index % 4 == 3 else "reading",
+                "background": {
+                    "background_sprite_sheet": backgrounds_names[index % len(backgrounds_names)],
+                    "background_animation": "default"
+                },
+                "past_scene": scenes_names[index - 1] if index > 0 else "START",
+                "actors": {},
+                "special_effects": False,
+                "sounds": {
+                    "music_channel": False,
+                    "sound_channel": False,
+                    "voice_channel": False
+                }
+            }
+
+            # Actors:
+            for position_index, position in enumerate(positions):
+                character_name: str = characters_names[(index + position_index) % len(characters_names)]
+                if character_name in scene_data["actors"]:
+                    continue
+                animations: list[str] = list(characters_data[character_name]["animations"])
+                scene_data["actors"][character_name]: dict[str, str] = {
+                    "character_animation": animations[index % len(animations)],
+                    "character_plan": plans[position_index % len(plans)],
+                    "character_start_position": position
+                }
+
+            # Gameplay data:
+            if scene_data["gameplay_type"] == "reading":
+                scene_data.update(
+                    {
+                        "next_scene": next_scene,
+                        "speaker_name_color": "#00ffff",
+                        "speech_text_color": "#ffffff"
+                    }
+                )
+                for language in dialogues["reading"]:
+                    dialogues["reading"][language][scene_name]: dict = {
+                        "who": {
+                            "text": characters_names[index % len(characters_names)],
+                            "color": scene_data["speaker_name_color"]
+                        },
+                        "what": {
+                            "text": speech_text,
+                            "color": scene_data["speech_text_color"]
+                        }
+                    }
+            else:
+                scene_data["choices"]: dict = {
+                    f"choice_{choice_index:02}": {
+                        "branching": next_scene,
+                        "text_color": "#ffffff"
+                    }
+                    for choice_index in range(1, 4)
+                }
+                for language in dialogues["choice"]:
+                    dialogues["choice"][language][scene_name]: dict = {
+                        choice_name: f"Go to {next_scene}"
+                        for choice_name in scene_data["choices"]
+                    }
+
+            screenplay[scene_name]: dict = scene_data
+
+    def _generate_save_slots(self, save_folder_path: str, scene_name: str):
+        """
+        Create save slots with screen previews in benchmark saves folder.
+        :param save_folder_path: Absolute path to benchmark saves folder.
+        :type save_folder_path: str
+        :param scene_name: Scene name for saves data.
+        :type scene_name: str
+        """
+        from pygame import image, transform
+        from Assets.Scripts.Application_layer.Settings_Keeper import SettingsKeeper
+
+        screen = SettingsKeeper().get_window()
+        screen_preview = transform.scale(
+            surface=screen,
+            size=(720, int(screen.get_height() * (720 / screen.get_width())))
+        )
+        for index in range(self._save_slots):
+            save_name: str = f"save__2000-01-01_00-00-{index:02}"
+            save_path: str = path.join(
+                *[save_folder_path, save_name]
+            )
+            makedirs(save_path, exist_ok=True)
+            with open(path.join(*[save_path, f"{save_name}.save"]), 'w', encoding='utf-8') as save_file:
+                save_file.write(
+                    json.dumps(
+                        {
+                            "scene": scene_name,
+                            "date": f"2000-01-01_00:00:{index:02}"
+                        },
+                        indent=4
+                    )
+                )
+            image.save(
+                screen_preview,
+                path.join(*[save_path, "screen_preview.png"])
+            )
+
+    def _run_frames(self, *, case_name: str, window_size: tuple[int, int]):
+        """
+        Run warmup and measured frames and collect case result.
+        :param case_name: Benchmark case name.
+        :type case_name: str
+        :param window_size: Current window size.
+        :type window_size: tuple[int, int]
+        """
+        from Assets.Scripts.Application_layer.Frame_Profiler import FrameProfiler
+        from Assets.Scripts.Render.Render import Render
+
+        frame_profiler: FrameProfiler = FrameProfiler()
+        # Benchmark case is new input for render, as in InputCommandsReactions:
+        Render().set_reset_status()
+        for _ in range(self._warmup_frames):
+            self._game_master.frame()
+
+        frame_profiler.reset()
+        start_time: float = perf_counter()
+        for _ in range(self._frames):
+            self._game_master.frame()
+        total_time: float = perf_counter() - start_time
+
+        stages_percentiles: dict[str, dict[str, float]] = frame_profiler.get_percentiles()
+        case_result: dict = {
+            "window_size": f"{window_size[0]}x{window_size[1]}",
+            "case": case_name,
+            "frames": self._frames,
+            "frames_per_second": round(self._frames / total_time, 1) if total_time > 0 else None,
+            "frame_time_ms": stages_percentiles.pop("frame"),
+            "stages_ms": stages_percentiles
+        }
+        if self._texture_memory is True:
+            from Assets.Scripts.Render.Texture_Master import TexturesMaster
+
+            case_result["texture_memory_bytes"]: dict[str, int] = {
+                catalog_name: catalog_report["bytes"]
+                for catalog_name, catalog_report in TexturesMaster().get_memory_report()["catalogs"].items()
+            }
+        self._results.append(case_result)
+
+    def _run_window_size(self, window_size: tuple[int, int], save_folder_path: str):
+        """
+        Run all benchmark cases in one window size.
+        :param window_size: Window size.
+        :type window_size: tuple[int, int]
+        :param save_folder_path: Absolute path to benchmark saves folder.
+        :type save_folder_path: str
+        """
+        from pygame import display, RESIZABLE
+        from Assets.Scripts.Application_layer.State_Machine import StateMachine
+        from Assets.Scripts.Application_layer.Save_Keeper import SaveKeeper
+        from Assets.Scripts.GamePlay.Scene_Validator import SceneValidator
+        from Assets.Scripts.User_Interface.Interface_Controller import InterfaceController
+        from Assets.Scripts.User_Interface.UI_Menus.UI_Start_menu import StartMenu
+        from Assets.Scripts.User_Interface.UI_Menus.UI_Game_menu import GameMenu
+        from Assets.Scripts.User_Interface.UI_Menus.UI_Save_menu import SaveMenu
+        from Assets.Scripts.User_Interface.UI_Menus.UI_Load_menu import LoadMenu
+
+        # Without "SettingsKeeper.update_settings" for keep "user_settings" file untouched:
+        display.set_mode(window_size, RESIZABLE)
+
+        scene_validator: SceneValidator = SceneValidator()
+        interface_controller: InterfaceController = InterfaceController()
+        state_machine: StateMachine = StateMachine()
+        save_keeper: SaveKeeper = SaveKeeper()
+        scenes: dict[str, list[str]] = self._get_scenes()
+        first_scene: str = (scenes["reading"] + scenes["choice"])[0]
+
+        # Start menu:
+        if StartMenu().status is True:
+            self._run_frames(case_name="start_menu", window_size=window_size)
+            StartMenu().start_game(first_scene)
+
+        # Gameplay scenes:
+        for gameplay_type in ("reading", "choice"):
+            for scene_name in scenes[gameplay_type]:
+                scene_validator.switch_scene(scene_name)
+                self._run_frames(case_name=f"{gameplay_type}:{scene_name}", window_size=window_size)
+
+        # Game menu overlay:
+        scene_validator.switch_scene(first_scene)
+        self._game_master.frame()
+        interface_controller.gameplay_interface_status = False
+        GameMenu().status = True
+        state_machine.next_state()
+        scene_validator.set_scene_update_status(True)
+        self._run_frames(case_name="game_menu", window_size=window_size)
+
+        # Save and load menus:
+        self._generate_save_slots(save_folder_path, first_scene)
+        save_keeper.reread()
+        GameMenu().status = False
+        for menu_name, menu in (("save_menu", SaveMenu()), ("load_menu", LoadMenu())):
+            menu.status = True
+            save_keeper.generate_save_slots_buttons()
+            menu.vanish_menu_data()
+            self._run_frames(case_name=menu_name, window_size=window_size)
+            menu.status = False
+
+        # Back to gameplay:
+        interface_controller.gameplay_interface_status = True
+        state_machine.next_state()
+
+    def execute(self) -> dict:
+        """
+        Execute class destination.
+        :return: Dict with benchmark settings and results.
+        """
+        self._game_import()
+        from Assets.Scripts.Application_layer.Settings_Keeper import SettingsKeeper
+        from Assets.Scripts.Application_layer.Save_Keeper import SaveKeeper
+        from Assets.Scripts.Universal_computing.Texture_Disk_Cache import TextureDiskCache
+
+        # Textures are scaled in every run, "Cache" folder is not written:
+        TextureDiskCache().set_status(False)
+
+        if self._synthetic_scenes > 0:
+            self._generate_synthetic_screenplay()
+
+        # Autosaves and save slots are written to temporary folder:
+        with TemporaryDirectory() as save_folder_path:
+            SaveKeeper().set_save_folder_path(save_folder_path)
+            for window_size in self._window_sizes:
+                self._run_window_size(window_size, save_folder_path)
+
+        result: dict = {
+            "render_mode": SettingsKeeper().get_render_mode(),
+            "frames_per_case": self._frames,
+            "warmup_frames": self._warmup_frames,
+            "screenplay": "synthetic" if self._synthetic_scenes > 0 else "screenplay.json",
+            "results": self._results
+        }
+        if self._texture_memory is True:
+            from Assets.Scripts.Render.Texture_Master import TexturesMaster
+
+            result["texture_memory"]: dict = TexturesMaster().get_memory_report()
+        return result
+
+
+if __name__ == "__main__":
+    """
+    Get benchmark settings from scrypt run arguments and run benchmark.
+    """
+    # Parse args:
+    arguments_parser: ArgumentParser = ArgumentParser()
+    arguments_parser.add_argument(
+        "-f",
+        "--frames",
+        default=300,
+        type=int,
+        help="Number of measured frames per benchmark case. Example: python ./*.py -f 300"
+    )
+    arguments_parser.add_argument(
+        "-w",
+        "--warmup",
+        default=30,
+        type=int,
+        help="Number of not measured frames before every benchmark case. Example: python ./*.py -w 30"
+    )
+    arguments_parser.add_argument(
+        "-s",
+        "--sizes",
+        default=["1280x720", "1920x1080"],
+        nargs="+",
+        type=str,
+        help="Window sizes. Example: python ./*.py -s 1280x720 1920x1080"
+    )
+    arguments_parser.add_argument(
+        "-ss",
+        "--synthetic",
+        default=0,
+        type=int,
+        help="Number of generated scenes instead of screenplay.json scenes. Example: python ./*.py -ss 16"
+    )
+    arguments_parser.add_argument(
+        "-tm",
+        "--texture-memory",
+        action="store_true",
+        help="Add textures memory by catalogs, texture types and texture names to result. "
+             "Example: python ./*.py -tm"
+    )
+    arguments_parser.add_argument(
+        "-o",
+        "--output",
+        type=str or None,
+        default=None,
+        help="Path for JSON result file. Standard output if not set. Example: python ./*.py -o ./result.json"
+    )
+    arguments: Namespace = arguments_parser.parse_args()
+
+    # Execute:
+    benchmark_result: str = json.dumps(
+        RenderBenchmark(
+            frames=arguments.frames,
+            warmup_frames=arguments.warmup,
+            window_sizes=[
+                tuple(int(size) for size in window_size.split('x'))
+                for window_size in arguments.sizes
+            ],
+            synthetic_scenes=arguments.synthetic,
+            texture_memory=arguments.texture_memory
+        ).execute(),
+        indent=4
+    )
+    if arguments.output is not None:
+        with open(arguments.output, 'w', encoding='utf-8') as result_file:
+            result_file.write(benchmark_result)
+    else:
+        print(benchmark_result)